@@ -17,6 +17,7 @@ load_dotenv()
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from src.main import run_veritas
+from src import events
 import config
 
 # ----- AUTHENTICATION CONFIGURATION -----
@@ -314,38 +315,24 @@ def main():
                 status_text.text("📥 Scraping reviews from Amazon...")
                 progress_bar.progress(20)
 
-                # Run analysis with explicit logging
-                st.write("DEBUG: About to call run_veritas...")
-                st.write(f"DEBUG: URL = {url}")
+                # Record this session's pipeline events (local: Streamlit runs every session as a
+                # thread of one process) and follow its stages in the status line
+                recorder = events.EventRecorder()
+                stage_progress = {"scrape": 20, "analyze": 50, "score": 80, "save": 90}
 
-                # Import and test scraper directly with output capture
-                from src.scraper import scrape_reviews
-                import io
-                import sys
+                def show_stage(record):
+                    if record["event"] == "veritas.stage":
+                        status_text.text(record["message"].splitlines()[0])
+                        progress_bar.progress(stage_progress.get(record["stage"], 50))
 
-                st.write("DEBUG: Testing scraper directly...")
+                with events.subscribed(recorder, local=True), events.subscribed(show_stage, local=True):
+                    report = run_veritas(url, verbose=False)
 
-                # Capture print output
-                old_stdout = sys.stdout
-                sys.stdout = captured_output = io.StringIO()
-
-                try:
-                    test_reviews = scrape_reviews(url)
-                finally:
-                    sys.stdout = old_stdout
-
-                # Show captured output
-                output = captured_output.getvalue()
+                # Show the recorded progress output
+                output = "\n".join(recorder.messages())
                 if output:
                     st.code(output, language="text")
 
-                st.write(f"DEBUG: Direct scraper returned {len(test_reviews) if test_reviews else 0} reviews")
-
-                report = run_veritas(url, verbose=True)
-
-                st.write(f"DEBUG: run_veritas returned. Report keys: {list(report.keys())}")
-                st.write(f"DEBUG: Reviews analyzed: {report.get('total_reviews_analyzed', 0)}")
-
                 status_text.text("✅ Analysis complete!")
                 progress_bar.progress(100)
 
@@ -356,8 +343,6 @@ def main():
                 # Check for errors
                 if "error" in report:
                     st.error(f"❌ Error: {report['error']}")
-                    st.write(f"DEBUG: Full error report: {report}")
-                    print(f"DEBUG: Full error report: {report}")
                     return
 
                 # Display results
@@ -41,6 +41,9 @@ STARTING_TRUST_SCORE = 100
 VELOCITY_THRESHOLD_HOURS = 72  # Suspicious if >30% reviews within this window
 VELOCITY_THRESHOLD_PERCENTAGE = 0.30  # 30% of reviews
 VELOCITY_PENALTY = -15
+# Burst windows reported alongside the main window (1h, 6h, 24h, 72h, 7d).
+# Only VELOCITY_THRESHOLD_HOURS drives the penalty; the rest are informational.
+VELOCITY_BURST_WINDOWS_HOURS = [1, 6, 24, 72, 168]
 
 # 2. Generic Praise Pattern
 GENERIC_PHRASES = [
@@ -85,6 +88,13 @@ REPETITIVE_PHRASE_MIN_LENGTH = 4  # Words in phrase
 REPETITIVE_PHRASE_COUNT = 5  # If same phrase appears in >5 reviews
 REPETITIVE_PHRASE_PENALTY = -10
 
+# 9. Near-Duplicate Reviews (MinHash + LSH clustering)
+NEAR_DUPLICATE_JACCARD_THRESHOLD = 0.80  # Estimated word-shingle Jaccard similarity
+NEAR_DUPLICATE_SHINGLE_SIZE = 3  # Words per shingle
+NEAR_DUPLICATE_NUM_PERM = 64  # MinHash signature length (bands x rows, max 512)
+NEAR_DUPLICATE_MIN_CLUSTER_SIZE = 3  # Reviews needed to report a cluster
+NEAR_DUPLICATE_PENALTY = -10
+
 # ============================================================================
 # BONUS POINTS (Trust Score)
 # ============================================================================
@@ -137,6 +147,42 @@ GRADE_SCALE = {
     0:  "F"   # 0-44
 }
 
+# ============================================================================
+# LARGE-SCALE ANALYSIS
+# ============================================================================
+
+# Reviews per shard when analyze_data runs with executor="sharded"
+ANALYSIS_SHARD_SIZE = 50000
+
+# Streaming mode (analyze_data over an iterator): fixed memory budget
+STREAMING_CHUNK_SIZE = 5000  # Reviews vectorized at a time
+STREAMING_SAMPLE_SIZE = 100  # Suspicious reviews kept per red flag (reservoir sample)
+STREAMING_TIME_BUCKET_SECONDS = 60  # Velocity timestamps are counted per bucket
+STREAMING_MAX_TIME_BUCKETS = 100000  # Past this, velocity buckets are merged in pairs (twice as wide)
+STREAMING_MAX_AUTHORS = 200000  # Authors tracked exactly for the reviewer check
+STREAMING_MAX_AUTHOR_DAYS = 64  # Days with reviews kept per author for the burst check (latest first)
+STREAMING_MAX_LSH_LEADERS = 50000  # Stored MinHash signatures for near-duplicate clustering
+STREAMING_HLL_PRECISION = 12  # Distinct-author counter size (2^12 registers, ~1.6% error)
+
+# Repeated-phrase counting in streaming mode: "exact" keeps a count for every n-gram seen,
+# "approximate" keeps a count-min sketch plus a heavy-hitter list of candidate phrases
+STREAMING_REPETITIVE_MODE = "approximate"
+REPETITIVE_SKETCH_WIDTH = 1 << 19  # Counters per row; overcount <= e / width * n-grams seen
+REPETITIVE_SKETCH_DEPTH = 4  # Rows (4 bytes per counter, 8 MB total); bound holds with prob. 1 - e^-4
+REPETITIVE_HEAVY_HITTERS = 20000  # Candidate phrases kept with their text
+
+# ============================================================================
+# REPORT CACHE
+# ============================================================================
+
+# Finished reports are cached in SQLite (src/report_cache.py), keyed by ASIN, review set
+# and configuration. None disables the cache; run_veritas(report_cache=...) and
+# main.py --report-cache take a path too.
+REPORT_CACHE_FILE = None
+REPORT_CACHE_TTL_SECONDS = 7 * 24 * 3600  # Older reports are never served and get evicted
+REPORT_CACHE_MAX_BYTES = 64 * 1024 * 1024  # Compressed reports kept; least recently used go first
+REPORT_CACHE_MAX_AGE_SECONDS = 3600  # Serve an ASIN's latest report without re-fetching within this age
+
 # ============================================================================
 # SCRAPER SETTINGS
 # ============================================================================
@@ -18,6 +18,7 @@ import json
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import config
+from src import events
 
 # OpenAI import (will be optional if not configured)
 try:
@@ -25,7 +26,7 @@ try:
     OPENAI_AVAILABLE = True
 except ImportError:
     OPENAI_AVAILABLE = False
-    print("⚠️  OpenAI library not installed. Run: pip install openai")
+    events.warning("ai.unavailable", "⚠️  OpenAI library not installed. Run: pip install openai")
 
 
 class AIReviewAnalyzer:
@@ -60,7 +61,7 @@ class AIReviewAnalyzer:
         # Priority: 1) env var (from web UI), 2) config.py default
         self.model = os.getenv("VERITAS_AI_MODEL") or getattr(config, "OPENAI_MODEL", "gpt-5-mini")
 
-        print(f"🤖 Using AI model: {self.model}")
+        events.info("ai.model", f"🤖 Using AI model: {self.model}", model=self.model)
 
     def analyze_single_review(self, review: Dict) -> Dict:
         """
@@ -114,7 +115,7 @@ class AIReviewAnalyzer:
             return result
 
         except Exception as e:
-            print(f"⚠️  AI analysis error: {e}")
+            events.warning("ai.review_error", f"⚠️  AI analysis error: {e}", error=str(e))
             return {
                 "authenticity_score": 50,
                 "confidence": 0,
@@ -173,7 +174,7 @@ class AIReviewAnalyzer:
             return result
 
         except Exception as e:
-            print(f"⚠️  Batch AI analysis error: {e}")
+            events.warning("ai.batch_error", f"⚠️  Batch AI analysis error: {e}", error=str(e))
             return {
                 "overall_authenticity": 50,
                 "manipulation_likelihood": "unknown",
@@ -241,10 +242,10 @@ def enhance_analysis_with_ai(reviews: List[Dict], analysis_report: Dict, api_key
     Returns:
         Dict: Enhanced analysis report with AI insights
     """
-    print("\n🤖 Enhancing analysis with AI...")
+    events.info("ai.started", "\n🤖 Enhancing analysis with AI...", reviews=len(reviews))
 
     if not OPENAI_AVAILABLE:
-        print("   ⚠️  OpenAI not available, skipping AI analysis")
+        events.warning("ai.skipped", "   ⚠️  OpenAI not available, skipping AI analysis")
         return analysis_report
 
     try:
@@ -269,13 +270,15 @@ def enhance_analysis_with_ai(reviews: List[Dict], analysis_report: Dict, api_key
         if ai_batch_result.get("manipulation_likelihood") == "high":
             analysis_report["total_score_impact"] -= 10
             analysis_report["triggered_flags"].append("ai_detected_manipulation")
-            print(f"   ⚠️  AI detected high manipulation likelihood")
+            events.warning("ai.manipulation", "   ⚠️  AI detected high manipulation likelihood")
 
-        print(f"   ✓ AI Analysis: {ai_score:.1f}/100 authenticity")
-        print(f"   ✓ Manipulation risk: {ai_batch_result.get('manipulation_likelihood', 'unknown').upper()}")
+        events.info("ai.complete", f"   ✓ AI Analysis: {ai_score:.1f}/100 authenticity", authenticity=ai_score)
+        events.info("ai.complete",
+                    f"   ✓ Manipulation risk: {ai_batch_result.get('manipulation_likelihood', 'unknown').upper()}",
+                    manipulation_likelihood=ai_batch_result.get('manipulation_likelihood', 'unknown'))
 
     except Exception as e:
-        print(f"   ⚠️  Could not perform AI analysis: {e}")
+        events.warning("ai.failed", f"   ⚠️  Could not perform AI analysis: {e}", error=str(e))
         analysis_report["ai_insights"] = {
             "error": str(e),
             "overall_authenticity": None
@@ -286,6 +289,8 @@ def enhance_analysis_with_ai(reviews: List[Dict], analysis_report: Dict, api_key
 
 # Example usage
 if __name__ == "__main__":
+    events.subscribe(events.console_printer())
+
     # Test AI analyzer (requires OPENAI_API_KEY in environment)
     test_review = {
         "review_text": "This product is amazing! Great quality! Highly recommend! Best purchase ever!",
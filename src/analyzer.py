@@ -1,14 +1,14 @@
 """
 Project Veritas - Analysis Engine
-Implements 8 red flag detection algorithms for identifying fake/suspicious reviews
+Implements 9 red flag detection algorithms for identifying fake/suspicious reviews
 """
 
 import sys
 import os
-from typing import List, Dict, Tuple
-from collections import Counter, defaultdict
+import contextvars
+from typing import List, Dict, Tuple, Union, Iterable
 from datetime import datetime, timedelta
-import re
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 import numpy as np
 
 # Add parent directory to path
@@ -16,425 +16,979 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import config
 from src import utils
+from src import events
+from src.review_batch import ReviewBatch
+from src.compiled_config import CompiledConfig, compile_config
+from src.text_features import get_text_features
+from src.ngram_index import NGramIndex
+from src.near_duplicates import find_near_duplicate_clusters
+from src.profiling import Profiler, NULL_PROFILER
 
 
-def check_review_velocity(reviews: List[Dict]) -> Dict:
+def _window_label(hours: float) -> str:
+    """
+    Short label for a velocity window, e.g. 72 -> "72h", 168 -> "7d".
+    Whole weeks are labelled in days, everything else in hours.
+    """
+    if hours >= 168 and hours % 168 == 0:
+        return f"{int(hours // 24)}d"
+    return f"{hours:g}h"
+
+
+def _densest_windows(sorted_epochs: np.ndarray, window_hours: List[float]) -> Dict[float, Tuple[int, int, int]]:
+    """
+    Finds, for every window length, the window [t, t + length] holding the most reviews.
+
+    The sorted timestamp array doubles as an exact cumulative histogram: the
+    number of reviews posted at or before t is its insertion rank. Every review
+    opens a window whose count is rank(t + length) - rank(t), so all window
+    lengths are answered from the same array with one vectorized lookup each,
+    at O(n log n) total instead of recounting the list for every review.
+
+    Args:
+        sorted_epochs (np.ndarray): Review timestamps (epoch seconds), sorted ascending
+        window_hours (List[float]): Window lengths in hours
+
+    Returns:
+        Dict[float, Tuple[int, int, int]]: window hours -> (review count, start index,
+        end index) of its densest window; the earliest one wins on ties.
+        Members are sorted_epochs[start:end].
+    """
+    if len(sorted_epochs) == 0:
+        return {hours: (0, 0, 0) for hours in window_hours}
+
+    # Reviews sharing the opening timestamp all belong to the window, hence 'left'
+    starts = np.searchsorted(sorted_epochs, sorted_epochs, side="left")
+
+    windows = {}
+    for hours in window_hours:
+        ends = np.searchsorted(sorted_epochs, sorted_epochs + hours * 3600, side="right")
+        counts = ends - starts
+        best = int(np.argmax(counts))
+        windows[hours] = (int(counts[best]), int(starts[best]), int(ends[best]))
+
+    return windows
+
+
+def check_review_velocity(reviews: Union[List[Dict], ReviewBatch], compiled: CompiledConfig = None) -> Dict:
     """
     RED FLAG #1: Review Velocity Spike
     Detects suspicious bursts of reviews posted in short timeframes.
 
     Args:
-        reviews (List[Dict]): List of review dictionaries with 'date' field
+        reviews (Union[List[Dict], ReviewBatch]): Reviews with 'date' field, or a prebuilt batch
+        compiled (CompiledConfig, optional): Configuration snapshot (default: current config)
 
     Returns:
         Dict: {
             "triggered": bool,
             "score_impact": float,
             "details": str,
-            "suspicious_reviews": List[Dict]
+            "suspicious_indices": List[int],  # positions in ``reviews``
+            "windows": {
+                "1h": {
+                    "window_hours": float,
+                    "peak_start": datetime,  # naive UTC
+                    "peak_end": datetime,
+                    "count": int,
+                    "percentage": float,
+                    "exceeds_threshold": bool,
+                    "indices": List[int]
+                },
+                ...  # one entry per VELOCITY_BURST_WINDOWS_HOURS
+            }
         }
     """
+    compiled = compiled or compile_config()
+    batch = ReviewBatch.from_reviews(reviews)
+
+    # Filter reviews with valid dates
+    dated_indices = np.flatnonzero(batch.has_date)
+
+    # Sort by date (stable, so reviews posted at the same second keep their order)
+    order = np.argsort(batch.epoch[dated_indices], kind="stable")
+    dated_indices = dated_indices[order]
+
+    return _velocity_result(batch, dated_indices, batch.epoch[dated_indices], compiled)
+
+
+def _velocity_result(batch: ReviewBatch, dated_indices: np.ndarray, epochs: np.ndarray,
+                     compiled: CompiledConfig = None) -> Dict:
+    """
+    Builds the velocity result from the dated reviews in timestamp order.
+
+    Args:
+        batch (ReviewBatch): All reviews
+        dated_indices (np.ndarray): Positions of the dated reviews, sorted by date (stable)
+        epochs (np.ndarray): Their timestamps (epoch seconds), ascending
+        compiled (CompiledConfig, optional): Configuration snapshot (default: current config)
+
+    Returns:
+        Dict: Red flag result dictionary (see check_review_velocity)
+    """
+    compiled = compiled or compile_config()
     result = {
         "triggered": False,
         "score_impact": 0,
         "details": "",
-        "suspicious_reviews": []
+        "suspicious_indices": [],
+        "windows": {}
     }
 
-    # Filter reviews with valid dates
-    dated_reviews = [r for r in reviews if r.get("date")]
-    if len(dated_reviews) < 10:  # Need enough data
+    if len(dated_indices) < 10:  # Need enough data
         result["details"] = "Insufficient data for velocity analysis"
         return result
 
-    # Sort by date
-    dated_reviews.sort(key=lambda x: x["date"])
-
     # Check for reviews within threshold window
-    window_hours = config.VELOCITY_THRESHOLD_HOURS
-    threshold_percentage = config.VELOCITY_THRESHOLD_PERCENTAGE
-
-    # Sliding window analysis
-    max_reviews_in_window = 0
-    suspicious_window_reviews = []
-
-    for i, review in enumerate(dated_reviews):
-        window_start = review["date"]
-        window_end = window_start + timedelta(hours=window_hours)
-
-        # Count reviews in this window
-        reviews_in_window = [
-            r for r in dated_reviews
-            if window_start <= r["date"] <= window_end
-        ]
+    window_hours = compiled.VELOCITY_THRESHOLD_HOURS
+    threshold_percentage = compiled.VELOCITY_THRESHOLD_PERCENTAGE
+
+    # Sliding window analysis at every resolution, from the one timestamp array
+    densest = _densest_windows(epochs, compiled.velocity_window_hours)
+
+    for hours in compiled.VELOCITY_BURST_WINDOWS_HOURS:
+        count, start, end = densest[hours]
+        percentage = count / len(dated_indices)
+        peak_start = utils.from_epoch_seconds(epochs[start])
+        result["windows"][_window_label(hours)] = {
+            "window_hours": hours,
+            "peak_start": peak_start,
+            "peak_end": peak_start + timedelta(hours=hours),
+            "count": count,
+            "percentage": percentage,
+            "exceeds_threshold": percentage >= threshold_percentage,
+            "indices": dated_indices[start:end].tolist()
+        }
 
-        if len(reviews_in_window) > max_reviews_in_window:
-            max_reviews_in_window = len(reviews_in_window)
-            suspicious_window_reviews = reviews_in_window
+    max_reviews_in_window, window_start, window_end = densest[window_hours]
 
     # Calculate percentage
-    percentage_in_window = max_reviews_in_window / len(dated_reviews)
+    percentage_in_window = max_reviews_in_window / len(dated_indices)
 
     if percentage_in_window >= threshold_percentage:
         result["triggered"] = True
-        result["score_impact"] = config.VELOCITY_PENALTY
+        result["score_impact"] = compiled.VELOCITY_PENALTY
         result["details"] = f"{max_reviews_in_window} reviews ({utils.format_percentage(percentage_in_window)}) posted within {window_hours} hours"
-        result["suspicious_reviews"] = suspicious_window_reviews
+        result["suspicious_indices"] = dated_indices[window_start:window_end].tolist()
 
     return result
 
 
-def check_generic_praise(reviews: List[Dict]) -> Dict:
+def check_generic_praise(reviews: Union[List[Dict], ReviewBatch], compiled: CompiledConfig = None) -> Dict:
     """
     RED FLAG #2: Generic Praise Pattern
     Detects vague, non-specific positive language without details.
 
     Args:
-        reviews (List[Dict]): List of review dictionaries
+        reviews (Union[List[Dict], ReviewBatch]): Review dictionaries or a prebuilt batch
+        compiled (CompiledConfig, optional): Configuration snapshot (default: current config)
 
     Returns:
         Dict: Red flag result dictionary
     """
+    batch = ReviewBatch.from_reviews(reviews)
+    return _generic_praise_result(batch, np.flatnonzero(_generic_praise_mask(batch, compiled)), compiled)
+
+
+def _generic_praise_mask(batch: ReviewBatch, compiled: CompiledConfig = None) -> np.ndarray:
+    """
+    Marks reviews that are too short, or very short (<=10 words) and lean on generic phrases.
+    """
+    compiled = compiled or compile_config()
+    features = get_text_features(batch, compiled)
+    return (
+        (features.text_length < compiled.GENERIC_MIN_LENGTH) |
+        ((features.generic_phrase_hits > 0) & (features.word_count <= 10))
+    )
+
+
+def _generic_praise_result(batch: ReviewBatch, generic_indices: np.ndarray,
+                           compiled: CompiledConfig = None) -> Dict:
+    """
+    Builds the generic praise result from the positions of the generic reviews.
+    """
+    compiled = compiled or compile_config()
     result = {
         "triggered": False,
         "score_impact": 0,
         "details": "",
-        "suspicious_reviews": []
+        "suspicious_indices": []
     }
 
-    generic_reviews = []
-
-    for review in reviews:
-        text = review.get("review_text", "").lower()
-        title = review.get("title", "").lower()
-        full_text = (title + " " + text).lower()
-
-        # Check if review is too short
-        if len(full_text.strip()) < config.GENERIC_MIN_LENGTH:
-            generic_reviews.append(review)
-            continue
-
-        # Check for generic phrases
-        for phrase in config.GENERIC_PHRASES:
-            if phrase.lower() in full_text:
-                # If it ONLY contains generic phrase and nothing else meaningful
-                if len(full_text.split()) <= 10:  # Very short reviews with generic phrases
-                    generic_reviews.append(review)
-                    break
-
-    if generic_reviews:
+    if len(generic_indices):
         result["triggered"] = True
-        count = len(generic_reviews)
-        result["score_impact"] = config.GENERIC_PENALTY_PER_REVIEW * count
-        result["details"] = f"{count} reviews ({utils.format_percentage(count/len(reviews))}) are generic or too short"
-        result["suspicious_reviews"] = generic_reviews
+        count = len(generic_indices)
+        result["score_impact"] = compiled.GENERIC_PENALTY_PER_REVIEW * count
+        result["details"] = f"{count} reviews ({utils.format_percentage(count/len(batch))}) are generic or too short"
+        result["suspicious_indices"] = np.asarray(generic_indices, dtype=np.int64).tolist()
 
     return result
 
 
-def check_suspicious_reviewers(reviews: List[Dict]) -> Dict:
+def check_suspicious_reviewers(reviews: Union[List[Dict], ReviewBatch], compiled: CompiledConfig = None) -> Dict:
     """
     RED FLAG #3: Suspicious Reviewer Profile
     Detects reviewers with unusual patterns (many reviews in short time, only extreme ratings).
 
     Args:
-        reviews (List[Dict]): List of review dictionaries
+        reviews (Union[List[Dict], ReviewBatch]): Review dictionaries or a prebuilt batch
+        compiled (CompiledConfig, optional): Configuration snapshot (default: current config)
 
     Returns:
-        Dict: Red flag result dictionary
+        Dict: Red flag result dictionary, plus
+        "rules": {rule name: {"authors": int, "review_count": int}} for each reviewer rule
     """
-    result = {
-        "triggered": False,
-        "score_impact": 0,
-        "details": "",
-        "suspicious_reviews": []
-    }
+    batch = ReviewBatch.from_reviews(reviews)
 
-    # Group reviews by author
-    reviews_by_author = defaultdict(list)
-    for review in reviews:
-        author = review.get("author", "Anonymous")
-        reviews_by_author[author].append(review)
+    # Group reviews by author (IDs are interned in first-seen order)
+    reviews_per_author = np.bincount(batch.author_ids, minlength=len(batch.authors))
 
-    suspicious_authors = []
-    suspicious_reviews = []
+    # Count each (author, rating) pair
+    pair_authors, pair_ratings, pair_counts = _author_rating_pairs(
+        batch.author_ids[batch.has_rating], batch.rating[batch.has_rating]
+    )
 
-    for author, author_reviews in reviews_by_author.items():
-        if len(author_reviews) < 2:  # Need multiple reviews to detect pattern
-            continue
+    same_rating_authors = _suspicious_author_mask(reviews_per_author, pair_authors, pair_counts, compiled)
+    bursty_authors = _author_burst_mask(
+        batch.author_ids[batch.has_date], batch.epoch[batch.has_date], len(batch.authors), compiled
+    )
+    return _suspicious_reviewers_result(batch, same_rating_authors, bursty_authors, compiled)
 
-        # Check for suspicious patterns:
 
-        # Pattern 1: Check if all ratings are the same (e.g., all 5-star)
-        ratings = [r.get("rating") for r in author_reviews if r.get("rating")]
-        if ratings:
-            rating_counts = Counter(ratings)
-            most_common_rating_count = rating_counts.most_common(1)[0][1]
-            same_rating_percentage = most_common_rating_count / len(ratings)
+def _author_rating_pairs(author_ids: np.ndarray, ratings: np.ndarray,
+                         counts: np.ndarray = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Counts every distinct (author, rating) pair.
 
-            if same_rating_percentage >= config.REVIEWER_RED_FLAGS["same_rating_percentage"]:
-                suspicious_authors.append(author)
-                suspicious_reviews.extend(author_reviews)
+    Args:
+        author_ids (np.ndarray): Author ID of each rated review (or of each partial pair)
+        ratings (np.ndarray): The matching ratings
+        counts (np.ndarray, optional): Weight of each entry (1 per review by default),
+            so already-counted pairs (e.g. from several shards) can be summed
 
-    # Calculate percentage
-    if suspicious_authors:
-        suspicious_percentage = len(suspicious_authors) / len(reviews_by_author)
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: (author IDs, ratings, counts) of the distinct pairs
+    """
+    rating_values, rating_codes = np.unique(ratings, return_inverse=True)
+    rating_slots = max(len(rating_values), 1)
+    pair_keys = author_ids.astype(np.int64) * rating_slots + rating_codes.ravel()
+    unique_pairs, pair_index = np.unique(pair_keys, return_inverse=True)
+    weights = np.ones(len(pair_keys), dtype=np.int64) if counts is None else counts
+    pair_counts = np.bincount(pair_index.ravel(), weights=weights, minlength=len(unique_pairs)).astype(np.int64)
 
-        if suspicious_percentage >= config.SUSPICIOUS_REVIEWER_THRESHOLD:
-            result["triggered"] = True
-            result["score_impact"] = config.SUSPICIOUS_REVIEWER_PENALTY
-            result["details"] = f"{len(suspicious_authors)} reviewers ({utils.format_percentage(suspicious_percentage)}) show suspicious patterns"
-            result["suspicious_reviews"] = suspicious_reviews
+    return (unique_pairs // rating_slots).astype(np.int64), rating_values[unique_pairs % rating_slots], pair_counts
 
-    return result
 
+def _suspicious_author_mask(reviews_per_author: np.ndarray, pair_authors: np.ndarray,
+                            pair_counts: np.ndarray, compiled: CompiledConfig = None) -> np.ndarray:
+    """
+    Pattern 1: authors with several reviews whose ratings are (almost) all the same (e.g., all 5-star).
+
+    Args:
+        reviews_per_author (np.ndarray): Review count per author ID
+        pair_authors (np.ndarray): Author of each distinct (author, rating) pair
+        pair_counts (np.ndarray): Rated reviews per pair
+        compiled (CompiledConfig, optional): Configuration snapshot (default: current config)
 
-def check_linguistic_anomalies(reviews: List[Dict]) -> Dict:
+    Returns:
+        np.ndarray: Boolean mask over author IDs
     """
-    RED FLAG #4: Linguistic Anomalies
-    Detects unnatural language patterns, keyword stuffing, poor grammar.
+    compiled = compiled or compile_config()
+    author_count = len(reviews_per_author)
+
+    # Keep every author's most common rating
+    most_common_rating_count = np.zeros(author_count, dtype=np.int64)
+    np.maximum.at(most_common_rating_count, pair_authors, pair_counts)
+    rated_per_author = np.bincount(pair_authors, weights=pair_counts, minlength=author_count)
+
+    same_rating_percentage = np.divide(
+        most_common_rating_count, rated_per_author,
+        out=np.zeros(author_count), where=rated_per_author > 0
+    )
+    return (
+        (reviews_per_author >= 2) &  # Need multiple reviews to detect pattern
+        (rated_per_author > 0) &
+        (same_rating_percentage >= compiled.same_rating_percentage)
+    )
+
+
+def _author_burst_mask(author_ids: np.ndarray, epochs: np.ndarray, author_count: int,
+                       compiled: CompiledConfig = None) -> np.ndarray:
+    """
+    Pattern 2: authors posting more than ``reviews_in_short_time`` reviews within ``days_window`` days.
+
+    The dated reviews are grouped into a per-author timestamp index (sorted by
+    author, then time, as flat arrays). An author has more than k reviews in
+    some window exactly when, for some review, the author's k-th next review
+    is within the window, so one shifted comparison over the whole index scans
+    every author's windows at once.
 
     Args:
-        reviews (List[Dict]): List of review dictionaries
+        author_ids (np.ndarray): Author ID of each dated review
+        epochs (np.ndarray): The matching timestamps (epoch seconds)
+        author_count (int): Number of author IDs
+        compiled (CompiledConfig, optional): Configuration snapshot (default: current config)
 
     Returns:
-        Dict: Red flag result dictionary
+        np.ndarray: Boolean mask over author IDs
+    """
+    order = np.lexsort((epochs, author_ids))
+    return _sorted_author_burst_mask(author_ids[order], epochs[order], author_count, compiled)
+
+
+def _sorted_author_burst_mask(sorted_authors: np.ndarray, sorted_epochs: np.ndarray, author_count: int,
+                              compiled: CompiledConfig = None) -> np.ndarray:
+    """
+    Pattern 2 over a per-author timestamp index that is already sorted by author, then time
+    (see _author_burst_mask), so the index can be built once and scanned with many configs.
+    """
+    compiled = compiled or compile_config()
+    limit = compiled.reviewer_burst_limit
+    window = compiled.reviewer_window_seconds
+    is_bursty = np.zeros(author_count, dtype=bool)
+    if limit <= 0:
+        # "More than 0 reviews": every author with a dated review
+        is_bursty[sorted_authors] = True
+        return is_bursty
+    if len(sorted_epochs) <= limit:
+        return is_bursty
+
+    in_burst = ((sorted_authors[limit:] == sorted_authors[:-limit]) &
+                (sorted_epochs[limit:] - sorted_epochs[:-limit] <= window))
+    is_bursty[sorted_authors[limit:][in_burst]] = True
+    return is_bursty
+
+
+def _suspicious_reviewers_details(suspicious_authors: int, suspicious_percentage: float, rules: Dict,
+                                  compiled: CompiledConfig = None) -> str:
+    """
+    Details line of a triggered suspicious reviewer flag, with the count of each rule.
+    """
+    compiled = compiled or compile_config()
+    return (
+        f"{suspicious_authors} reviewers ({utils.format_percentage(suspicious_percentage)}) show suspicious patterns "
+        f"({rules['same_rating']['authors']} rate (almost) always the same, "
+        f"{rules['reviews_in_short_time']['authors']} posted more than "
+        f"{compiled.REVIEWER_RED_FLAGS['reviews_in_short_time']} reviews within "
+        f"{compiled.REVIEWER_RED_FLAGS['days_window']} days)"
+    )
+
+
+def _suspicious_reviewers_result(batch: ReviewBatch, same_rating_authors: np.ndarray,
+                                 bursty_authors: np.ndarray, compiled: CompiledConfig = None) -> Dict:
+    """
+    Builds the suspicious reviewer result from the per-author verdicts of both rules.
+    An author is suspicious if either rule applies; each rule is also reported on its own.
     """
+    compiled = compiled or compile_config()
     result = {
         "triggered": False,
         "score_impact": 0,
         "details": "",
-        "suspicious_reviews": []
+        "suspicious_indices": [],
+        "rules": {
+            rule_name: {
+                "authors": int(np.count_nonzero(rule_authors)),
+                "review_count": int(np.count_nonzero(rule_authors[batch.author_ids]))
+            }
+            for rule_name, rule_authors in (("same_rating", same_rating_authors),
+                                            ("reviews_in_short_time", bursty_authors))
+        }
     }
 
-    anomalous_reviews = []
+    is_suspicious_author = same_rating_authors | bursty_authors
+    suspicious_authors = np.flatnonzero(is_suspicious_author)
+
+    # Calculate percentage
+    if len(suspicious_authors):
+        suspicious_percentage = len(suspicious_authors) / len(batch.authors)
+
+        if suspicious_percentage >= compiled.SUSPICIOUS_REVIEWER_THRESHOLD:
+            result["triggered"] = True
+            result["score_impact"] = compiled.SUSPICIOUS_REVIEWER_PENALTY
+            result["details"] = _suspicious_reviewers_details(
+                len(suspicious_authors), suspicious_percentage, result["rules"], compiled
+            )
+            # Reviews grouped author by author, in first-seen order
+            suspicious_indices = np.flatnonzero(is_suspicious_author[batch.author_ids])
+            suspicious_indices = suspicious_indices[np.argsort(batch.author_ids[suspicious_indices], kind="stable")]
+            result["suspicious_indices"] = suspicious_indices.tolist()
+
+    return result
+
 
-    for review in reviews:
-        text = review.get("review_text", "")
-        if not text or len(text.split()) < 10:
-            continue
+def check_linguistic_anomalies(reviews: Union[List[Dict], ReviewBatch], compiled: CompiledConfig = None) -> Dict:
+    """
+    RED FLAG #4: Linguistic Anomalies
+    Detects unnatural language patterns, keyword stuffing, poor grammar.
 
-        is_anomalous = False
+    Args:
+        reviews (Union[List[Dict], ReviewBatch]): Review dictionaries or a prebuilt batch
+        compiled (CompiledConfig, optional): Configuration snapshot (default: current config)
+
+    Returns:
+        Dict: Red flag result dictionary
+    """
+    batch = ReviewBatch.from_reviews(reviews)
+    return _linguistic_anomalies_result(batch, np.flatnonzero(_linguistic_anomaly_mask(batch, compiled)), compiled)
 
-        # Check for keyword stuffing (same word repeated many times)
-        words = text.lower().split()
-        word_counts = Counter(words)
 
-        # Ignore common words
-        common_words = {"the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for", "of", "with", "is", "was", "are", "this", "that", "it"}
+def _linguistic_anomaly_mask(batch: ReviewBatch, compiled: CompiledConfig = None) -> np.ndarray:
+    """
+    Marks reviews with keyword stuffing, excessive punctuation or ALL CAPS.
+    """
+    compiled = compiled or compile_config()
+    features = get_text_features(batch, compiled)
 
-        for word, count in word_counts.items():
-            if word not in common_words and len(word) > 3:
-                if count >= config.KEYWORD_STUFFING_THRESHOLD:
-                    is_anomalous = True
-                    break
+    # Only reviews with enough words to judge (at least 10)
+    has_enough_words = features.body_word_count >= 10
 
-        # Check for excessive punctuation (!!!!, ????)
-        if re.search(r'[!?]{4,}', text):
-            is_anomalous = True
+    # Keyword stuffing (same non-common word repeated many times),
+    # excessive punctuation (!!!!, ????) or ALL CAPS (more than 30% of text)
+    return has_enough_words & (
+        (features.max_word_frequency >= compiled.KEYWORD_STUFFING_THRESHOLD) |
+        (features.punctuation_runs > 0) |
+        ((features.caps_ratio > 0.3) & (features.body_length > 20))
+    )
 
-        # Check for ALL CAPS (more than 30% of text)
-        caps_ratio = sum(1 for c in text if c.isupper()) / max(len(text), 1)
-        if caps_ratio > 0.3 and len(text) > 20:
-            is_anomalous = True
 
-        if is_anomalous:
-            anomalous_reviews.append(review)
+def _linguistic_anomalies_result(batch: ReviewBatch, anomalous_indices: np.ndarray,
+                                 compiled: CompiledConfig = None) -> Dict:
+    """
+    Builds the linguistic anomaly result from the positions of the anomalous reviews.
+    """
+    compiled = compiled or compile_config()
+    result = {
+        "triggered": False,
+        "score_impact": 0,
+        "details": "",
+        "suspicious_indices": []
+    }
 
-    if anomalous_reviews:
+    if len(anomalous_indices):
         result["triggered"] = True
-        count = len(anomalous_reviews)
-        result["score_impact"] = config.LINGUISTIC_PENALTY_PER_REVIEW * count
-        result["details"] = f"{count} reviews ({utils.format_percentage(count/len(reviews))}) show linguistic anomalies"
-        result["suspicious_reviews"] = anomalous_reviews
+        count = len(anomalous_indices)
+        result["score_impact"] = compiled.LINGUISTIC_PENALTY_PER_REVIEW * count
+        result["details"] = f"{count} reviews ({utils.format_percentage(count/len(batch))}) show linguistic anomalies"
+        result["suspicious_indices"] = np.asarray(anomalous_indices, dtype=np.int64).tolist()
 
     return result
 
 
-def check_sentiment_imbalance(reviews: List[Dict]) -> Dict:
+def check_sentiment_imbalance(reviews: Union[List[Dict], ReviewBatch], compiled: CompiledConfig = None) -> Dict:
     """
     RED FLAG #5: Extreme Sentiment Imbalance
     Detects disproportionate ratios of 5-star vs other ratings (bimodal distribution).
 
     Args:
-        reviews (List[Dict]): List of review dictionaries
+        reviews (Union[List[Dict], ReviewBatch]): Review dictionaries or a prebuilt batch
+        compiled (CompiledConfig, optional): Configuration snapshot (default: current config)
+
+    Returns:
+        Dict: Red flag result dictionary
+    """
+    batch = ReviewBatch.from_reviews(reviews)
+
+    # Count ratings
+    return _sentiment_imbalance_result(
+        batch,
+        int(np.count_nonzero(batch.has_rating)),
+        int(np.count_nonzero(batch.rating == 5.0)),
+        int(np.count_nonzero(batch.rating == 1.0)),
+        np.flatnonzero(batch.rating == 5.0),
+        compiled
+    )
+
+
+def _sentiment_imbalance_result(batch: ReviewBatch, total: int, five_star_count: int,
+                                one_star_count: int, five_star_indices: np.ndarray,
+                                compiled: CompiledConfig = None) -> Dict:
+    """
+    Builds the sentiment imbalance result from the rating counts.
+
+    Args:
+        batch (ReviewBatch): All reviews
+        total (int): Reviews with a rating
+        five_star_count (int): 5-star reviews
+        one_star_count (int): 1-star reviews
+        five_star_indices (np.ndarray): Positions of the 5-star reviews
+        compiled (CompiledConfig, optional): Configuration snapshot (default: current config)
 
     Returns:
         Dict: Red flag result dictionary
     """
+    compiled = compiled or compile_config()
     result = {
         "triggered": False,
         "score_impact": 0,
         "details": "",
-        "suspicious_reviews": []
+        "suspicious_indices": []
     }
 
-    # Count ratings
-    ratings = [r.get("rating") for r in reviews if r.get("rating")]
-    if not ratings:
+    if not total:
         return result
 
-    rating_counts = Counter(ratings)
-    total = len(ratings)
-
     # Calculate percentages
-    five_star_pct = rating_counts.get(5.0, 0) / total
-    one_star_pct = rating_counts.get(1.0, 0) / total
+    five_star_pct = five_star_count / total
+    one_star_pct = one_star_count / total
 
     # Check for extreme 5-star dominance
-    if five_star_pct >= config.FIVE_STAR_THRESHOLD:
+    if five_star_pct >= compiled.FIVE_STAR_THRESHOLD:
         result["triggered"] = True
-        result["score_impact"] = config.SENTIMENT_IMBALANCE_PENALTY
+        result["score_impact"] = compiled.SENTIMENT_IMBALANCE_PENALTY
         result["details"] = f"Extreme 5-star dominance: {utils.format_percentage(five_star_pct)} of reviews are 5-star"
 
     # Check for bimodal distribution (lots of 5-star AND lots of 1-star, few middle)
-    elif (five_star_pct >= config.BIMODAL_THRESHOLD and
-          one_star_pct >= config.BIMODAL_THRESHOLD and
+    elif (five_star_pct >= compiled.BIMODAL_THRESHOLD and
+          one_star_pct >= compiled.BIMODAL_THRESHOLD and
           (five_star_pct + one_star_pct) > 0.80):
         result["triggered"] = True
-        result["score_impact"] = config.SENTIMENT_IMBALANCE_PENALTY
+        result["score_impact"] = compiled.SENTIMENT_IMBALANCE_PENALTY
         result["details"] = f"Bimodal distribution detected: {utils.format_percentage(five_star_pct)} 5-star, {utils.format_percentage(one_star_pct)} 1-star"
 
     # Mark 5-star reviews as suspicious if triggered
     if result["triggered"]:
-        result["suspicious_reviews"] = [r for r in reviews if r.get("rating") == 5.0]
+        result["suspicious_indices"] = np.asarray(five_star_indices, dtype=np.int64).tolist()
 
     return result
 
 
-def check_review_length_extremes(reviews: List[Dict]) -> Dict:
+def check_review_length_extremes(reviews: Union[List[Dict], ReviewBatch], compiled: CompiledConfig = None) -> Dict:
     """
     RED FLAG #6: Review Length Extremes
     Detects unusually short or suspiciously long reviews.
 
     Args:
-        reviews (List[Dict]): List of review dictionaries
+        reviews (Union[List[Dict], ReviewBatch]): Review dictionaries or a prebuilt batch
+        compiled (CompiledConfig, optional): Configuration snapshot (default: current config)
 
     Returns:
         Dict: Red flag result dictionary
     """
+    batch = ReviewBatch.from_reviews(reviews)
+    return _length_extremes_result(batch, np.flatnonzero(_length_extreme_mask(batch, compiled)), compiled)
+
+
+def _length_extreme_mask(batch: ReviewBatch, compiled: CompiledConfig = None) -> np.ndarray:
+    """
+    Marks reviews shorter than REVIEW_LENGTH_MIN or longer than REVIEW_LENGTH_MAX.
+    """
+    compiled = compiled or compile_config()
+    lengths = batch.review_length
+    return (lengths < compiled.REVIEW_LENGTH_MIN) | (lengths > compiled.REVIEW_LENGTH_MAX)
+
+
+def _length_extremes_result(batch: ReviewBatch, extreme_indices: np.ndarray,
+                            compiled: CompiledConfig = None) -> Dict:
+    """
+    Builds the length extremes result from the positions of the extreme reviews.
+    """
+    compiled = compiled or compile_config()
     result = {
         "triggered": False,
         "score_impact": 0,
         "details": "",
-        "suspicious_reviews": []
+        "suspicious_indices": []
     }
 
-    extreme_reviews = []
-
-    for review in reviews:
-        length = review.get("review_length", 0)
-
-        if length < config.REVIEW_LENGTH_MIN or length > config.REVIEW_LENGTH_MAX:
-            extreme_reviews.append(review)
-
-    if extreme_reviews:
+    if len(extreme_indices):
         result["triggered"] = True
-        count = len(extreme_reviews)
-        result["score_impact"] = config.LENGTH_EXTREME_PENALTY_PER_REVIEW * count
-        result["details"] = f"{count} reviews ({utils.format_percentage(count/len(reviews))}) are extremely short or long"
-        result["suspicious_reviews"] = extreme_reviews
+        count = len(extreme_indices)
+        result["score_impact"] = compiled.LENGTH_EXTREME_PENALTY_PER_REVIEW * count
+        result["details"] = f"{count} reviews ({utils.format_percentage(count/len(batch))}) are extremely short or long"
+        result["suspicious_indices"] = np.asarray(extreme_indices, dtype=np.int64).tolist()
 
     return result
 
 
-def check_verified_ratio(reviews: List[Dict]) -> Dict:
+def check_verified_ratio(reviews: Union[List[Dict], ReviewBatch], compiled: CompiledConfig = None) -> Dict:
     """
     RED FLAG #7: Verified Purchase Ratio
     Checks the percentage of reviews with "Verified Purchase" badge.
 
     Args:
-        reviews (List[Dict]): List of review dictionaries
+        reviews (Union[List[Dict], ReviewBatch]): Review dictionaries or a prebuilt batch
+        compiled (CompiledConfig, optional): Configuration snapshot (default: current config)
+
+    Returns:
+        Dict: Red flag result dictionary (can also trigger BONUS)
+    """
+    batch = ReviewBatch.from_reviews(reviews)
+    return _verified_ratio_result(
+        batch, int(np.count_nonzero(batch.verified_purchase)), np.flatnonzero(~batch.verified_purchase), compiled
+    )
+
+
+def _verified_ratio_result(batch: ReviewBatch, verified_count: int, unverified_indices: np.ndarray,
+                           compiled: CompiledConfig = None) -> Dict:
+    """
+    Builds the verified purchase result from the verified count.
+
+    Args:
+        batch (ReviewBatch): All reviews
+        verified_count (int): Reviews with the "Verified Purchase" badge
+        unverified_indices (np.ndarray): Positions of the other reviews
+        compiled (CompiledConfig, optional): Configuration snapshot (default: current config)
 
     Returns:
         Dict: Red flag result dictionary (can also trigger BONUS)
     """
+    compiled = compiled or compile_config()
     result = {
         "triggered": False,
         "score_impact": 0,
         "details": "",
-        "suspicious_reviews": []
+        "suspicious_indices": []
     }
 
-    verified_count = sum(1 for r in reviews if r.get("verified_purchase", False))
-    total = len(reviews)
+    total = len(batch)
 
     verified_ratio = utils.safe_divide(verified_count, total)
 
     # Low verified ratio is suspicious
-    if verified_ratio < config.VERIFIED_LOW_THRESHOLD:
+    if verified_ratio < compiled.VERIFIED_LOW_THRESHOLD:
         result["triggered"] = True
-        result["score_impact"] = config.VERIFIED_LOW_PENALTY
+        result["score_impact"] = compiled.VERIFIED_LOW_PENALTY
         result["details"] = f"Low verified purchase rate: only {utils.format_percentage(verified_ratio)} are verified"
         # Mark non-verified reviews as suspicious
-        result["suspicious_reviews"] = [r for r in reviews if not r.get("verified_purchase", False)]
+        result["suspicious_indices"] = np.asarray(unverified_indices, dtype=np.int64).tolist()
 
     # High verified ratio is a GOOD sign (bonus)
-    elif verified_ratio >= config.VERIFIED_HIGH_THRESHOLD:
+    elif verified_ratio >= compiled.VERIFIED_HIGH_THRESHOLD:
         result["triggered"] = True  # "Triggered" but in a good way
-        result["score_impact"] = config.VERIFIED_HIGH_BONUS
+        result["score_impact"] = compiled.VERIFIED_HIGH_BONUS
         result["details"] = f"High verified purchase rate: {utils.format_percentage(verified_ratio)} are verified (BONUS)"
 
     return result
 
 
-def check_repetitive_phrases(reviews: List[Dict]) -> Dict:
+def check_repetitive_phrases(reviews: Union[List[Dict], ReviewBatch], compiled: CompiledConfig = None) -> Dict:
     """
     RED FLAG #8: Repetitive Phrasing
     Detects identical or near-identical phrases across multiple reviews.
 
     Args:
-        reviews (List[Dict]): List of review dictionaries
+        reviews (Union[List[Dict], ReviewBatch]): Review dictionaries or a prebuilt batch
+        compiled (CompiledConfig, optional): Configuration snapshot (default: current config)
+
+    Returns:
+        Dict: Red flag result dictionary
+    """
+    compiled = compiled or compile_config()
+    batch = ReviewBatch.from_reviews(reviews)
+    features = get_text_features(batch, compiled)
+
+    # Hash every n-gram of every review (body tokens followed by title tokens)
+    index = NGramIndex.from_text_features(features, compiled.REPETITIVE_PHRASE_MIN_LENGTH)
+    return _repetitive_phrases_from_index(batch, features, index, compiled)
+
+
+def _repetitive_phrases_from_index(batch: ReviewBatch, features, index: NGramIndex,
+                                   compiled: CompiledConfig = None) -> Dict:
+    """
+    Builds the repetitive phrasing result from the n-gram index of the batch.
+
+    Args:
+        batch (ReviewBatch): All reviews
+        features (TextFeatures): Their text features
+        index (NGramIndex): Index of their REPETITIVE_PHRASE_MIN_LENGTH-grams
+        compiled (CompiledConfig, optional): Configuration snapshot (default: current config)
+
+    Returns:
+        Dict: Red flag result dictionary
+    """
+    compiled = compiled or compile_config()
+
+    # Find phrases that appear in multiple reviews
+    repeated = index.repeated(compiled.REPETITIVE_PHRASE_COUNT)
+
+    if not len(repeated):
+        return _repetitive_phrases_result(batch, np.zeros(0, dtype=np.int64), "", 0, compiled)
+
+    # Show top repeated phrase (only this one is turned back into text)
+    top = index.top(repeated)
+    return _repetitive_phrases_result(
+        batch,
+        index.reviews_containing(repeated),
+        index.phrase(top, features.token_ids, features.vocabulary),
+        int(index.counts[top]),
+        compiled
+    )
+
+
+def _repetitive_phrases_result(batch: ReviewBatch, suspicious_indices: np.ndarray,
+                               top_phrase: str, top_count: int, compiled: CompiledConfig = None) -> Dict:
+    """
+    Builds the repetitive phrasing result.
+
+    Args:
+        batch (ReviewBatch): All reviews
+        suspicious_indices (np.ndarray): Sorted positions of reviews containing a repeated phrase
+        top_phrase (str): Most repeated phrase
+        top_count (int): Its number of occurrences
+        compiled (CompiledConfig, optional): Configuration snapshot (default: current config)
 
     Returns:
         Dict: Red flag result dictionary
     """
+    compiled = compiled or compile_config()
     result = {
         "triggered": False,
         "score_impact": 0,
         "details": "",
-        "suspicious_reviews": []
+        "suspicious_indices": []
     }
 
-    # Extract n-grams from all reviews
-    ngram_to_reviews = defaultdict(list)
+    if len(suspicious_indices):
+        # Remove duplicates (one entry per review ID, keeping the last copy)
+        suspicious_indices = suspicious_indices[::-1]
+        _, last_copy = np.unique(batch.review_ids[suspicious_indices], return_index=True)
+        suspicious_indices = np.sort(suspicious_indices[last_copy])
 
-    for review in reviews:
-        text = review.get("review_text", "") + " " + review.get("title", "")
-        ngrams = utils.get_ngrams(text, n=config.REPETITIVE_PHRASE_MIN_LENGTH)
+        result["triggered"] = True
+        result["score_impact"] = compiled.REPETITIVE_PHRASE_PENALTY
+        result["details"] = f"Repetitive phrases detected: '{top_phrase}' appears in {top_count} reviews"
+        result["suspicious_indices"] = suspicious_indices.tolist()
 
-        for ngram in ngrams:
-            ngram_to_reviews[ngram].append(review)
+    return result
 
-    # Find phrases that appear in multiple reviews
-    repeated_phrases = []
-    suspicious_reviews = []
 
-    for ngram, ngram_reviews in ngram_to_reviews.items():
-        if len(ngram_reviews) >= config.REPETITIVE_PHRASE_COUNT:
-            repeated_phrases.append((ngram, len(ngram_reviews)))
-            suspicious_reviews.extend(ngram_reviews)
+def check_near_duplicates(reviews: Union[List[Dict], ReviewBatch], compiled: CompiledConfig = None) -> Dict:
+    """
+    RED FLAG #9: Near-Duplicate Reviews
+    Detects clusters of templated reviews that differ by only a word or two,
+    using MinHash signatures and locality-sensitive hashing (no all-pairs comparison).
+
+    Args:
+        reviews (Union[List[Dict], ReviewBatch]): Review dictionaries or a prebuilt batch
+        compiled (CompiledConfig, optional): Configuration snapshot (default: current config)
+
+    Returns:
+        Dict: Red flag result dictionary, plus
+        "clusters": List[{"size": int, "indices": List[int]}] (largest first)
+    """
+    batch = ReviewBatch.from_reviews(reviews)
+    compiled = compiled or compile_config()
+    clusters = find_near_duplicate_clusters(get_text_features(batch, compiled), compiled=compiled)
+    return _near_duplicates_result(batch, clusters, compiled)
 
-    # Remove duplicates
-    suspicious_reviews = list({r["review_text"]: r for r in suspicious_reviews}.values())
 
-    if repeated_phrases:
+def _near_duplicates_result(batch: ReviewBatch, clusters: List[np.ndarray],
+                            compiled: CompiledConfig = None) -> Dict:
+    """
+    Builds the near-duplicate result from the clusters' review positions (largest first).
+    """
+    compiled = compiled or compile_config()
+    result = {
+        "triggered": False,
+        "score_impact": 0,
+        "details": "",
+        "suspicious_indices": [],
+        "clusters": []
+    }
+
+    if clusters:
+        clustered_indices = np.sort(np.concatenate(clusters))
+        count = len(clustered_indices)
+
         result["triggered"] = True
-        result["score_impact"] = config.REPETITIVE_PHRASE_PENALTY
-        # Show top repeated phrase
-        top_phrase = sorted(repeated_phrases, key=lambda x: x[1], reverse=True)[0]
-        result["details"] = f"Repetitive phrases detected: '{top_phrase[0]}' appears in {top_phrase[1]} reviews"
-        result["suspicious_reviews"] = suspicious_reviews
+        result["score_impact"] = compiled.NEAR_DUPLICATE_PENALTY
+        result["details"] = (
+            f"{len(clusters)} near-duplicate cluster(s) covering {count} reviews "
+            f"({utils.format_percentage(count/len(batch))}), largest has {len(clusters[0])}"
+        )
+        result["suspicious_indices"] = clustered_indices.tolist()
+        result["clusters"] = [
+            {"size": len(members), "indices": members.tolist()}
+            for members in clusters
+        ]
 
     return result
 
 
-def analyze_data(reviews: List[Dict]) -> Dict:
+# All red flag checks, in the order they run and are reported
+RED_FLAG_CHECKS = {
+    "review_velocity": check_review_velocity,
+    "generic_praise": check_generic_praise,
+    "suspicious_reviewers": check_suspicious_reviewers,
+    "linguistic_anomalies": check_linguistic_anomalies,
+    "sentiment_imbalance": check_sentiment_imbalance,
+    "review_length_extremes": check_review_length_extremes,
+    "verified_ratio": check_verified_ratio,
+    "repetitive_phrases": check_repetitive_phrases,
+    "near_duplicates": check_near_duplicates
+}
+
+
+# Bit of each check in the per-review flag bitset (see review_flag_bits)
+FLAG_BITS = {flag_name: 1 << position for position, flag_name in enumerate(RED_FLAG_CHECKS)}
+
+# Ways analyze_data can run the checks
+EXECUTORS = ("serial", "threads", "processes", "sharded")
+
+# Dict-free batch installed in each worker process by _init_worker
+_worker_batch = None
+
+
+def _init_worker(batch: ReviewBatch) -> None:
+    """
+    Process pool initializer: receives the columnar batch once per worker.
+    """
+    global _worker_batch
+    _worker_batch = batch
+
+
+def _run_check_in_worker(flag_name: str, compiled: CompiledConfig) -> Dict:
+    """
+    Runs one red flag check against the worker's batch.
+    """
+    return RED_FLAG_CHECKS[flag_name](_worker_batch, compiled)
+
+
+def review_flag_bits(review_count: int, red_flags: Dict[str, Dict]) -> np.ndarray:
     """
-    Main analysis function. Runs all 8 red flag checks.
+    Builds the per-review flag bitset: bit FLAG_BITS[flag] is set on every
+    review listed in that check's suspicious_indices (whether or not the
+    check triggered, so a report can tell what each check saw).
 
     Args:
-        reviews (List[Dict]): List of review dictionaries from scraper
+        review_count (int): Number of analyzed reviews
+        red_flags (Dict[str, Dict]): Check results keyed by flag name
+
+    Returns:
+        np.ndarray: uint16 flags per review
+    """
+    review_flags = np.zeros(review_count, dtype=np.uint16)
+    for flag_name, result in red_flags.items():
+        indices = result.get("suspicious_indices")
+        if flag_name in FLAG_BITS and indices:
+            review_flags[np.asarray(indices, dtype=np.int64)] |= np.uint16(FLAG_BITS[flag_name])
+    return review_flags
+
+
+def _run_profiled_check(flag_name: str, batch: ReviewBatch, compiled: CompiledConfig,
+                        profiler: Profiler, parent: str = None) -> Dict:
+    """
+    Runs one red flag check inside a "check:<flag_name>" span.
+    """
+    with profiler.span(f"check:{flag_name}", reviews=len(batch), parent=parent):
+        return RED_FLAG_CHECKS[flag_name](batch, compiled)
+
+
+def _run_checks(batch: ReviewBatch, executor: str, max_workers: int = None,
+                shard_size: int = None, compiled: CompiledConfig = None,
+                profiler: Profiler = None) -> Dict[str, Dict]:
+    """
+    Runs every red flag check with the requested executor.
+
+    Args:
+        batch (ReviewBatch): Reviews to analyze
+        executor (str): "serial", "threads", "processes" or "sharded"
+        max_workers (int, optional): Pool size (defaults to the executor's own default)
+        shard_size (int, optional): Reviews per shard for the "sharded" executor
+        compiled (CompiledConfig, optional): Configuration snapshot (default: current config)
+        profiler (Profiler, optional): Records a span per check ("serial" and "threads"),
+            or one span for all checks run in worker processes
+
+    Returns:
+        Dict[str, Dict]: Check results keyed by flag name, in RED_FLAG_CHECKS order
+    """
+    if executor not in EXECUTORS:
+        raise ValueError(f"Unknown executor '{executor}'. Choose one of: {', '.join(EXECUTORS)}")
+
+    compiled = compiled or compile_config()
+    profiler = profiler or NULL_PROFILER
+
+    if executor == "serial":
+        # Tokenized up front so the text feature pass is timed on its own, not inside the first text check
+        with profiler.span("text_features", reviews=len(batch)):
+            get_text_features(batch, compiled)
+        return {flag_name: _run_profiled_check(flag_name, batch, compiled, profiler) for flag_name in RED_FLAG_CHECKS}
+
+    if executor == "sharded":
+        # Imported here: the sharded module builds on this module's result helpers
+        from src.sharded_analysis import run_sharded_checks
+        with profiler.span("checks", reviews=len(batch), executor=executor):
+            sharded = run_sharded_checks(batch, shard_size, max_workers, compiled)
+        # Checks without a map/reduce form (e.g. registered later) run on the whole batch
+        return {
+            flag_name: sharded[flag_name] if flag_name in sharded else
+            _run_profiled_check(flag_name, batch, compiled, profiler)
+            for flag_name in RED_FLAG_CHECKS
+        }
+
+    # Tokenize once up front so parallel checks share (and never race on) the features
+    with profiler.span("text_features", reviews=len(batch)):
+        get_text_features(batch, compiled)
+
+    if executor == "threads":
+        parent = profiler.current_path()
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            # Each check runs in a copy of the caller's context, so its events reach local subscribers
+            futures = {flag_name: pool.submit(contextvars.copy_context().run, _run_profiled_check,
+                                              flag_name, batch, compiled, profiler, parent)
+                       for flag_name in RED_FLAG_CHECKS}
+            return {flag_name: future.result() for flag_name, future in futures.items()}
+
+    # Processes: ship the columns once per worker (results only hold review positions);
+    # the compiled config travels as its settings and is rebuilt once per worker
+    with profiler.span("checks", reviews=len(batch), executor=executor):
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                                 initargs=(batch.columnar(),)) as pool:
+            futures = {flag_name: pool.submit(_run_check_in_worker, flag_name, compiled)
+                       for flag_name in RED_FLAG_CHECKS}
+            return {flag_name: future.result() for flag_name, future in futures.items()}
+
+
+def analyze_data(reviews: Union[List[Dict], ReviewBatch, Iterable[Dict]], executor: str = "serial",
+                 max_workers: int = None, shard_size: int = None, compiled: CompiledConfig = None,
+                 profiler: Profiler = None) -> Dict:
+    """
+    Main analysis function. Runs all 9 red flag checks.
+    The reviews are converted into a columnar ReviewBatch once and shared by every check.
+
+    Any other iterable (a generator over API pages or file rows) is analyzed in
+    streaming mode with bounded memory instead (see src/streaming.py): counts
+    are exact where that is cheap, suspicious_indices hold a sample of stream
+    positions, and the report carries a "streaming" section instead of
+    review_flags; the executor options do not apply.
+
+    Suspicious reviews are reported as positions in ``reviews``
+    ("suspicious_indices"), not as copies of the review dicts, and
+    "review_flags" packs every check's verdict per review into one uint16
+    bitset (bit FLAG_BITS[flag_name]), so the trusted subset is one
+    vectorized mask operation.
+
+    The checks are independent, so they can run in parallel:
+        "serial"     one after another (default)
+        "threads"    thread pool; the NumPy-heavy checks release the GIL
+        "processes"  process pool; each worker receives the columnar batch once
+                     (no review dicts)
+        "sharded"    map/reduce for very large review sets: the reviews are split
+                     into shards, every shard is analyzed in a worker process and
+                     the partial results are merged exactly (see
+                     src/sharded_analysis.py)
+    Results are merged in the fixed check order, so the report (including
+    total_score_impact and triggered_flags) is identical for every executor.
+
+    All checks read one CompiledConfig snapshot (src/compiled_config.py),
+    compiled from the current config.py unless one is passed in, so a
+    config variant (compile_config(overrides)) reaches every executor,
+    worker processes included.
+
+    With a profiler (src/profiling.py), the analysis records an
+    "analyze_data" span with a child span per check (wall time, CPU time,
+    review count, optionally peak allocations); checks run in worker
+    processes are timed together as one "checks" span.
+
+    Args:
+        reviews (Union[List[Dict], ReviewBatch, Iterable[Dict]]): Review dictionaries from scraper,
+            a prebuilt batch, or a review iterator to analyze in streaming mode
+        executor (str): "serial", "threads", "processes" or "sharded" (default: "serial")
+        max_workers (int, optional): Worker count for the parallel executors
+        shard_size (int, optional): Reviews per shard for "sharded" (default: ANALYSIS_SHARD_SIZE)
+        compiled (CompiledConfig, optional): Configuration snapshot (default: current config)
+        profiler (Profiler, optional): Collects timing spans (default: no timing)
 
     Returns:
         Dict: Complete analysis report with all red flags
@@ -448,36 +1002,47 @@ def analyze_data(reviews: List[Dict]) -> Dict:
                 "sentiment_imbalance": {...},
                 "review_length_extremes": {...},
                 "verified_ratio": {...},
-                "repetitive_phrases": {...}
+                "repetitive_phrases": {...},
+                "near_duplicates": {...}
             },
             "total_score_impact": float,
-            "triggered_flags": List[str]
+            "triggered_flags": List[str],
+            "review_flags": np.ndarray  # uint16 per review
         }
     """
-    print(f"\n🔍 Running analysis on {len(reviews)} reviews...")
+    profiler = profiler or NULL_PROFILER
+
+    if not isinstance(reviews, (list, tuple, ReviewBatch)):
+        from src.streaming import analyze_stream
+        with profiler.span("analyze_data", mode="streaming"):
+            return analyze_stream(reviews, compiled=compiled)
+
+    with profiler.span("analyze_data", reviews=len(reviews), executor=executor):
+        return _analyze_batch(reviews, executor, max_workers, shard_size, compiled, profiler)
+
+
+def _analyze_batch(reviews: Union[List[Dict], ReviewBatch], executor: str, max_workers: int,
+                   shard_size: int, compiled: CompiledConfig, profiler: Profiler) -> Dict:
+    """
+    Runs the checks over an in-memory review list or batch (see analyze_data).
+    """
+    events.info("analysis.started", f"\n🔍 Running analysis on {len(reviews)} reviews...", reviews=len(reviews))
+
+    with profiler.span("review_batch", reviews=len(reviews)):
+        batch = ReviewBatch.from_reviews(reviews)
 
     analysis_report = {
-        "total_reviews": len(reviews),
+        "total_reviews": len(batch),
         "red_flags": {},
         "total_score_impact": 0,
         "triggered_flags": []
     }
 
-    # Run all 8 checks
-    checks = {
-        "review_velocity": check_review_velocity,
-        "generic_praise": check_generic_praise,
-        "suspicious_reviewers": check_suspicious_reviewers,
-        "linguistic_anomalies": check_linguistic_anomalies,
-        "sentiment_imbalance": check_sentiment_imbalance,
-        "review_length_extremes": check_review_length_extremes,
-        "verified_ratio": check_verified_ratio,
-        "repetitive_phrases": check_repetitive_phrases
-    }
+    # Run all 9 checks
+    results = _run_checks(batch, executor, max_workers, shard_size, compiled, profiler)
 
-    for flag_name, check_function in checks.items():
-        print(f"  ⚡ Checking: {flag_name.replace('_', ' ').title()}")
-        result = check_function(reviews)
+    for flag_name, result in results.items():
+        events.info("analysis.check", f"  ⚡ Checking: {flag_name.replace('_', ' ').title()}", flag=flag_name)
         analysis_report["red_flags"][flag_name] = result
 
         # Track impact and triggered flags
@@ -485,18 +1050,68 @@ def analyze_data(reviews: List[Dict]) -> Dict:
             analysis_report["total_score_impact"] += result["score_impact"]
             if result["score_impact"] < 0:  # Penalty
                 analysis_report["triggered_flags"].append(flag_name)
-            print(f"     ⚠️  {result['details']} (Impact: {result['score_impact']:+.1f})")
+            events.info("analysis.check_triggered",
+                        f"     ⚠️  {result['details']} (Impact: {result['score_impact']:+.1f})",
+                        flag=flag_name, score_impact=result["score_impact"], details=result["details"])
         else:
-            print(f"     ✓ No issues detected")
+            events.info("analysis.check_passed", "     ✓ No issues detected", flag=flag_name)
 
-    print(f"\n📊 Analysis complete. Total score impact: {analysis_report['total_score_impact']:+.1f}")
-    print(f"🚩 Flags triggered: {len(analysis_report['triggered_flags'])}")
+    analysis_report["review_flags"] = review_flag_bits(len(batch), analysis_report["red_flags"])
+
+    events.info("analysis.complete",
+                f"\n📊 Analysis complete. Total score impact: {analysis_report['total_score_impact']:+.1f}",
+                total_score_impact=analysis_report["total_score_impact"])
+    events.info("analysis.complete", f"🚩 Flags triggered: {len(analysis_report['triggered_flags'])}",
+                triggered_flags=analysis_report["triggered_flags"])
 
     return analysis_report
 
 
 # Example usage
 if __name__ == "__main__":
+    import random
+
+    def _check_review_velocity_bruteforce(reviews: List[Dict]) -> Tuple[int, List[Dict]]:
+        """Reference O(n^2) velocity scan (the original algorithm)."""
+        dated_reviews = sorted((r for r in reviews if r.get("date")), key=lambda x: x["date"])
+        window = timedelta(hours=config.VELOCITY_THRESHOLD_HOURS)
+
+        best_count, best_members = 0, []
+        for review in dated_reviews:
+            members = [r for r in dated_reviews if review["date"] <= r["date"] <= review["date"] + window]
+            if len(members) > best_count:
+                best_count, best_members = len(members), members
+
+        return best_count, best_members
+
+    # Cross-check the velocity window engine against the brute-force scan
+    rng = random.Random(42)
+    for trial in range(200):
+        start = datetime(2024, 1, 1)
+        spread_days = rng.choice([1, 3, 30, 365])
+        randomized_reviews = [
+            {
+                "date": start + timedelta(seconds=rng.randint(0, spread_days * 86400)) if rng.random() > 0.1 else None,
+                "review_text": f"review {i}"
+            }
+            for i in range(rng.randint(0, 120))
+        ]
+
+        velocity = check_review_velocity(randomized_reviews)
+        expected_count, expected_members = _check_review_velocity_bruteforce(randomized_reviews)
+
+        if velocity["triggered"]:
+            members = [randomized_reviews[i] for i in velocity["suspicious_indices"]]
+            assert members == expected_members, f"trial {trial}: members differ"
+            assert velocity["details"].startswith(f"{expected_count} reviews"), f"trial {trial}: count differs"
+        elif len([r for r in randomized_reviews if r["date"]]) >= 10:
+            assert expected_count / len([r for r in randomized_reviews if r["date"]]) < config.VELOCITY_THRESHOLD_PERCENTAGE
+    print("✓ Velocity window engine matches brute-force scan on 200 randomized inputs")
+
+    # Burst limit 0 ("more than 0 reviews in the window"): every dated author is bursty
+    zero_limit = compile_config({"REVIEWER_RED_FLAGS": dict(config.REVIEWER_RED_FLAGS, reviews_in_short_time=0)})
+    assert _author_burst_mask(np.array([0, 1]), np.array([0, 10**9]), 3, zero_limit).tolist() == [True, True, False]
+
     # Test with dummy data
     test_reviews = [
         {
@@ -0,0 +1,204 @@
+"""
+Project Veritas - Benchmark Suite
+Times analyze_data, generate_full_report and every red flag check on synthetic
+corpora of growing size, recording throughput and peak memory to a results file
+"""
+
+import sys
+import os
+import json
+import time
+import uuid
+import platform
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Sequence
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src import events
+from src.synthetic import generate_corpus
+from src.analyzer import analyze_data
+from src.scorer import generate_full_report
+from src.profiling import Profiler
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+# Corpus sizes benchmarked by default
+BENCHMARK_SIZES = (1_000, 10_000, 100_000, 1_000_000)
+
+# Default results file (one JSON object per stage and size, appended)
+BENCHMARK_RESULTS_FILE = "benchmark_results.jsonl"
+
+
+def _peak_rss_bytes() -> int:
+    """
+    High-water mark of this process's resident memory (None where unavailable).
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024  # Linux reports KiB
+
+
+def benchmark_size(size: int, seed: int = 0, executor: str = "serial", trace_memory: bool = False) -> List[Dict]:
+    """
+    Benchmarks the pipeline on one synthetic corpus, in the current process.
+
+    Stages (span paths of src/profiling.py):
+        generate                          synthetic corpus generation (not pipeline cost)
+        analyze_data                      the whole analysis, from review dicts
+        analyze_data/review_batch         columnar batch construction
+        analyze_data/text_features        shared tokenization pass (serial/threads executors)
+        analyze_data/check:<flag>         each red flag check (serial/threads executors)
+        analyze_data/checks               all checks (processes/sharded executors)
+        generate_full_report              scoring and report, from review dicts
+
+    Args:
+        size (int): Number of reviews
+        seed (int): Corpus seed (default: 0)
+        executor (str): analyze_data executor (default: "serial")
+        trace_memory (bool): Record each stage's peak Python allocations with
+            tracemalloc (slows the stages down, so timings are not comparable
+            with untraced runs; default: False)
+
+    Returns:
+        List[Dict]: One record per stage: {"size", "stage", "wall_seconds", "cpu_seconds",
+        "reviews_per_second", "peak_alloc_bytes", "peak_rss_bytes"}
+    """
+    profiler = Profiler(trace_memory=trace_memory)
+
+    with profiler.span("generate", reviews=size):
+        reviews = generate_corpus(size, seed=seed)["reviews"]
+
+    analysis = analyze_data(reviews, executor=executor, profiler=profiler)
+    with profiler.span("generate_full_report", reviews=size):
+        generate_full_report(reviews, analysis, "https://www.amazon.com/dp/BENCHMARK")
+
+    peak_rss_bytes = _peak_rss_bytes()
+    records = []
+    for span in profiler.timings():
+        wall_seconds = span["wall_seconds"]
+        records.append({
+            "size": size,
+            "stage": span["path"],
+            "wall_seconds": wall_seconds,
+            "cpu_seconds": span["cpu_seconds"],
+            "reviews_per_second": size / wall_seconds if wall_seconds > 0 else None,
+            "peak_alloc_bytes": span["peak_alloc_bytes"],
+            "peak_rss_bytes": peak_rss_bytes
+        })
+    return records
+
+
+def run_benchmarks(sizes: Sequence[int] = BENCHMARK_SIZES, seed: int = 0, executor: str = "serial",
+                   trace_memory: bool = False, output_file: str = BENCHMARK_RESULTS_FILE,
+                   isolate: bool = True) -> List[Dict]:
+    """
+    Benchmarks every corpus size and appends the records to a JSONL results file.
+
+    Each size runs in a fresh worker process by default, so its peak RSS
+    (peak_rss_bytes, the process high-water mark) belongs to that size alone
+    and no cache warmed by a smaller run flatters a larger one.
+
+    Args:
+        sizes (Sequence[int]): Corpus sizes (default: 1k, 10k, 100k, 1M)
+        seed (int): Corpus seed (default: 0)
+        executor (str): analyze_data executor (default: "serial")
+        trace_memory (bool): Also record per-stage peak allocations (slower; default: False)
+        output_file (str, optional): JSONL file to append to (None to skip writing)
+        isolate (bool): Run each size in its own process (default: True)
+
+    Returns:
+        List[Dict]: Every stage record, tagged with the run ID, environment and settings
+    """
+    run = {
+        "run": uuid.uuid4().hex,
+        "time": time.time(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "seed": seed,
+        "executor": executor,
+        "trace_memory": trace_memory
+    }
+
+    results = []
+    for size in sizes:
+        events.info("benchmark.size_started", f"\n⏱️  Benchmarking {size:,} reviews...", size=size)
+        if isolate:
+            context = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+                records = pool.submit(benchmark_size, size, seed, executor, trace_memory).result()
+        else:
+            records = benchmark_size(size, seed, executor, trace_memory)
+
+        records = [dict(run, **record) for record in records]
+        if output_file:
+            with open(output_file, "a") as f:
+                for record in records:
+                    f.write(json.dumps(record) + "\n")
+        results.extend(records)
+
+        for record in records:
+            peak = record["peak_alloc_bytes"]
+            events.info(
+                "benchmark.stage",
+                f"   {record['stage']:<45} {record['wall_seconds'] * 1000:10.1f} ms "
+                f"{record['reviews_per_second'] or 0:14,.0f} reviews/s"
+                + (f" {peak / 2**20:9.1f} MiB peak" if peak is not None else ""),
+                size=size, stage=record["stage"], wall_seconds=record["wall_seconds"],
+                reviews_per_second=record["reviews_per_second"], peak_alloc_bytes=peak
+            )
+        events.info("benchmark.size_complete", f"   Peak RSS: {records[0]['peak_rss_bytes'] / 2**20:,.0f} MiB"
+                    if records[0]["peak_rss_bytes"] else "", size=size)
+
+    return results
+
+
+def main():
+    """
+    Command-line interface for the benchmark suite.
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Project Veritas - Pipeline benchmarks on synthetic review corpora",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Full suite: 1k, 10k, 100k and 1M reviews
+  python src/benchmark.py
+
+  # Quick run with per-stage peak allocations
+  python src/benchmark.py --sizes 1000 10000 --trace-memory
+        """
+    )
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(BENCHMARK_SIZES),
+                        help='Corpus sizes (default: 1000 10000 100000 1000000)')
+    parser.add_argument('--seed', type=int, default=0, help='Corpus seed (default: 0)')
+    parser.add_argument('--executor', choices=['serial', 'threads', 'processes', 'sharded'], default='serial',
+                        help='How to run the red flag checks (default: serial)')
+    parser.add_argument('--trace-memory', action='store_true',
+                        help='Record per-stage peak allocations with tracemalloc (slower)')
+    parser.add_argument('-o', '--output', type=str, default=BENCHMARK_RESULTS_FILE,
+                        help=f'JSONL results file to append to (default: {BENCHMARK_RESULTS_FILE})')
+    args = parser.parse_args()
+
+    def print_benchmark_event(record):
+        if record["event"].startswith("benchmark."):
+            print(record["message"])
+
+    with events.subscribed(print_benchmark_event):
+        run_benchmarks(args.sizes, seed=args.seed, executor=args.executor, trace_memory=args.trace_memory,
+                       output_file=args.output)
+    print(f"\n✅ Results appended to: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,497 @@
+"""
+Project Veritas - Threshold Calibration
+Evaluates thousands of config.py combinations against labeled products (known fake /
+known genuine) by broadcasting each combination's thresholds, penalties and grade scale
+over per-product statistics read from cached features, and reports precision/recall
+"""
+
+import sys
+import os
+import json
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Sequence, Union
+import numpy as np
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src import events
+from src.compiled_config import CompiledConfig, compile_config, current_settings
+from src.rescoring import FeatureCache
+from src.analyzer import (
+    _densest_windows, _generic_praise_mask, _suspicious_author_mask, _sorted_author_burst_mask,
+    _linguistic_anomaly_mask, _length_extreme_mask
+)
+
+
+# Per-product statistics the Trust Score is decided from (one row per product)
+STATISTICS = (
+    "velocity_share",             # densest VELOCITY_THRESHOLD_HOURS window / dated reviews (-inf: too few dates)
+    "generic_count",              # generic praise reviews
+    "suspicious_reviewer_share",  # suspicious authors / authors (-inf: none)
+    "linguistic_count",           # reviews with linguistic anomalies
+    "five_star_share",            # 5-star / rated reviews (-inf: no ratings)
+    "one_star_share",             # 1-star / rated reviews (-inf: no ratings)
+    "length_extreme_count",       # extremely short or long reviews
+    "verified_share",             # verified purchases / reviews
+    "repetitive_phrases",         # 1 if some phrase repeats often enough
+    "near_duplicates",            # 1 if some near-duplicate cluster exists
+    "image_count",                # reviews with images
+    "detailed_count",             # reviews in the 'detailed review' length range
+    "rated_count",                # reviews with a rating
+    "three_star_share",           # 3-star / rated reviews (0: no ratings)
+    "four_star_share"             # 4-star / rated reviews (0: no ratings)
+)
+
+_STAT = {name: position for position, name in enumerate(STATISTICS)}
+
+# Settings applied by broadcasting over the statistics. Any other setting in a
+# grid changes the statistics themselves (which reviews a check counts), so
+# every distinct combination of those is extracted once per product.
+SCORE_PARAMETERS = (
+    "STARTING_TRUST_SCORE",
+    "VELOCITY_THRESHOLD_PERCENTAGE", "VELOCITY_PENALTY",
+    "GENERIC_PENALTY_PER_REVIEW",
+    "SUSPICIOUS_REVIEWER_THRESHOLD", "SUSPICIOUS_REVIEWER_PENALTY",
+    "LINGUISTIC_PENALTY_PER_REVIEW",
+    "FIVE_STAR_THRESHOLD", "BIMODAL_THRESHOLD", "SENTIMENT_IMBALANCE_PENALTY",
+    "LENGTH_EXTREME_PENALTY_PER_REVIEW",
+    "VERIFIED_LOW_THRESHOLD", "VERIFIED_HIGH_THRESHOLD", "VERIFIED_LOW_PENALTY", "VERIFIED_HIGH_BONUS",
+    "REPETITIVE_PHRASE_PENALTY",
+    "NEAR_DUPLICATE_PENALTY",
+    "IMAGE_BONUS_PER_REVIEW", "DETAILED_REVIEW_BONUS",
+    "BALANCED_DISTRIBUTION_BONUS", "BALANCED_DISTRIBUTION_CRITERIA",
+    "GRADE_SCALE"
+)
+
+# Metrics a calibration can rank configurations by
+METRICS = ("f1", "precision", "recall", "accuracy")
+
+# Configurations broadcast together (bounds the configs x products work arrays)
+_CONFIG_CHUNK_SIZE = 2048
+
+
+def config_grid(grid: Dict[str, Sequence]) -> List[Dict[str, Any]]:
+    """
+    Expands candidate values per setting into every combination.
+
+    Args:
+        grid (Dict[str, Sequence]): Setting name -> candidate values,
+            e.g. {"FIVE_STAR_THRESHOLD": [0.6, 0.7, 0.8], "VELOCITY_PENALTY": [-10, -15, -20]}
+
+    Returns:
+        List[Dict[str, Any]]: One overrides dict per combination (last setting varies fastest)
+    """
+    names = list(grid)
+    current_settings({name: None for name in names})  # Fail early on unknown names
+    return [dict(zip(names, values)) for values in itertools.product(*(grid[name] for name in names))]
+
+
+def product_statistics(cache: FeatureCache, compiled: CompiledConfig = None) -> np.ndarray:
+    """
+    Reads one product's STATISTICS from its feature cache.
+
+    Args:
+        cache (FeatureCache): The product's cached features
+        compiled (CompiledConfig, optional): Configuration snapshot (default: current config);
+            only its non-SCORE_PARAMETERS settings matter
+
+    Returns:
+        np.ndarray: float64 value per STATISTICS entry
+    """
+    compiled = compiled or compile_config()
+    view = cache.view(compiled)
+    statistics = np.zeros(len(STATISTICS), dtype=np.float64)
+
+    # Velocity (the check needs at least 10 dated reviews)
+    statistics[_STAT["velocity_share"]] = -np.inf
+    if len(cache.dated_indices) >= 10:
+        hours = compiled.VELOCITY_THRESHOLD_HOURS
+        count = _densest_windows(cache.dated_epochs, [hours])[hours][0]
+        statistics[_STAT["velocity_share"]] = count / len(cache.dated_indices)
+
+    statistics[_STAT["generic_count"]] = np.count_nonzero(_generic_praise_mask(view, compiled))
+
+    suspicious_authors = np.count_nonzero(
+        _suspicious_author_mask(cache.reviews_per_author, cache.pair_authors, cache.pair_counts, compiled) |
+        _sorted_author_burst_mask(cache.sorted_authors, cache.sorted_epochs, cache.author_count, compiled)
+    )
+    statistics[_STAT["suspicious_reviewer_share"]] = (
+        suspicious_authors / cache.author_count if suspicious_authors else -np.inf
+    )
+
+    statistics[_STAT["linguistic_count"]] = np.count_nonzero(_linguistic_anomaly_mask(view, compiled))
+    statistics[_STAT["length_extreme_count"]] = np.count_nonzero(_length_extreme_mask(view, compiled))
+
+    rated_count = cache.rated_count
+    statistics[_STAT["rated_count"]] = rated_count
+    if rated_count:
+        statistics[_STAT["five_star_share"]] = cache.rating_counts[5.0] / rated_count
+        statistics[_STAT["one_star_share"]] = cache.rating_counts[1.0] / rated_count
+        statistics[_STAT["three_star_share"]] = cache.rating_counts[3.0] / rated_count
+        statistics[_STAT["four_star_share"]] = cache.rating_counts[4.0] / rated_count
+    else:
+        statistics[_STAT["five_star_share"]] = -np.inf
+        statistics[_STAT["one_star_share"]] = -np.inf
+
+    statistics[_STAT["verified_share"]] = cache.verified_count / len(cache)
+
+    index = cache.ngram_index(compiled.REPETITIVE_PHRASE_MIN_LENGTH)
+    statistics[_STAT["repetitive_phrases"]] = len(index.repeated(compiled.REPETITIVE_PHRASE_COUNT)) > 0
+    statistics[_STAT["near_duplicates"]] = len(cache.near_duplicate_clusters(compiled)) > 0
+
+    lengths = view.review_length
+    statistics[_STAT["image_count"]] = cache.image_count
+    statistics[_STAT["detailed_count"]] = np.count_nonzero(
+        (lengths >= compiled.DETAILED_REVIEW_MIN_LENGTH) & (lengths <= compiled.DETAILED_REVIEW_MAX_LENGTH)
+    )
+
+    return statistics
+
+
+def _statistics_worker(product: Union[FeatureCache, str], variants: List[CompiledConfig]) -> np.ndarray:
+    """
+    Extracts one product's statistics for every statistics variant (loading the cache file if given a path).
+    """
+    cache = FeatureCache.load(product) if isinstance(product, str) else product
+    return np.stack([product_statistics(cache, compiled) for compiled in variants])
+
+
+def collect_statistics(products: Sequence[Union[FeatureCache, str]], variants: List[CompiledConfig],
+                       executor: str = "processes", max_workers: int = None) -> np.ndarray:
+    """
+    Extracts the statistics of every product under every statistics variant.
+
+    Args:
+        products (Sequence[Union[FeatureCache, str]]): Feature caches, or paths of saved caches
+            (paths keep worker processes from receiving whole caches)
+        variants (List[CompiledConfig]): Configurations differing in non-SCORE_PARAMETERS settings
+        executor (str): "serial" or "processes" (default: "processes", one product per task)
+        max_workers (int, optional): Process pool size
+
+    Returns:
+        np.ndarray: float64 array of shape (variants, products, STATISTICS)
+    """
+    if executor not in ("serial", "processes"):
+        raise ValueError(f"Unknown executor '{executor}'. Choose one of: serial, processes")
+
+    if executor == "serial" or len(products) < 2:
+        per_product = [_statistics_worker(product, variants) for product in products]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            per_product = list(pool.map(_statistics_worker, products, itertools.repeat(variants)))
+
+    return np.stack(per_product, axis=1) if per_product else np.zeros((len(variants), 0, len(STATISTICS)))
+
+
+def _parameter_arrays(configs: List[Dict[str, Any]], compiled: CompiledConfig) -> Dict[str, np.ndarray]:
+    """
+    Gathers every SCORE_PARAMETERS value of the configs into (configs, 1) columns
+    (grade scales as padded threshold/letter tables), defaulting to ``compiled``.
+    """
+    def column(name: str, read=lambda value: value) -> np.ndarray:
+        default = getattr(compiled, name)
+        return np.array([read(config.get(name, default)) for config in configs], dtype=np.float64)[:, None]
+
+    arrays = {name: column(name) for name in SCORE_PARAMETERS
+              if name not in ("BALANCED_DISTRIBUTION_CRITERIA", "GRADE_SCALE")}
+    for criterion in ("three_star_min", "four_star_min", "five_star_max"):
+        arrays[criterion] = column("BALANCED_DISTRIBUTION_CRITERIA", lambda criteria: criteria[criterion])
+
+    # Grade scales: ascending thresholds, padded with +inf so scales of any size stack
+    scales = [sorted(config.get("GRADE_SCALE", compiled.GRADE_SCALE).items()) for config in configs]
+    width = max(len(scale) for scale in scales)
+    arrays["grade_thresholds"] = np.full((len(configs), width), np.inf)
+    arrays["grade_letters"] = np.full((len(configs), width + 1), "F", dtype=object)
+    for row, scale in enumerate(scales):
+        arrays["grade_thresholds"][row, :len(scale)] = [threshold for threshold, _ in scale]
+        arrays["grade_letters"][row, :len(scale)] = [letter for _, letter in scale]
+
+    return arrays
+
+
+def trust_scores(statistics: np.ndarray, configs: List[Dict[str, Any]],
+                 compiled: CompiledConfig = None) -> Dict[str, np.ndarray]:
+    """
+    Computes the Trust Score and grade of every product under every configuration at once.
+
+    Each check's verdict is a comparison between a product statistic (row
+    vector) and a configuration's threshold (column vector), so the whole
+    configs x products table comes out of a handful of broadcast operations,
+    with the arithmetic of calculate_trust_score + calculate_additional_bonuses.
+
+    Args:
+        statistics (np.ndarray): (products, STATISTICS) values from product_statistics
+        configs (List[Dict[str, Any]]): Overrides per configuration; their non-SCORE_PARAMETERS
+            settings must be the ones the statistics were extracted with
+        compiled (CompiledConfig, optional): Snapshot providing the settings a config leaves out
+
+    Returns:
+        Dict[str, np.ndarray]: {"score": (configs, products) float64,
+                                "grade": (configs, products) letters}
+    """
+    compiled = compiled or compile_config()
+    p = _parameter_arrays(configs, compiled)
+
+    def stat(name: str) -> np.ndarray:
+        return statistics[:, _STAT[name]][None, :]
+
+    total_impact = np.zeros((len(configs), len(statistics)))
+
+    # Same check order (and so the same float sums) as analyze_data
+    total_impact = total_impact + np.where(stat("velocity_share") >= p["VELOCITY_THRESHOLD_PERCENTAGE"],
+                                           p["VELOCITY_PENALTY"], 0)
+    total_impact = total_impact + np.where(stat("generic_count") > 0,
+                                           p["GENERIC_PENALTY_PER_REVIEW"] * stat("generic_count"), 0)
+    total_impact = total_impact + np.where(stat("suspicious_reviewer_share") >= p["SUSPICIOUS_REVIEWER_THRESHOLD"],
+                                           p["SUSPICIOUS_REVIEWER_PENALTY"], 0)
+    total_impact = total_impact + np.where(stat("linguistic_count") > 0,
+                                           p["LINGUISTIC_PENALTY_PER_REVIEW"] * stat("linguistic_count"), 0)
+
+    five, one = stat("five_star_share"), stat("one_star_share")
+    imbalanced = (five >= p["FIVE_STAR_THRESHOLD"]) | (
+        (five >= p["BIMODAL_THRESHOLD"]) & (one >= p["BIMODAL_THRESHOLD"]) & (five + one > 0.80)
+    )
+    total_impact = total_impact + np.where(imbalanced, p["SENTIMENT_IMBALANCE_PENALTY"], 0)
+    total_impact = total_impact + np.where(stat("length_extreme_count") > 0,
+                                           p["LENGTH_EXTREME_PENALTY_PER_REVIEW"] * stat("length_extreme_count"), 0)
+
+    verified = stat("verified_share")
+    total_impact = total_impact + np.where(
+        verified < p["VERIFIED_LOW_THRESHOLD"], p["VERIFIED_LOW_PENALTY"],
+        np.where(verified >= p["VERIFIED_HIGH_THRESHOLD"], p["VERIFIED_HIGH_BONUS"], 0)
+    )
+    total_impact = total_impact + np.where(stat("repetitive_phrases") > 0, p["REPETITIVE_PHRASE_PENALTY"], 0)
+    total_impact = total_impact + np.where(stat("near_duplicates") > 0, p["NEAR_DUPLICATE_PENALTY"], 0)
+
+    score = np.clip(p["STARTING_TRUST_SCORE"] + total_impact, 0, 100)
+
+    # Additional bonuses (images, detailed reviews, balanced distribution)
+    bonus = (np.zeros_like(score)
+             + p["IMAGE_BONUS_PER_REVIEW"] * stat("image_count")
+             + p["DETAILED_REVIEW_BONUS"] * stat("detailed_count"))
+    balanced = ((stat("rated_count") > 0) &
+                (stat("three_star_share") >= p["three_star_min"]) &
+                (stat("four_star_share") >= p["four_star_min"]) &
+                (five <= p["five_star_max"]))
+    bonus = bonus + np.where(balanced, p["BALANCED_DISTRIBUTION_BONUS"], 0)
+    score = np.minimum(100, score + bonus)
+
+    # Grade: last threshold <= score of each config's scale ("F" below all of them)
+    positions = (np.clip(score, 0, 100)[:, :, None] >= p["grade_thresholds"][:, None, :]).sum(axis=2) - 1
+    positions = np.where(positions >= 0, positions, p["grade_thresholds"].shape[1])
+    grades = np.take_along_axis(p["grade_letters"], positions, axis=1)
+
+    return {"score": score, "grade": grades}
+
+
+def _classification_metrics(predicted_fake: np.ndarray, is_fake: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Confusion counts and metrics per configuration (rows) for the "fake" class.
+    """
+    true_positive = np.count_nonzero(predicted_fake & is_fake, axis=1)
+    false_positive = np.count_nonzero(predicted_fake & ~is_fake, axis=1)
+    false_negative = np.count_nonzero(~predicted_fake & is_fake, axis=1)
+    true_negative = np.count_nonzero(~predicted_fake & ~is_fake, axis=1)
+
+    precision = np.divide(true_positive, true_positive + false_positive,
+                          out=np.zeros(len(true_positive)), where=(true_positive + false_positive) > 0)
+    recall = np.divide(true_positive, true_positive + false_negative,
+                       out=np.zeros(len(true_positive)), where=(true_positive + false_negative) > 0)
+    f1 = np.divide(2 * precision * recall, precision + recall,
+                   out=np.zeros(len(true_positive)), where=(precision + recall) > 0)
+
+    return {
+        "true_positive": true_positive,
+        "false_positive": false_positive,
+        "false_negative": false_negative,
+        "true_negative": true_negative,
+        "precision": precision,
+        "recall": recall,
+        "f1": f1,
+        "accuracy": (true_positive + true_negative) / max(is_fake.shape[1], 1)
+    }
+
+
+def calibrate(products: Sequence[Union[FeatureCache, str]], labels: Sequence[bool],
+              grid: Union[Dict[str, Sequence], List[Dict[str, Any]]], fake_grades: Sequence[str] = ("D", "F"),
+              metric: str = "f1", top: int = 10, executor: str = "processes", max_workers: int = None) -> Dict:
+    """
+    Scores every configuration of a grid against labeled products and ranks them.
+
+    A product is predicted fake when its Trust grade is one of ``fake_grades``.
+    Statistics are extracted once per product for every distinct combination
+    of the grid's non-SCORE_PARAMETERS settings (in parallel, one product per
+    task); all other settings, GRADE_SCALE included, are evaluated by
+    broadcasting over those statistics, a chunk of configurations at a time.
+    The Quality Score does not enter the verdict and is not computed.
+
+    Args:
+        products (Sequence[Union[FeatureCache, str]]): Feature caches (or saved cache paths)
+        labels (Sequence[bool]): True for known-fake products, False for known-genuine ones
+        grid (Union[Dict[str, Sequence], List[Dict[str, Any]]]): Candidate values per setting
+            (see config_grid), or an explicit list of overrides dicts
+        fake_grades (Sequence[str]): Trust grades counted as "fake" (default: D and F)
+        metric (str): Ranking metric: "f1", "precision", "recall" or "accuracy" (default: "f1")
+        top (int): Number of best configurations to report (default: 10)
+        executor (str): "serial" or "processes" for the statistics extraction
+        max_workers (int, optional): Process pool size
+
+    Returns:
+        Dict: {
+            "products": int,
+            "fake_products": int,
+            "configs_evaluated": int,
+            "metric": str,
+            "best": List[Dict],  # overrides + confusion counts + precision/recall/f1/accuracy
+            "precision": np.ndarray, "recall": np.ndarray, "f1": np.ndarray,
+            "accuracy": np.ndarray   # one entry per configuration, in grid order
+        }
+    """
+    if metric not in METRICS:
+        raise ValueError(f"Unknown metric '{metric}'. Choose one of: {', '.join(METRICS)}")
+    if len(products) != len(labels):
+        raise ValueError(f"Got {len(products)} products but {len(labels)} labels")
+
+    configs = config_grid(grid) if isinstance(grid, dict) else list(grid)
+    is_fake = np.asarray(labels, dtype=bool)[None, :]
+
+    # Group the configurations by the settings that change the statistics
+    variant_groups = {}
+    for position, overrides in enumerate(configs):
+        variant = {name: value for name, value in overrides.items() if name not in SCORE_PARAMETERS}
+        variant_groups.setdefault(json.dumps(variant, sort_keys=True, default=str), (variant, []))[1].append(position)
+    variants = [compile_config(variant) for variant, _ in variant_groups.values()]
+
+    events.info("calibration.started", f"\n🎛️  Calibrating {len(configs)} configurations on {len(products)} products "
+                f"({len(variants)} statistics variant(s))...",
+                configs=len(configs), products=len(products), variants=len(variants))
+    statistics = collect_statistics(products, variants, executor, max_workers)
+
+    metrics = {name: np.zeros(len(configs)) for name in METRICS}
+    confusion = {name: np.zeros(len(configs), dtype=np.int64)
+                 for name in ("true_positive", "false_positive", "false_negative", "true_negative")}
+
+    for variant_index, (compiled, (_, positions)) in enumerate(zip(variants, variant_groups.values())):
+        for start in range(0, len(positions), _CONFIG_CHUNK_SIZE):
+            chunk = positions[start:start + _CONFIG_CHUNK_SIZE]
+            scored = trust_scores(statistics[variant_index], [configs[position] for position in chunk], compiled)
+            predicted_fake = np.isin(scored["grade"], list(fake_grades))
+            results = _classification_metrics(predicted_fake, is_fake)
+            for name in METRICS:
+                metrics[name][chunk] = results[name]
+            for name in confusion:
+                confusion[name][chunk] = results[name]
+
+    # Best first; ties keep grid order
+    ranking = np.argsort(-metrics[metric], kind="stable")[:top]
+    best = []
+    for position in ranking.tolist():
+        entry = {"overrides": configs[position]}
+        entry.update({name: int(values[position]) for name, values in confusion.items()})
+        entry.update({name: float(values[position]) for name, values in metrics.items()})
+        best.append(entry)
+
+    if best:
+        events.info("calibration.best", f"🏆 Best {metric}: {best[0][metric]:.3f} "
+                    f"(precision {best[0]['precision']:.3f}, recall {best[0]['recall']:.3f})",
+                    metric=metric, value=best[0][metric], overrides=best[0]["overrides"])
+
+    return {
+        "products": len(products),
+        "fake_products": int(np.count_nonzero(is_fake)),
+        "configs_evaluated": len(configs),
+        "metric": metric,
+        "best": best,
+        **metrics
+    }
+
+
+def load_labeled_products(manifest_path: str) -> Dict[str, List]:
+    """
+    Reads a labeled dataset manifest: a JSON list of {"cache": path, "fake": bool}
+    entries, cache paths relative to the manifest (feature caches saved with
+    ``main.py --feature-cache``).
+
+    Args:
+        manifest_path (str): Manifest file path
+
+    Returns:
+        Dict[str, List]: {"products": cache paths, "labels": fake flags}, ready for calibrate()
+    """
+    with open(manifest_path) as f:
+        entries = json.load(f)
+    base = os.path.dirname(os.path.abspath(manifest_path))
+    return {
+        "products": [os.path.join(base, entry["cache"]) for entry in entries],
+        "labels": [bool(entry["fake"]) for entry in entries]
+    }
+
+
+# Example usage
+if __name__ == "__main__":
+    import time
+    import random
+    from datetime import datetime, timedelta
+    from src.rescoring import cache_features, rescore
+
+    words = ("great product amazing love it works well battery life the and is this was very good bad broke "
+             "returned refund cheap quality excellent highly recommend would buy again size fits color").split()
+
+    def synthetic_product(rng: random.Random, fake: bool) -> List[Dict]:
+        """Fake products lean on 5-star bursts, unverified buyers and templates."""
+        templates = [" ".join(rng.choice(words) for _ in range(12)) for _ in range(3)]
+        reviews = []
+        for _ in range(rng.randint(40, 200)):
+            text = (rng.choice(templates) if rng.random() < (0.4 if fake else 0.05) else
+                    " ".join(rng.choice(words) for _ in range(rng.randint(3, 60))))
+            reviews.append({
+                "rating": rng.choice([5.0, 5.0, 5.0, 4.0] if fake else [1.0, 2.0, 3.0, 4.0, 4.0, 5.0]),
+                "title": rng.choice(words),
+                "review_text": text,
+                "date": datetime(2024, 1, 1) + timedelta(hours=rng.randint(0, 60 if fake else 4000)),
+                "author": f"user{rng.randint(0, 30 if fake else 500)}",
+                "verified_purchase": rng.random() < (0.45 if fake else 0.85),
+                "has_images": rng.random() < (0.02 if fake else 0.15),
+                "review_length": len(text)
+            })
+        return reviews
+
+    rng = random.Random(5)
+    labels = [rng.random() < 0.4 for _ in range(60)]
+    caches = [cache_features(synthetic_product(rng, fake)) for fake in labels]
+
+    grid = {
+        "GENERIC_MIN_LENGTH": [20, 40],
+        "FIVE_STAR_THRESHOLD": [0.6, 0.7, 0.75, 0.8, 0.9],
+        "VERIFIED_LOW_THRESHOLD": [0.4, 0.5, 0.6, 0.7],
+        "VELOCITY_PENALTY": [-10, -15, -20, -30],
+        "SENTIMENT_IMBALANCE_PENALTY": [-10, -20, -30],
+        "VERIFIED_LOW_PENALTY": [-10, -15, -25],
+        "GRADE_SCALE": [{90: "A", 75: "B", 60: "C", 45: "D", 0: "F"},
+                        {95: "A", 85: "B", 70: "C", 55: "D", 0: "F"},
+                        {80: "A", 60: "B", 40: "C", 20: "D"}]
+    }
+    configs = config_grid(grid)
+
+    # Cross-check: broadcast scores must equal rescore() for sampled configurations
+    for overrides in random.Random(1).sample(configs, 25):
+        variant = {name: value for name, value in overrides.items() if name not in SCORE_PARAMETERS}
+        compiled = compile_config(variant)
+        statistics = collect_statistics(caches, [compiled], executor="serial")[0]
+        scored = trust_scores(statistics, [overrides], compiled)
+        for product, cache in enumerate(caches):
+            expected = rescore(cache, overrides)["report"]
+            assert round(scored["score"][0, product], 1) == expected["trust_score"], (overrides, product)
+            assert scored["grade"][0, product] == expected["trust_grade"], (overrides, product)
+
+    start = time.perf_counter()
+    calibration = calibrate(caches, labels, grid)
+    elapsed = time.perf_counter() - start
+
+    print(f"✓ Broadcast Trust Scores match rescore() for 25 sampled configurations")
+    print(f"⏱️  {calibration['configs_evaluated']} configurations x {len(caches)} products in {elapsed:.2f}s")
+    for entry in calibration["best"][:3]:
+        print(f"   f1 {entry['f1']:.3f}  precision {entry['precision']:.3f}  recall {entry['recall']:.3f}  "
+              f"{entry['overrides']}")
@@ -0,0 +1,247 @@
+"""
+Project Veritas - Compiled Configuration
+Snapshot of config.py with everything the checks and scorer derive from it
+(phrase automata, regexes, stopword sets, grade lookup arrays, thresholds)
+built once per configuration variant
+"""
+
+import sys
+import os
+import re
+import copy
+import hashlib
+import threading
+from bisect import bisect_right
+from collections import OrderedDict
+from typing import Dict, Any
+import numpy as np
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config
+from src.phrase_matcher import get_matcher
+
+
+# Common words ignored when looking for keyword stuffing
+COMMON_WORDS = frozenset({
+    "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for", "of",
+    "with", "is", "was", "are", "this", "that", "it"
+})
+
+# Excessive punctuation (!!!!, ????)
+PUNCTUATION_RUN_PATTERN = re.compile(r'[!?]{4,}')
+
+# Compiled snapshots kept for reuse (least recently used ones are dropped first)
+COMPILED_CONFIG_CACHE_SIZE = 32
+
+_compiled_cache = OrderedDict()
+_compiled_cache_lock = threading.Lock()
+
+
+# Snapshot of the default configuration (compile_config() without overrides), until refresh_config()
+_default_compiled = None
+
+
+# Values that are already hashable and immutable
+_SCALAR_TYPES = (int, float, str, bool, type(None))
+
+
+def _freeze(value: Any) -> Any:
+    """
+    Turns a config value into a hashable equivalent (lists -> tuples, dicts -> sorted item tuples).
+    """
+    if type(value) in _SCALAR_TYPES:
+        return value
+    if isinstance(value, dict):
+        return ("__dict__",) + tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return ("__set__",) + tuple(sorted(_freeze(item) for item in value))
+    return value
+
+
+def settings_fingerprint(settings: Dict[str, Any]) -> str:
+    """
+    Hex digest of a settings dictionary (same settings, same digest, in every process).
+
+    Args:
+        settings (Dict[str, Any]): Setting name -> value
+
+    Returns:
+        str: 32-character hex digest
+    """
+    return hashlib.blake2b(repr(_freeze(settings)).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def current_settings(overrides: Dict[str, Any] = None) -> Dict[str, Any]:
+    """
+    Reads every setting (upper-case name) of config.py, with optional overrides applied.
+
+    Args:
+        overrides (Dict[str, Any], optional): Setting name -> value replacing the config.py value
+
+    Returns:
+        Dict[str, Any]: Setting name -> value
+    """
+    settings = {name: value for name, value in vars(config).items() if name.isupper()}
+    if overrides:
+        unknown = sorted(set(overrides) - set(settings))
+        if unknown:
+            raise ValueError(f"Unknown config setting(s): {', '.join(unknown)}")
+        settings.update(overrides)
+    return settings
+
+
+class CompiledConfig:
+    """
+    Immutable snapshot of the configuration used by one analysis run.
+
+    Every config.py setting is available under its own name
+    (``compiled.VELOCITY_PENALTY``), copied when the snapshot is built, so
+    later edits to config.py do not leak into a run already in progress.
+    Derived values are precomputed once:
+
+        generic_phrases          lowercased GENERIC_PHRASES
+        negative_keywords        QUALITY_NEGATIVE_KEYWORDS
+        phrase_key               both lists, identifying the phrase-hit text features
+        generic_matcher          Aho-Corasick automaton for generic_phrases
+        negative_matcher         Aho-Corasick automaton for negative_keywords
+        common_words             stopwords ignored by the keyword stuffing check
+        punctuation_run_pattern  compiled '!!!!' / '????' regex
+        velocity_window_hours    burst windows plus the penalty window, deduplicated
+        reviewer_burst_limit     REVIEWER_RED_FLAGS["reviews_in_short_time"]
+        reviewer_window_seconds  REVIEWER_RED_FLAGS["days_window"] in seconds
+        same_rating_percentage   REVIEWER_RED_FLAGS["same_rating_percentage"]
+        grade_thresholds         GRADE_SCALE thresholds, ascending (np.ndarray)
+        grade_letters            letter of each threshold
+        fingerprint              hex digest of the settings (same settings, same digest)
+
+    Snapshots are obtained from compile_config(), which caches one per
+    configuration variant. They pickle as their settings and are rebuilt on
+    unpickling, so worker processes get the caller's configuration.
+    """
+
+    def __init__(self, settings: Dict[str, Any]):
+        self.settings = copy.deepcopy(settings)
+        for name, value in self.settings.items():
+            setattr(self, name, value)
+
+        self.generic_phrases = tuple(phrase.lower() for phrase in self.GENERIC_PHRASES)
+        self.negative_keywords = tuple(self.QUALITY_NEGATIVE_KEYWORDS)
+        self.phrase_key = (self.generic_phrases, self.negative_keywords)
+        self.generic_matcher = get_matcher(self.generic_phrases)
+        self.negative_matcher = get_matcher(self.negative_keywords)
+
+        self.common_words = COMMON_WORDS
+        self.punctuation_run_pattern = PUNCTUATION_RUN_PATTERN
+
+        self.velocity_window_hours = list(dict.fromkeys(
+            list(self.VELOCITY_BURST_WINDOWS_HOURS) + [self.VELOCITY_THRESHOLD_HOURS]
+        ))
+        self.reviewer_burst_limit = self.REVIEWER_RED_FLAGS["reviews_in_short_time"]
+        self.reviewer_window_seconds = self.REVIEWER_RED_FLAGS["days_window"] * 86400
+        self.same_rating_percentage = self.REVIEWER_RED_FLAGS["same_rating_percentage"]
+
+        thresholds = sorted(self.GRADE_SCALE)
+        self.grade_thresholds = np.array(thresholds, dtype=np.float64)
+        self.grade_letters = tuple(self.GRADE_SCALE[threshold] for threshold in thresholds)
+        self._grade_threshold_list = [float(threshold) for threshold in thresholds]
+
+        self.fingerprint = settings_fingerprint(self.settings)
+
+    def fingerprint_without(self, prefix: str) -> str:
+        """
+        Fingerprint of the settings whose names do not start with ``prefix``.
+
+        Args:
+            prefix (str): Setting name prefix to leave out, e.g. "REPORT_CACHE_"
+
+        Returns:
+            str: 32-character hex digest
+        """
+        return settings_fingerprint(
+            {name: value for name, value in self.settings.items() if not name.startswith(prefix)}
+        )
+
+    def __reduce__(self):
+        return (CompiledConfig, (self.settings,))
+
+    def grade(self, score: float) -> str:
+        """
+        Converts a numeric score (0-100) to a letter grade with the precomputed scale.
+
+        Args:
+            score (float): Numeric score (0-100)
+
+        Returns:
+            str: Letter grade
+        """
+        position = bisect_right(self._grade_threshold_list, max(0, min(100, score))) - 1
+        return self.grade_letters[position] if position >= 0 else "F"
+
+    def grades(self, scores: np.ndarray) -> np.ndarray:
+        """
+        Converts an array of scores to letter grades in one vectorized lookup.
+
+        Args:
+            scores (np.ndarray): Numeric scores (0-100)
+
+        Returns:
+            np.ndarray: Letter grade per score
+        """
+        positions = np.searchsorted(self.grade_thresholds, np.clip(scores, 0, 100), side="right") - 1
+        letters = np.array(self.grade_letters + ("F",))
+        return letters[np.where(positions >= 0, positions, len(self.grade_letters))]
+
+
+def compile_config(overrides: Dict[str, Any] = None) -> CompiledConfig:
+    """
+    Returns the compiled snapshot of the current configuration (plus overrides).
+
+    Snapshots are cached by their settings, so each configuration variant is
+    compiled once per process. Calls with overrides re-read config.py every
+    time; the default snapshot (no overrides) is read once and memoized, so
+    the ``compiled or compile_config()`` default of every check costs one
+    global read. Code that changes config.py settings at runtime
+    (``config.VELOCITY_PENALTY = -20``, ``config.GENERIC_PHRASES.append(...)``)
+    must call refresh_config() afterwards.
+
+    Args:
+        overrides (Dict[str, Any], optional): Setting name -> value, e.g. {"VELOCITY_PENALTY": -20}
+
+    Returns:
+        CompiledConfig: Shared, read-only snapshot
+    """
+    global _default_compiled
+    if not overrides and _default_compiled is not None:
+        return _default_compiled
+
+    settings = current_settings(overrides)
+    key = _freeze(settings)
+
+    with _compiled_cache_lock:
+        compiled = _compiled_cache.get(key)
+        if compiled is not None:
+            _compiled_cache.move_to_end(key)
+
+    if compiled is None:
+        compiled = CompiledConfig(settings)
+        with _compiled_cache_lock:
+            _compiled_cache[key] = compiled
+            while len(_compiled_cache) > COMPILED_CONFIG_CACHE_SIZE:
+                _compiled_cache.popitem(last=False)
+
+    if not overrides:
+        _default_compiled = compiled
+    return compiled
+
+
+def refresh_config() -> None:
+    """
+    Forgets the memoized default snapshot, so the next compile_config() re-reads
+    config.py. Call it after changing any config.py setting at runtime.
+    """
+    global _default_compiled
+    _default_compiled = None
@@ -0,0 +1,278 @@
+"""
+Project Veritas - Structured Events
+Leveled progress and diagnostic events with subscriber callbacks, so the CLI, the
+Streamlit UI or a service each decide what to show, and nothing is formatted or
+written when nobody listens
+"""
+
+import sys
+import os
+import time
+import threading
+import contextvars
+from collections import Counter
+from contextlib import contextmanager
+from typing import List, Dict, Callable, Iterator
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+# Event levels (same values as the logging module)
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+
+LEVEL_NAMES = {DEBUG: "debug", INFO: "info", WARNING: "warning", ERROR: "error"}
+
+# Minimum level when nobody is subscribed: above every level, so emit() returns at once
+_NO_SUBSCRIBERS = ERROR + 1
+
+
+class EventEmitter:
+    """
+    Dispatches events to subscribed callbacks.
+
+    Every event is a dict:
+
+        time      Unix timestamp
+        level     "debug", "info", "warning" or "error"
+        event     dotted event name, e.g. "scraper.page_scraped"
+        message   the human-readable line (what the CLI prints)
+        ...       event-specific fields (page, reviews, flag, score, ...)
+
+    Each callback subscribes with a minimum level. emit() first compares the
+    level with the lowest subscribed level and returns before building the
+    event, so disabled events cost one comparison; code emitting from a hot
+    loop also checks enabled() first so it does not even format the message.
+    Callbacks run synchronously in the emitting thread, in subscription order.
+
+    Subscriptions are process-wide by default. A ``local`` subscription only
+    receives the events emitted in the subscribing context (its thread, or a
+    contextvars copy of it, e.g. an asyncio task), so concurrent runs in one
+    process, such as the sessions of the Streamlit app, each see only their
+    own events. Code fanning work out to a thread pool submits the tasks in
+    a copy of the context (contextvars.copy_context().run) so their events
+    still reach the run's local subscribers.
+    """
+
+    def __init__(self):
+        self._subscribers = ()
+        self._local_subscribers = contextvars.ContextVar(f"event_subscribers_{id(self)}", default=())
+        self._local_levels = Counter()  # Levels of the local subscriptions of every context
+        self._min_level = _NO_SUBSCRIBERS
+        self._lock = threading.Lock()
+
+    def _update_min_level(self) -> None:
+        levels = [level for level, _ in self._subscribers] + [level for level, count in self._local_levels.items()
+                                                               if count]
+        self._min_level = min(levels, default=_NO_SUBSCRIBERS)
+
+    def subscribe(self, callback: Callable[[Dict], None], level: int = INFO,
+                  local: bool = False) -> Callable[[Dict], None]:
+        """
+        Registers a callback for events at ``level`` or above.
+
+        Args:
+            callback (Callable[[Dict], None]): Receives each event dict
+            level (int): Minimum level (default: INFO)
+            local (bool): Only receive the events emitted in the current context
+                (thread) instead of every event of the process (default: False)
+
+        Returns:
+            Callable[[Dict], None]: The callback (pass it to unsubscribe)
+        """
+        with self._lock:
+            if local:
+                self._local_subscribers.set(self._local_subscribers.get() + ((level, callback),))
+                self._local_levels[level] += 1
+            else:
+                self._subscribers = self._subscribers + ((level, callback),)
+            self._update_min_level()
+        return callback
+
+    def unsubscribe(self, callback: Callable[[Dict], None]) -> None:
+        """
+        Removes a callback registered with subscribe() (a local one from the current context).
+        """
+        with self._lock:
+            self._subscribers = tuple(
+                (level, subscriber) for level, subscriber in self._subscribers if subscriber is not callback
+            )
+            local_subscribers = self._local_subscribers.get()
+            for level, subscriber in local_subscribers:
+                if subscriber is callback:
+                    self._local_levels[level] -= 1
+            self._local_subscribers.set(tuple(
+                (level, subscriber) for level, subscriber in local_subscribers if subscriber is not callback
+            ))
+            self._update_min_level()
+
+    @contextmanager
+    def subscribed(self, callback: Callable[[Dict], None], level: int = INFO,
+                   local: bool = False) -> Iterator[Callable[[Dict], None]]:
+        """
+        Subscribes a callback for the duration of a with-block (see subscribe).
+        """
+        self.subscribe(callback, level, local)
+        try:
+            yield callback
+        finally:
+            self.unsubscribe(callback)
+
+    def enabled(self, level: int) -> bool:
+        """
+        Returns whether any subscriber (in any context) may want events at this level.
+        """
+        return level >= self._min_level
+
+    def emit(self, level: int, event: str, message: str = "", **fields) -> None:
+        """
+        Sends an event to every subscriber whose level it reaches.
+
+        Args:
+            level (int): DEBUG, INFO, WARNING or ERROR
+            event (str): Dotted event name
+            message (str): Human-readable line
+            **fields: Event-specific values
+        """
+        if level < self._min_level:
+            return
+
+        record = {"time": time.time(), "level": LEVEL_NAMES.get(level, str(level)), "event": event,
+                  "message": message}
+        record.update(fields)
+        for subscriber_level, callback in self._subscribers + self._local_subscribers.get():
+            if level >= subscriber_level:
+                callback(record)
+
+
+# Process-wide emitter used by every module
+EVENTS = EventEmitter()
+
+
+def emit(level: int, event: str, message: str = "", **fields) -> None:
+    """
+    Emits an event on the shared emitter (see EventEmitter.emit).
+    """
+    if level >= EVENTS._min_level:
+        EVENTS.emit(level, event, message, **fields)
+
+
+def debug(event: str, message: str = "", **fields) -> None:
+    """
+    Emits a DEBUG event on the shared emitter.
+    """
+    if DEBUG >= EVENTS._min_level:
+        EVENTS.emit(DEBUG, event, message, **fields)
+
+
+def info(event: str, message: str = "", **fields) -> None:
+    """
+    Emits an INFO event on the shared emitter.
+    """
+    if INFO >= EVENTS._min_level:
+        EVENTS.emit(INFO, event, message, **fields)
+
+
+def warning(event: str, message: str = "", **fields) -> None:
+    """
+    Emits a WARNING event on the shared emitter.
+    """
+    if WARNING >= EVENTS._min_level:
+        EVENTS.emit(WARNING, event, message, **fields)
+
+
+def error(event: str, message: str = "", **fields) -> None:
+    """
+    Emits an ERROR event on the shared emitter.
+    """
+    if ERROR >= EVENTS._min_level:
+        EVENTS.emit(ERROR, event, message, **fields)
+
+
+def enabled(level: int) -> bool:
+    """
+    Returns whether the shared emitter has a subscriber at this level
+    (check before formatting expensive debug messages).
+    """
+    return level >= EVENTS._min_level
+
+
+subscribe = EVENTS.subscribe
+unsubscribe = EVENTS.unsubscribe
+subscribed = EVENTS.subscribed
+
+
+def console_printer(stream=None) -> Callable[[Dict], None]:
+    """
+    Returns a callback printing each event's message, like the console output of the CLI.
+
+    Args:
+        stream (optional): File to write to (default: sys.stdout at the time of each event)
+
+    Returns:
+        Callable[[Dict], None]: Subscriber callback
+    """
+    def print_event(record: Dict) -> None:
+        print(record["message"], file=stream or sys.stdout)
+    return print_event
+
+
+class EventRecorder:
+    """
+    Subscriber callback keeping every event it receives (e.g. to render them in a UI afterwards).
+    """
+
+    def __init__(self):
+        self.records = []
+        self._lock = threading.Lock()
+
+    def __call__(self, record: Dict) -> None:
+        with self._lock:
+            self.records.append(record)
+
+    def messages(self) -> List[str]:
+        """
+        Returns the messages of the recorded events, in order.
+        """
+        with self._lock:
+            return [record["message"] for record in self.records]
+
+
+# Example usage
+if __name__ == "__main__":
+    import timeit
+
+    recorder = EventRecorder()
+    with subscribed(recorder, level=INFO):
+        info("demo.stage", "Stage one", stage=1)
+        debug("demo.detail", "Not recorded")
+        warning("demo.problem", "Something odd", code=7)
+    info("demo.stage", "Nobody listens")
+
+    assert [record["event"] for record in recorder.records] == ["demo.stage", "demo.problem"]
+    assert recorder.records[1]["level"] == "warning" and recorder.records[1]["code"] == 7
+    assert not enabled(DEBUG)
+
+    # Local subscriptions only see the events of their own thread
+    seen = {}
+
+    def session(name):
+        recorder = EventRecorder()
+        with subscribed(recorder, local=True):
+            for step in range(50):
+                info("demo.session", name, step=step)
+        seen[name] = recorder.messages()
+
+    sessions = [threading.Thread(target=session, args=(name,)) for name in ("a", "b", "c")]
+    for thread in sessions:
+        thread.start()
+    for thread in sessions:
+        thread.join()
+    assert all(messages == [name] * 50 for name, messages in seen.items())
+    assert not enabled(INFO)
+
+    disabled_cost = timeit.timeit(lambda: debug("demo.hot", "x", review=1), number=200000) / 200000
+    print(f"✓ Events reach matching subscribers only; a disabled event costs {disabled_cost * 1e9:.0f} ns")
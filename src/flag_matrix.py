@@ -0,0 +1,129 @@
+"""
+Project Veritas - Per-Review Flag Matrix
+Writes one verdict record per review (stable review ID, one bit per red flag,
+trusted or not) for downstream pipelines, as JSON Lines or a columnar NumPy file
+"""
+
+import sys
+import os
+import json
+from typing import Dict
+import numpy as np
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.review_batch import ReviewBatch
+from src.analyzer import FLAG_BITS
+
+
+# Supported output formats, by file extension
+FLAG_MATRIX_FORMATS = {".jsonl": "jsonl", ".npz": "npz"}
+
+# JSONL records written per write() call
+_JSONL_CHUNK_SIZE = 10000
+
+
+def flag_matrix_format(path: str, output_format: str = None) -> str:
+    """
+    Resolves the output format from the explicit argument or the file extension.
+
+    Args:
+        path (str): Output file path
+        output_format (str, optional): "jsonl" or "npz"
+
+    Returns:
+        str: The format to write
+    """
+    if output_format is None:
+        output_format = FLAG_MATRIX_FORMATS.get(os.path.splitext(path)[1].lower())
+    if output_format not in FLAG_MATRIX_FORMATS.values():
+        raise ValueError(
+            f"Unknown flag matrix format for '{path}' (use a .jsonl or .npz file, or output_format='jsonl'/'npz')"
+        )
+    return output_format
+
+
+def write_flag_matrix(batch: ReviewBatch, review_flags: np.ndarray, trusted: np.ndarray,
+                      path: str, output_format: str = None) -> Dict:
+    """
+    Writes the per-review verdicts straight from the analysis bitset.
+
+    Every record holds the review's position, its stable review ID, the raw
+    flag bitset (bit FLAG_BITS[flag] is set when that check listed the review,
+    whether or not the check triggered), one 0/1 field per flag, and whether
+    the review made it into the trusted subset used for the Quality Score.
+
+    Formats:
+        "jsonl"  one JSON object per line, review IDs as 16-digit hex strings
+                 (JSON numbers cannot carry 64-bit integers safely)
+        "npz"    compressed NumPy columns: index, review_id (uint64),
+                 flags (uint16), trusted (bool), flag_names
+
+    Args:
+        batch (ReviewBatch): The analyzed reviews
+        review_flags (np.ndarray): uint16 bitset per review (analysis_report["review_flags"])
+        trusted (np.ndarray): Boolean trusted mask per review
+        path (str): Output file path
+        output_format (str, optional): "jsonl" or "npz" (default: from the extension)
+
+    Returns:
+        Dict: Descriptor for the report: {"path", "format", "records", "flags"}
+    """
+    output_format = flag_matrix_format(path, output_format)
+    flag_names = list(FLAG_BITS)
+
+    if output_format == "npz":
+        np.savez_compressed(
+            path,
+            index=np.arange(len(batch), dtype=np.int64),
+            review_id=batch.review_ids,
+            flags=review_flags.astype(np.uint16),
+            trusted=trusted.astype(bool),
+            flag_names=np.array(flag_names)
+        )
+    else:
+        # Flag columns are unpacked once for all reviews, then written in chunks
+        flag_columns = [((review_flags & np.uint16(bit)) != 0).astype(np.int8).tolist()
+                        for bit in FLAG_BITS.values()]
+        review_ids = batch.review_ids.tolist()
+        flags = review_flags.tolist()
+        trusted = trusted.tolist()
+
+        with open(path, "w") as f:
+            for start in range(0, len(batch), _JSONL_CHUNK_SIZE):
+                lines = []
+                for i in range(start, min(start + _JSONL_CHUNK_SIZE, len(batch))):
+                    record = {"index": i, "review_id": f"{review_ids[i]:016x}", "flags": flags[i],
+                              "trusted": trusted[i]}
+                    for flag_name, column in zip(flag_names, flag_columns):
+                        record[flag_name] = column[i]
+                    lines.append(json.dumps(record))
+                f.write("\n".join(lines) + "\n")
+
+    return {"path": path, "format": output_format, "records": len(batch), "flags": flag_names}
+
+
+def read_flag_matrix(path: str, output_format: str = None) -> Dict[str, np.ndarray]:
+    """
+    Loads a flag matrix written by write_flag_matrix back into columns.
+
+    Args:
+        path (str): Flag matrix file
+        output_format (str, optional): "jsonl" or "npz" (default: from the extension)
+
+    Returns:
+        Dict[str, np.ndarray]: index, review_id, flags, trusted columns
+    """
+    if flag_matrix_format(path, output_format) == "npz":
+        with np.load(path) as data:
+            return {name: data[name] for name in ("index", "review_id", "flags", "trusted")}
+
+    with open(path) as f:
+        records = [json.loads(line) for line in f if line.strip()]
+    return {
+        "index": np.array([record["index"] for record in records], dtype=np.int64),
+        "review_id": np.array([int(record["review_id"], 16) for record in records], dtype=np.uint64),
+        "flags": np.array([record["flags"] for record in records], dtype=np.uint16),
+        "trusted": np.array([record["trusted"] for record in records], dtype=bool)
+    }
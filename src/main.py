@@ -6,18 +6,29 @@ Master orchestrator that ties together scraping, analysis, and scoring.
 import sys
 import os
 import json
-from typing import Dict
+import contextlib
+import traceback
+from typing import Dict, Union
 
 # Add parent directory to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import config
+from src import events, utils
 from src.scraper import scrape_reviews
 from src.analyzer import analyze_data
 from src.scorer import generate_full_report
+from src.review_batch import ReviewBatch
+from src.rescoring import cache_features
+from src.profiling import Profiler, export_timings
+from src.compiled_config import compile_config
+from src.report_cache import ReportCache, review_fingerprint, config_fingerprint
 
 
-def run_veritas(url: str, output_file: str = None, verbose: bool = True) -> Dict:
+def run_veritas(url: str, output_file: str = None, verbose: bool = True, executor: str = "serial",
+                flags_output: str = None, feature_cache: str = None, timings_output: str = None,
+                profile_memory: bool = False, debug: bool = False,
+                report_cache: Union[str, ReportCache] = None, cache_max_age: float = None) -> Dict:
     """
     Master function for Project Veritas.
     Scrapes reviews, analyzes for red flags, and generates Trust + Quality scores.
@@ -25,42 +36,107 @@ def run_veritas(url: str, output_file: str = None, verbose: bool = True) -> Dict
     Args:
         url (str): Amazon product URL to analyze
         output_file (str, optional): Path to save JSON report. If None, doesn't save.
-        verbose (bool): Whether to print progress messages (default: True)
+        verbose (bool): Whether to print progress messages (default: True). Progress is
+            emitted as events (see src/events.py); verbose subscribes a console printer
+            to this run's events (local to the calling thread) for the duration of the
+            run, and other subscribers receive them either way.
+        executor (str): How to run the red flag checks: "serial", "threads", "processes" or "sharded"
+        flags_output (str, optional): Path (.jsonl or .npz) for the per-review flag matrix. If None, doesn't write it.
+        feature_cache (str, optional): Path to save the feature cache for rescoring config variants
+            (see src/rescoring.py). If None, doesn't save it.
+        timings_output (str, optional): Path to export the stage timings to, as Prometheus text (.prom)
+            or a JSONL trace (.jsonl, appended). If None, they are only attached to the report.
+        profile_memory (bool): Also record peak allocations per stage (slower; default: False)
+        debug (bool): Also print debug events when verbose (default: False)
+        report_cache (Union[str, ReportCache], optional): Report cache file (or an open
+            ReportCache, see src/report_cache.py). Default: config.REPORT_CACHE_FILE, None to disable.
+            When the fetched reviews and the configuration match a cached report, it is
+            returned without re-running the analysis and the scoring. Runs writing
+            flags_output or feature_cache still analyze (and refresh the cache).
+        cache_max_age (float, optional): Return an ASIN's cached report without even
+            re-fetching its reviews if it is at most this many seconds old
+            (default: config.REPORT_CACHE_MAX_AGE_SECONDS; 0 always re-fetches)
 
     Returns:
-        Dict: Complete Veritas report with Trust and Quality scores
+        Dict: Complete Veritas report with Trust and Quality scores, plus "timings":
+        one span per stage (scrape, review_batch, report_cache, analyze_data with
+        a span per check, report, feature_cache) with wall time, CPU time and
+        review count (see src/profiling.py), and with a report cache, "cache":
+        {"status": "hit", "miss" or "bypass", "lookup", "key", "age_seconds" (hits),
+        "hits", "misses" (totals of the cache file)}
 
     Example:
         >>> report = run_veritas("https://amazon.com/dp/B08N5WRWNW")
         >>> print(f"Trust Score: {report['trust_score']}")
         >>> print(f"Quality Score: {report['quality_score']}")
     """
+    printer = events.console_printer()
+    level = events.DEBUG if debug else events.INFO
+    if report_cache is None:
+        report_cache = config.REPORT_CACHE_FILE
+    if cache_max_age is None:
+        cache_max_age = config.REPORT_CACHE_MAX_AGE_SECONDS
+
+    with contextlib.ExitStack() as stack:
+        if verbose:
+            stack.enter_context(events.subscribed(printer, level, local=True))
+        cache = report_cache
+        if cache and not isinstance(cache, ReportCache):
+            cache = stack.enter_context(ReportCache(cache))
+
+        report = _run_veritas(url, output_file, executor, flags_output, feature_cache, timings_output,
+                              profile_memory, cache or None, cache_max_age)
+        if verbose and "error" not in report:
+            print_report_summary(report)
+    return report
+
 
-    if verbose:
-        print("\n" + "="*60)
-        print("🚀 PROJECT VERITAS - FINDING TRUTH IN REVIEWS")
-        print("="*60)
-        print(f"🔗 URL: {url}\n")
+def _run_veritas(url: str, output_file: str, executor: str, flags_output: str, feature_cache: str,
+                 timings_output: str, profile_memory: bool, cache: ReportCache = None,
+                 cache_max_age: float = 0) -> Dict:
+    """
+    Runs the pipeline for run_veritas(), reporting progress as events.
+    """
+
+    profiler = Profiler(trace_memory=profile_memory)
+
+    # Side outputs need the analysis itself, so those runs never take a cached report
+    use_cached = cache is not None and not (flags_output or feature_cache)
+    if cache is not None:
+        asin = utils.extract_asin(url) or url
+        settings_fingerprint = config_fingerprint(compile_config())
+
+    events.info("veritas.started", "\n" + "="*60 + "\n🚀 PROJECT VERITAS - FINDING TRUTH IN REVIEWS\n" +
+                "="*60 + f"\n🔗 URL: {url}\n", url=url)
 
     try:
+        # A recent enough report of this ASIN is returned without re-fetching its reviews
+        if use_cached and cache_max_age:
+            with profiler.span("report_cache"):
+                cached = cache.latest(asin, settings_fingerprint, cache_max_age)
+            if cached is not None:
+                return _finish_report(cached, url, profiler, cache, output_file, timings_output)
+
         # ====================================================================
         # STEP 1: SCRAPE REVIEWS
         # ====================================================================
-        if verbose:
-            print("📥 STEP 1: SCRAPING REVIEWS")
-            print("-"*60)
+        events.info("veritas.stage", "📥 STEP 1: SCRAPING REVIEWS\n" + "-"*60, stage="scrape")
 
-        print(f"DEBUG: About to call scrape_reviews with URL: {url}")
-        reviews = scrape_reviews(url)
-        print(f"DEBUG: scrape_reviews returned {len(reviews) if reviews else 0} reviews")
+        events.debug("veritas.scrape_started", f"DEBUG: About to call scrape_reviews with URL: {url}", url=url)
+        with profiler.span("scrape"):
+            reviews = scrape_reviews(url)
+        events.debug("veritas.scrape_returned", f"DEBUG: scrape_reviews returned {len(reviews) if reviews else 0} reviews",
+                     reviews=len(reviews) if reviews else 0)
 
-        if reviews:
+        if reviews and events.enabled(events.DEBUG):
             # Debug: Check dates
             dates_parsed = sum(1 for r in reviews if r.get('date'))
-            print(f"DEBUG: {dates_parsed}/{len(reviews)} reviews have parsed dates")
+            events.debug("veritas.dates_parsed", f"DEBUG: {dates_parsed}/{len(reviews)} reviews have parsed dates",
+                         dates_parsed=dates_parsed, reviews=len(reviews))
             if dates_parsed > 0:
                 sample_review = next(r for r in reviews if r.get('date'))
-                print(f"DEBUG: Sample date: {sample_review.get('date')} (from raw: {sample_review.get('date_raw')})")
+                events.debug("veritas.sample_date",
+                             f"DEBUG: Sample date: {sample_review.get('date')} (from raw: {sample_review.get('date_raw')})")
 
         if not reviews:
             error_report = {
@@ -75,54 +151,58 @@ def run_veritas(url: str, output_file: str = None, verbose: bool = True) -> Dict
             }
             return error_report
 
-        if verbose:
-            print(f"\n✅ Scraping complete: {len(reviews)} reviews collected\n")
+        events.info("veritas.scrape_complete", f"\n✅ Scraping complete: {len(reviews)} reviews collected\n",
+                    reviews=len(reviews))
 
         # ====================================================================
         # STEP 2: ANALYZE FOR RED FLAGS
         # ====================================================================
-        if verbose:
-            print("🔍 STEP 2: ANALYZING FOR RED FLAGS")
-            print("-"*60)
+        events.info("veritas.stage", "🔍 STEP 2: ANALYZING FOR RED FLAGS\n" + "-"*60, stage="analyze")
 
-        analysis_report = analyze_data(reviews)
+        # Build the columnar batch once; analysis and scoring both reuse it
+        with profiler.span("review_batch", reviews=len(reviews)):
+            batch = ReviewBatch.from_reviews(reviews)
 
-        if verbose:
-            print(f"\n✅ Analysis complete: {len(analysis_report['triggered_flags'])} red flags detected\n")
+        # Same reviews, same settings: the cached report is the one this run would compute
+        if cache is not None:
+            reviews_fingerprint = review_fingerprint(batch.review_ids)
+            if use_cached:
+                with profiler.span("report_cache", reviews=len(batch)):
+                    cached = cache.get(asin, reviews_fingerprint, settings_fingerprint)
+                if cached is not None:
+                    return _finish_report(cached, url, profiler, cache, output_file, timings_output)
 
-        # ====================================================================
-        # STEP 3: CALCULATE SCORES AND GENERATE REPORT
-        # ====================================================================
-        if verbose:
-            print("🎯 STEP 3: CALCULATING SCORES")
-            print("-"*60)
+        analysis_report = analyze_data(batch, executor=executor, profiler=profiler)
 
-        report = generate_full_report(reviews, analysis_report, url)
+        events.info("veritas.analysis_complete",
+                    f"\n✅ Analysis complete: {len(analysis_report['triggered_flags'])} red flags detected\n",
+                    triggered_flags=len(analysis_report['triggered_flags']))
 
         # ====================================================================
-        # STEP 4: SAVE TO FILE (OPTIONAL)
+        # STEP 3: CALCULATE SCORES AND GENERATE REPORT
         # ====================================================================
-        if output_file:
-            if verbose:
-                print(f"\n💾 STEP 4: SAVING REPORT")
-                print("-"*60)
+        events.info("veritas.stage", "🎯 STEP 3: CALCULATING SCORES\n" + "-"*60, stage="score")
 
-            with open(output_file, 'w') as f:
-                json.dump(report, f, indent=2)
+        with profiler.span("report", reviews=len(batch)):
+            report = generate_full_report(batch, analysis_report, url, flags_output=flags_output)
 
-            if verbose:
-                print(f"✅ Report saved to: {output_file}\n")
+        # Cached features let analysts rescore config variants without re-scraping
+        if feature_cache:
+            with profiler.span("feature_cache", reviews=len(batch)):
+                cache_features(batch, url).save(feature_cache)
+            report["feature_cache_file"] = feature_cache
+            events.info("veritas.feature_cache_saved", f"🗃️  Feature cache saved to: {feature_cache}",
+                        path=feature_cache)
 
-        # ====================================================================
-        # DISPLAY RESULTS
-        # ====================================================================
-        if verbose:
-            print_report_summary(report)
+        if cache is not None:
+            with profiler.span("report_cache", reviews=len(batch)):
+                key = cache.put(asin, reviews_fingerprint, settings_fingerprint, report)
+            report["cache"] = {"status": "miss" if use_cached else "bypass", "key": key}
 
-        return report
+        return _finish_report(report, url, profiler, cache, output_file, timings_output)
 
     except ValueError as e:
-        print(f"\n❌ ERROR: {e}")
+        events.error("veritas.error", f"\n❌ ERROR: {e}", error=str(e))
         error_report = {
             "project": "Project Veritas",
             "url": url,
@@ -136,9 +216,9 @@ def run_veritas(url: str, output_file: str = None, verbose: bool = True) -> Dict
         return error_report
 
     except Exception as e:
-        print(f"\n❌ UNEXPECTED ERROR: {e}")
-        import traceback
-        traceback.print_exc()
+        details = traceback.format_exc()
+        events.error("veritas.unexpected_error", f"\n❌ UNEXPECTED ERROR: {e}", error=str(e), traceback=details)
+        events.debug("veritas.traceback", details)
         error_report = {
             "project": "Project Veritas",
             "url": url,
@@ -152,6 +232,43 @@ def run_veritas(url: str, output_file: str = None, verbose: bool = True) -> Dict
         return error_report
 
 
+def _finish_report(report: Dict, url: str, profiler: Profiler, cache: ReportCache, output_file: str,
+                   timings_output: str) -> Dict:
+    """
+    Attaches the run metadata (timings, cache totals) to a computed or cached
+    report, exports the timings and saves the report.
+    """
+    report["url"] = url
+    if cache is not None:
+        stats = cache.stats()
+        report["cache"].update(hits=stats["hits"], misses=stats["misses"])
+        if report["cache"]["status"] == "hit":
+            events.info("veritas.cache_hit",
+                        f"♻️  Cached report served ({report['cache']['age_seconds']:.0f}s old, "
+                        f"matched by {report['cache']['lookup']})",
+                        key=report["cache"]["key"], lookup=report["cache"]["lookup"],
+                        age_seconds=report["cache"]["age_seconds"])
+
+    report["timings"] = profiler.timings()
+    if timings_output:
+        export_timings(report["timings"], timings_output, labels={"url": url})
+        events.info("veritas.timings_exported", f"⏱️  Stage timings exported to: {timings_output}",
+                    path=timings_output)
+
+    # ====================================================================
+    # STEP 4: SAVE TO FILE (OPTIONAL)
+    # ====================================================================
+    if output_file:
+        events.info("veritas.stage", "\n💾 STEP 4: SAVING REPORT\n" + "-"*60, stage="save")
+
+        with open(output_file, 'w') as f:
+            json.dump(report, f, indent=2)
+
+        events.info("veritas.report_saved", f"✅ Report saved to: {output_file}\n", path=output_file)
+
+    return report
+
+
 def print_report_summary(report: Dict) -> None:
     """
     Prints a nicely formatted summary of the Veritas report.
@@ -211,6 +328,22 @@ Examples:
   # Save report to file
   python main.py https://amazon.com/dp/B08N5WRWNW --output report.json
 
+  # Also write per-review flags for downstream pipelines (.jsonl or .npz)
+  python main.py https://amazon.com/dp/B08N5WRWNW --flags-output flags.jsonl
+
+  # Save the feature cache, then try config variants with src/rescoring.py
+  python main.py https://amazon.com/dp/B08N5WRWNW --feature-cache features.pkl.gz
+
+  # Export per-stage timings (Prometheus textfile or JSONL trace)
+  python main.py https://amazon.com/dp/B08N5WRWNW --timings-output veritas.prom --profile-memory
+
+  # Cache reports: re-running on unchanged reviews skips the analysis,
+  # and within the max age (seconds) even the fetch
+  python main.py https://amazon.com/dp/B08N5WRWNW --report-cache .veritas/reports.sqlite --cache-max-age 3600
+
+  # Show debug events too
+  python main.py https://amazon.com/dp/B08N5WRWNW --debug
+
   # Quiet mode (no progress output)
   python main.py https://amazon.com/dp/B08N5WRWNW --quiet
         """
@@ -235,10 +368,68 @@ Examples:
         help='Suppress progress output (only show final report)'
     )
 
+    parser.add_argument(
+        '--debug',
+        action='store_true',
+        help='Also show debug events (scraper pages, API responses, parsed dates)'
+    )
+
+    parser.add_argument(
+        '--flags-output',
+        type=str,
+        default=None,
+        help='Output file path for per-review red flag verdicts, .jsonl or .npz (optional)'
+    )
+
+    parser.add_argument(
+        '--feature-cache',
+        type=str,
+        default=None,
+        help='Output file path for the feature cache used to rescore config variants (optional)'
+    )
+
+    parser.add_argument(
+        '--timings-output',
+        type=str,
+        default=None,
+        help='Export per-stage timings, .prom (Prometheus text) or .jsonl (trace) (optional)'
+    )
+
+    parser.add_argument(
+        '--profile-memory',
+        action='store_true',
+        help='Also record peak allocations per stage (slower)'
+    )
+
+    parser.add_argument(
+        '--report-cache',
+        type=str,
+        default=None,
+        help='SQLite report cache file (default: config.REPORT_CACHE_FILE)'
+    )
+
+    parser.add_argument(
+        '--cache-max-age',
+        type=float,
+        default=None,
+        help='Serve a cached report of the ASIN without re-fetching if at most this many seconds old '
+             '(default: config.REPORT_CACHE_MAX_AGE_SECONDS; 0 always re-fetches)'
+    )
+
+    parser.add_argument(
+        '--executor',
+        choices=['serial', 'threads', 'processes', 'sharded'],
+        default='serial',
+        help='How to run the red flag checks (default: serial)'
+    )
+
     args = parser.parse_args()
 
     # Run analysis
-    report = run_veritas(args.url, output_file=args.output, verbose=not args.quiet)
+    report = run_veritas(args.url, output_file=args.output, verbose=not args.quiet, executor=args.executor,
+                         flags_output=args.flags_output, feature_cache=args.feature_cache,
+                         timings_output=args.timings_output, profile_memory=args.profile_memory,
+                         debug=args.debug, report_cache=args.report_cache, cache_max_age=args.cache_max_age)
 
     # Print JSON output if quiet mode (for piping)
     if args.quiet:
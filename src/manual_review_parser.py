@@ -3,10 +3,18 @@ Project Veritas - Manual Review Parser
 Parses manually pasted Amazon reviews into structured format
 """
 
+import sys
+import os
 from typing import List, Dict
 from datetime import datetime
 import re
 
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.review import Review
+from src.date_parsing import parse_review_date
+
 
 def parse_manual_reviews(text: str) -> List[Dict]:
     """
@@ -39,7 +47,7 @@ def parse_manual_reviews(text: str) -> List[Dict]:
     return reviews
 
 
-def parse_single_review(text: str, review_number: int = 1) -> Dict:
+def parse_single_review(text: str, review_number: int = 1) -> Review:
     """
     Parse a single review block into structured format.
 
@@ -50,25 +58,15 @@ def parse_single_review(text: str, review_number: int = 1) -> Dict:
     - Review text
 
     Returns:
-        Dict: Structured review data
+        Review: Structured review data (read it like a dict)
     """
     if not text.strip():
         return None
 
     lines = text.strip().split('\n')
 
-    # Initialize review dict with defaults
-    review = {
-        "rating": None,
-        "title": "",
-        "review_text": "",
-        "date": None,
-        "date_raw": "",
-        "author": "Anonymous",
-        "verified_purchase": False,
-        "has_images": False,
-        "review_length": 0
-    }
+    # Initialize review record with defaults
+    review = Review(review_length=0)
 
     # Try to extract rating
     rating_match = re.search(r'(\d+(?:\.\d+)?)\s*(?:out of 5|stars?|\/5)', text, re.IGNORECASE)
@@ -91,11 +89,7 @@ def parse_single_review(text: str, review_number: int = 1) -> Dict:
         date_match = re.search(pattern, text, re.IGNORECASE)
         if date_match:
             review["date_raw"] = date_match.group(1)
-            try:
-                from dateutil import parser
-                review["date"] = parser.parse(date_match.group(1))
-            except:
-                pass
+            review["date"] = parse_review_date(date_match.group(1))
             break
 
     # Try to extract author
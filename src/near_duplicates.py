@@ -0,0 +1,247 @@
+"""
+Project Veritas - Near-Duplicate Review Clustering
+MinHash signatures + locality-sensitive hashing to group templated reviews that
+differ by a word or two, in roughly linear time (no all-pairs comparison)
+"""
+
+import sys
+import os
+from typing import List, Tuple
+import numpy as np
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.compiled_config import CompiledConfig, compile_config
+from src.ngram_index import review_ngram_hashes, mix64
+
+
+# Fixed seeds so signatures (and therefore clusters) are reproducible between runs
+_SEED_RNG = np.random.default_rng(20240101)
+_MAX_PERMUTATIONS = 512
+_PERMUTATION_SEEDS = _SEED_RNG.integers(0, 2**63, size=_MAX_PERMUTATIONS, dtype=np.int64).astype(np.uint64)
+
+
+def choose_bands(num_perm: int, threshold: float) -> Tuple[int, int]:
+    """
+    Picks the LSH banding (bands x rows = num_perm) whose S-curve threshold
+    (1/bands)^(1/rows) is closest to, but not above, the Jaccard threshold,
+    so pairs at the threshold are found with high probability.
+
+    Args:
+        num_perm (int): MinHash signature length
+        threshold (float): Target Jaccard similarity
+
+    Returns:
+        Tuple[int, int]: (bands, rows per band)
+    """
+    best = (num_perm, 1)
+    best_gap = None
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows:
+            continue
+        bands = num_perm // rows
+        curve_threshold = (1.0 / bands) ** (1.0 / rows)
+        if curve_threshold > threshold:
+            continue
+        gap = threshold - curve_threshold
+        if best_gap is None or gap < best_gap:
+            best, best_gap = (bands, rows), gap
+    return best
+
+
+def minhash_signatures(shingles: np.ndarray, shingle_reviews: np.ndarray, review_count: int,
+                       num_perm: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Computes MinHash signatures for every review that has at least one shingle.
+
+    Each permutation is a seeded 64-bit mix of the shingle hash; the minimum per
+    review is taken with one reduceat over the flat shingle array, and the top
+    32 bits are kept to halve memory.
+
+    Args:
+        shingles (np.ndarray): uint64 shingle hashes, grouped by review (ascending review index)
+        shingle_reviews (np.ndarray): Review index of each shingle
+        review_count (int): Number of reviews in the batch
+        num_perm (int): Signature length (at most 512)
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (review indices with a signature,
+        uint32 signatures of shape (len(indices), num_perm))
+    """
+    shingle_counts = np.bincount(shingle_reviews, minlength=review_count)
+    signed_reviews = np.flatnonzero(shingle_counts)
+    group_starts = np.concatenate(([0], np.cumsum(shingle_counts[signed_reviews])[:-1])).astype(np.int64)
+
+    signatures = np.empty((len(signed_reviews), num_perm), dtype=np.uint32)
+    if not len(signed_reviews):
+        return signed_reviews, signatures
+
+    with np.errstate(over="ignore"):
+        for permutation in range(num_perm):
+            permuted = mix64(shingles ^ _PERMUTATION_SEEDS[permutation])
+            signatures[:, permutation] = np.minimum.reduceat(permuted, group_starts) >> np.uint64(32)
+
+    return signed_reviews, signatures
+
+
+def lsh_band_keys(signatures: np.ndarray, threshold: float) -> np.ndarray:
+    """
+    Hashes each LSH band (a run of signature rows) of every signature to one key.
+
+    Args:
+        signatures (np.ndarray): uint32 signatures, one row per review
+        threshold (float): Jaccard threshold the banding is tuned for (see choose_bands)
+
+    Returns:
+        np.ndarray: uint64 keys of shape (len(signatures), bands)
+    """
+    bands, rows = choose_bands(signatures.shape[1], threshold)
+    keys = np.zeros((len(signatures), bands), dtype=np.uint64)
+    with np.errstate(over="ignore"):
+        for band in range(bands):
+            band_keys = keys[:, band]
+            for column in range(band * rows, (band + 1) * rows):
+                band_keys = mix64(band_keys ^ signatures[:, column].astype(np.uint64))
+            keys[:, band] = band_keys
+    return keys
+
+
+def _connected_components(node_count: int, left: np.ndarray, right: np.ndarray) -> np.ndarray:
+    """
+    Labels connected components of an edge list (vectorized hook-and-compress).
+
+    Args:
+        node_count (int): Number of nodes
+        left (np.ndarray): Edge endpoints
+        right (np.ndarray): Edge endpoints
+
+    Returns:
+        np.ndarray: Component label (smallest node index) for every node
+    """
+    parent = np.arange(node_count, dtype=np.int64)
+    while True:
+        left_root, right_root = parent[left], parent[right]
+        low = np.minimum(left_root, right_root)
+        high = np.maximum(left_root, right_root)
+        pending = low != high
+        if not pending.any():
+            return parent
+
+        # Hook the larger root onto the smaller one, then flatten every path
+        np.minimum.at(parent, high[pending], low[pending])
+        while True:
+            grandparent = parent[parent]
+            if np.array_equal(grandparent, parent):
+                break
+            parent = grandparent
+
+
+def feature_signatures(features, num_perm: int = None, shingle_size: int = None,
+                       compiled: CompiledConfig = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Computes the MinHash signatures of a TextFeatures object.
+
+    Shingles are hashed from the batch-independent token keys, so a review gets
+    the same signature whichever batch (or shard) it is tokenized in.
+
+    Args:
+        features (TextFeatures): Tokenized reviews
+        num_perm (int, optional): Signature length. Defaults to config value.
+        shingle_size (int, optional): Words per shingle. Defaults to config value.
+        compiled (CompiledConfig, optional): Configuration snapshot (default: current config)
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (review indices with a signature, uint32 signatures)
+    """
+    compiled = compiled or compile_config()
+    num_perm = compiled.NEAR_DUPLICATE_NUM_PERM if num_perm is None else num_perm
+    shingle_size = compiled.NEAR_DUPLICATE_SHINGLE_SIZE if shingle_size is None else shingle_size
+
+    review_count = len(features.token_offsets) - 1
+    shingles, shingle_reviews, _ = review_ngram_hashes(features.token_keys(), features.token_offsets, shingle_size)
+    return minhash_signatures(shingles, shingle_reviews, review_count, num_perm)
+
+
+def cluster_signatures(signed_reviews: np.ndarray, signatures: np.ndarray, threshold: float = None,
+                       min_cluster_size: int = None, compiled: CompiledConfig = None) -> List[np.ndarray]:
+    """
+    Groups reviews whose MinHash signatures agree on at least ``threshold`` of their slots.
+
+    Reviews sharing an LSH band bucket become candidate pairs (each bucket
+    member is paired with the bucket's first member, so candidates stay linear
+    in the number of reviews), candidates are verified on their signatures, and
+    verified pairs are merged into clusters.
+
+    Args:
+        signed_reviews (np.ndarray): Review indices of the signatures, ascending
+        signatures (np.ndarray): uint32 signatures, one row per review
+        threshold (float, optional): Jaccard threshold. Defaults to config value.
+        min_cluster_size (int, optional): Smallest cluster reported. Defaults to config value.
+        compiled (CompiledConfig, optional): Configuration snapshot (default: current config)
+
+    Returns:
+        List[np.ndarray]: Review indices of each cluster, largest cluster first
+    """
+    compiled = compiled or compile_config()
+    threshold = compiled.NEAR_DUPLICATE_JACCARD_THRESHOLD if threshold is None else threshold
+    min_cluster_size = compiled.NEAR_DUPLICATE_MIN_CLUSTER_SIZE if min_cluster_size is None else min_cluster_size
+
+    if len(signed_reviews) < min_cluster_size:
+        return []
+
+    # LSH: equal band keys are candidate pairs
+    candidate_pairs = []
+    for band_keys in lsh_band_keys(signatures, threshold).T:
+        order = np.argsort(band_keys, kind="stable")
+        sorted_keys = band_keys[order]
+        run_start = np.concatenate(([True], sorted_keys[1:] != sorted_keys[:-1]))
+        leader = order[np.maximum.accumulate(np.where(run_start, np.arange(len(order)), 0))]
+        in_bucket = ~run_start
+        candidate_pairs.append(np.stack((leader[in_bucket], order[in_bucket]), axis=1))
+
+    pairs = np.unique(np.concatenate(candidate_pairs), axis=0)
+    if not len(pairs):
+        return []
+
+    # Verify candidates with the signature agreement (an unbiased Jaccard estimate)
+    similarity = (signatures[pairs[:, 0]] == signatures[pairs[:, 1]]).mean(axis=1)
+    pairs = pairs[similarity >= threshold]
+
+    labels = _connected_components(len(signed_reviews), pairs[:, 0], pairs[:, 1])
+    cluster_labels, cluster_sizes = np.unique(labels, return_counts=True)
+    cluster_labels = cluster_labels[cluster_sizes >= min_cluster_size]
+
+    member_order = np.argsort(labels, kind="stable")
+    sorted_labels = labels[member_order]
+    clusters = []
+    for label in cluster_labels.tolist():
+        start, end = np.searchsorted(sorted_labels, [label, label + 1])
+        clusters.append(signed_reviews[member_order[start:end]])
+
+    clusters.sort(key=lambda members: (-len(members), members[0]))
+    return clusters
+
+
+def find_near_duplicate_clusters(features, threshold: float = None, num_perm: int = None,
+                                 shingle_size: int = None, min_cluster_size: int = None,
+                                 compiled: CompiledConfig = None) -> List[np.ndarray]:
+    """
+    Groups reviews whose word shingles are near-identical (estimated Jaccard >= threshold).
+
+    Pipeline: shingle hashes -> MinHash signatures -> LSH banding -> verified
+    pairs -> connected components (see cluster_signatures).
+
+    Args:
+        features (TextFeatures): Tokenized reviews
+        threshold (float, optional): Jaccard threshold. Defaults to config value.
+        num_perm (int, optional): Signature length. Defaults to config value.
+        shingle_size (int, optional): Words per shingle. Defaults to config value.
+        min_cluster_size (int, optional): Smallest cluster reported. Defaults to config value.
+        compiled (CompiledConfig, optional): Configuration snapshot (default: current config)
+
+    Returns:
+        List[np.ndarray]: Review indices of each cluster, largest cluster first
+    """
+    signed_reviews, signatures = feature_signatures(features, num_perm, shingle_size, compiled)
+    return cluster_signatures(signed_reviews, signatures, threshold, min_cluster_size, compiled)
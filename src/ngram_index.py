@@ -0,0 +1,221 @@
+"""
+Project Veritas - Hashed N-gram Index
+Rolling 64-bit hashes over integer token IDs with a compact hash -> review posting
+structure, used to find phrases repeated across many reviews without building strings
+"""
+
+from array import array
+from typing import List
+import numpy as np
+
+
+# Multiplier of the polynomial rolling hash (large odd 64-bit constant)
+_HASH_BASE = np.uint64(0x9E3779B97F4A7C15)
+
+
+def mix64(values: np.ndarray) -> np.ndarray:
+    """
+    SplitMix64 finalizer: spreads polynomial hash values over all 64 bits.
+    """
+    values = values ^ (values >> np.uint64(30))
+    values = values * np.uint64(0xBF58476D1CE4E5B9)
+    values = values ^ (values >> np.uint64(27))
+    values = values * np.uint64(0x94D049BB133111EB)
+    return values ^ (values >> np.uint64(31))
+
+
+def rolling_hashes(token_ids: np.ndarray, n: int) -> np.ndarray:
+    """
+    Hashes every n-token window of a token ID sequence.
+
+    Computes h(i) = sum_k (id[i + k] + 1) * BASE^(n - 1 - k) mod 2^64 for all
+    windows at once (uint64 arithmetic wraps), then mixes the bits.
+
+    Args:
+        token_ids (np.ndarray): Integer token IDs or uint64 token keys
+        n (int): Window length in tokens
+
+    Returns:
+        np.ndarray: uint64 hash per window start (len(token_ids) - n + 1 entries, or none)
+    """
+    window_count = len(token_ids) - n + 1
+    if window_count <= 0:
+        return np.zeros(0, dtype=np.uint64)
+
+    ids = token_ids.astype(np.uint64) + np.uint64(1)
+    hashes = np.zeros(window_count, dtype=np.uint64)
+    with np.errstate(over="ignore"):
+        for k in range(n):
+            hashes = hashes * _HASH_BASE + ids[k:k + window_count]
+        return mix64(hashes)
+
+
+def review_ngram_hashes(token_ids: np.ndarray, token_offsets: np.ndarray, n: int):
+    """
+    Hashes the n-grams of many reviews stored as one flat token array.
+    Windows that would span two reviews are dropped.
+
+    Args:
+        token_ids (np.ndarray): Flat token IDs (or uint64 token keys) of all reviews
+        token_offsets (np.ndarray): Review i owns token_ids[token_offsets[i]:token_offsets[i + 1]]
+        n (int): N-gram length in tokens
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: (uint64 hashes, review index,
+        token position) per n-gram, in review/position order
+    """
+    hashes = rolling_hashes(token_ids, n)
+    starts = np.arange(len(hashes), dtype=np.int64)
+    review_of_start = np.searchsorted(token_offsets, starts, side="right") - 1
+    inside_review = starts + n <= token_offsets[review_of_start + 1]
+
+    return hashes[inside_review], review_of_start[inside_review].astype(np.int32), starts[inside_review]
+
+
+class NGramIndex:
+    """
+    Posting index from n-gram hash to the reviews containing it.
+
+    N-grams are appended into flat array buffers (hash, review index, token
+    position), then ``finalize()`` sorts them once into a CSR layout:
+
+        hashes           uint64  unique n-gram hashes
+        counts           int64   occurrences of each hash (every occurrence counts)
+        offsets          int64   postings of hash k are review_indices[offsets[k]:offsets[k + 1]]
+        review_indices   int32   review positions, grouped by hash
+        first_position   int64   token position of each hash's first occurrence
+
+    Phrases are only rebuilt as text on request (``phrase``), so strings are
+    created just for the n-grams that end up in a report.
+    """
+
+    def __init__(self, n: int):
+        self.n = n
+        self._hash_buffer = array("Q")
+        self._review_buffer = array("i")
+        self._position_buffer = array("q")
+        self.finalized = False
+
+    def add(self, review_index: int, token_ids: np.ndarray, token_offset: int = 0) -> None:
+        """
+        Adds the n-grams of one review.
+
+        Args:
+            review_index (int): Position of the review in its batch
+            token_ids (np.ndarray): The review's token IDs
+            token_offset (int): Position of the review's first token in the flat token array
+        """
+        hashes = rolling_hashes(token_ids, self.n)
+        self._hash_buffer.extend(hashes.tolist())
+        self._review_buffer.extend([review_index] * len(hashes))
+        self._position_buffer.extend(range(token_offset, token_offset + len(hashes)))
+        self.finalized = False
+
+    @classmethod
+    def from_text_features(cls, features, n: int) -> "NGramIndex":
+        """
+        Builds a finalized index over every review of a TextFeatures object in one vectorized pass.
+        Tokens are hashed by their batch-independent keys, so hashes agree across batches.
+
+        Args:
+            features (TextFeatures): Tokenized reviews
+            n (int): N-gram length in tokens
+
+        Returns:
+            NGramIndex: Finalized index
+        """
+        index = cls(n)
+        index._finalize_arrays(*review_ngram_hashes(features.token_keys(), features.token_offsets, n))
+        return index
+
+    def finalize(self) -> "NGramIndex":
+        """
+        Sorts the appended n-grams into the CSR posting layout.
+
+        Returns:
+            NGramIndex: self, for chaining
+        """
+        self._finalize_arrays(
+            np.frombuffer(self._hash_buffer, dtype=np.uint64) if len(self._hash_buffer) else np.zeros(0, dtype=np.uint64),
+            np.frombuffer(self._review_buffer, dtype=np.int32) if len(self._review_buffer) else np.zeros(0, dtype=np.int32),
+            np.frombuffer(self._position_buffer, dtype=np.int64) if len(self._position_buffer) else np.zeros(0, dtype=np.int64)
+        )
+        return self
+
+    def _finalize_arrays(self, hashes: np.ndarray, review_indices: np.ndarray, positions: np.ndarray) -> None:
+        """
+        Groups parallel (hash, review, position) arrays into the CSR posting layout.
+        """
+        # Stable sort keeps each hash's postings in insertion (review, position) order
+        order = np.argsort(hashes, kind="stable")
+        sorted_hashes = hashes[order]
+
+        self.hashes, group_starts, self.counts = np.unique(sorted_hashes, return_index=True, return_counts=True)
+        self.counts = self.counts.astype(np.int64)
+        self.offsets = np.append(group_starts, len(sorted_hashes)).astype(np.int64)
+        self.review_indices = review_indices[order]
+        self.first_position = positions[order][group_starts] if len(group_starts) else np.zeros(0, dtype=np.int64)
+        self.finalized = True
+
+    def __len__(self) -> int:
+        return len(self.hashes) if self.finalized else len(self._hash_buffer)
+
+    def repeated(self, min_count: int) -> np.ndarray:
+        """
+        Finds n-grams occurring at least min_count times.
+
+        Args:
+            min_count (int): Minimum number of occurrences
+
+        Returns:
+            np.ndarray: Indices (into ``hashes``) of the repeated n-grams
+        """
+        return np.flatnonzero(self.counts >= min_count)
+
+    def postings(self, hash_index: int) -> np.ndarray:
+        """
+        Returns the review positions of one n-gram (one entry per occurrence).
+        """
+        return self.review_indices[self.offsets[hash_index]:self.offsets[hash_index + 1]]
+
+    def reviews_containing(self, hash_indices: np.ndarray) -> np.ndarray:
+        """
+        Returns the distinct review positions containing any of the given n-grams.
+
+        Args:
+            hash_indices (np.ndarray): Indices into ``hashes``
+
+        Returns:
+            np.ndarray: Sorted, unique review positions
+        """
+        selected = np.zeros(len(self.hashes), dtype=bool)
+        selected[hash_indices] = True
+        return np.unique(self.review_indices[np.repeat(selected, self.counts)])
+
+    def top(self, hash_indices: np.ndarray) -> int:
+        """
+        Picks the most frequent n-gram; ties go to the one that appeared first.
+
+        Args:
+            hash_indices (np.ndarray): Candidate indices into ``hashes`` (non-empty)
+
+        Returns:
+            int: Index into ``hashes``
+        """
+        order = np.lexsort((self.first_position[hash_indices], -self.counts[hash_indices]))
+        return int(hash_indices[order[0]])
+
+    def phrase(self, hash_index: int, token_ids: np.ndarray, vocabulary: List[str]) -> str:
+        """
+        Rebuilds the text of an n-gram from its first occurrence.
+
+        Args:
+            hash_index (int): Index into ``hashes``
+            token_ids (np.ndarray): Flat token array the positions refer to
+            vocabulary (List[str]): Token ID -> token
+
+        Returns:
+            str: The n-gram as space-joined lowercase words
+        """
+        start = int(self.first_position[hash_index])
+        return " ".join(vocabulary[token_id] for token_id in token_ids[start:start + self.n].tolist())
@@ -0,0 +1,183 @@
+"""
+Project Veritas - Multi-Phrase Matcher
+Aho-Corasick automaton that finds every configured phrase in a review with a single scan
+"""
+
+from collections import deque
+from functools import lru_cache
+from typing import List, Tuple, Iterable
+
+# Optional accelerated backend (C implementation of the same automaton)
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Below this many phrases, per-phrase substring scans (run in C) beat stepping
+# the pure Python automaton character by character
+SUBSTRING_SCAN_MAX_PHRASES = 150
+
+
+class PhraseMatcher:
+    """
+    Aho-Corasick automaton over a fixed list of phrases.
+
+    Matching is plain substring matching (exactly like ``phrase in text``), but
+    the text is scanned once for all phrases instead of once per phrase.
+
+    Backends (all return identical results):
+        "pyahocorasick"  C automaton, used when the package is installed
+        "automaton"      pure Python automaton, for long phrase lists
+        "substring"      per-phrase C substring scans, for short lists where
+                         they are faster than a Python-level automaton
+    """
+
+    def __init__(self, phrases: Iterable[str], use_accelerated: bool = True):
+        self.phrases = tuple(phrases)
+        self._automaton = None
+
+        # An empty phrase is "in" every text, just like the substring test
+        self._empty_phrases = [(0, i) for i, phrase in enumerate(self.phrases) if not phrase]
+
+        if use_accelerated and AHOCORASICK_AVAILABLE:
+            # Duplicate phrases share one automaton entry that reports all their indices
+            phrase_indices = {}
+            for phrase_index, phrase in enumerate(self.phrases):
+                if phrase:
+                    phrase_indices.setdefault(phrase, []).append(phrase_index)
+
+            automaton = ahocorasick.Automaton()
+            for phrase, indices in phrase_indices.items():
+                automaton.add_word(phrase, (tuple(indices), len(phrase)))
+            automaton.make_automaton()
+            self._automaton = automaton
+            self.backend = "pyahocorasick"
+        elif len(self.phrases) <= SUBSTRING_SCAN_MAX_PHRASES:
+            self.backend = "substring"
+        else:
+            self._build_python_automaton()
+            self.backend = "automaton"
+
+    def _build_python_automaton(self) -> None:
+        """
+        Builds the goto/fail/output tables of the pure Python automaton.
+        """
+        goto = [{}]
+        outputs = [[]]
+
+        # Trie of all phrases
+        for phrase_index, phrase in enumerate(self.phrases):
+            if not phrase:
+                continue
+            state = 0
+            for char in phrase:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][char] = next_state
+                    goto.append({})
+                    outputs.append([])
+                state = next_state
+            outputs[state].append(phrase_index)
+
+        # Failure links (breadth-first), merging outputs of the fallback states
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in goto[state].items():
+                queue.append(next_state)
+                fallback = fail[state]
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                fail[next_state] = goto[fallback].get(char, 0)
+                outputs[next_state] = outputs[next_state] + outputs[fail[next_state]]
+
+        self._goto = goto
+        self._fail = fail
+        self._outputs = [tuple(output) for output in outputs]
+        self._lengths = tuple(len(phrase) for phrase in self.phrases)
+
+    def find_all(self, text: str) -> List[Tuple[int, int]]:
+        """
+        Finds every occurrence of every phrase in the text.
+
+        Args:
+            text (str): Text to scan
+
+        Returns:
+            List[Tuple[int, int]]: (start position, phrase index) pairs, ordered by end position
+        """
+        hits = list(self._empty_phrases)
+
+        if self.backend == "pyahocorasick":
+            hits.extend(
+                (end - length + 1, phrase_index)
+                for end, (indices, length) in self._automaton.iter(text)
+                for phrase_index in indices
+            )
+            return hits
+
+        if self.backend == "substring":
+            for phrase_index, phrase in enumerate(self.phrases):
+                if not phrase:
+                    continue
+                start = text.find(phrase)
+                while start != -1:
+                    hits.append((start, phrase_index))
+                    start = text.find(phrase, start + 1)
+            hits.sort(key=lambda hit: hit[0] + len(self.phrases[hit[1]]))
+            return hits
+
+        goto, fail, outputs, lengths = self._goto, self._fail, self._outputs, self._lengths
+        state = 0
+        for position, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for phrase_index in outputs[state]:
+                hits.append((position - lengths[phrase_index] + 1, phrase_index))
+        return hits
+
+    def matched_phrases(self, text: str) -> set:
+        """
+        Returns the indices of the distinct phrases that occur in the text.
+
+        Args:
+            text (str): Text to scan
+
+        Returns:
+            set: Indices into ``phrases``
+        """
+        if self.backend == "substring":
+            return {i for i, phrase in enumerate(self.phrases) if phrase in text}
+        return {phrase_index for _, phrase_index in self.find_all(text)}
+
+    def count_matches(self, text: str) -> int:
+        """
+        Counts how many distinct phrases occur in the text.
+
+        Args:
+            text (str): Text to scan
+
+        Returns:
+            int: Number of distinct phrases found
+        """
+        return len(self.matched_phrases(text))
+
+
+@lru_cache(maxsize=32)
+def get_matcher(phrases: Tuple[str, ...]) -> PhraseMatcher:
+    """
+    Returns the compiled matcher for a phrase list.
+    Matchers are cached by the phrase tuple, so the automaton is only rebuilt
+    when the configured list actually changes.
+
+    Args:
+        phrases (Tuple[str, ...]): Phrases to match (must be a tuple to be cacheable)
+
+    Returns:
+        PhraseMatcher: Compiled matcher
+    """
+    return PhraseMatcher(phrases)
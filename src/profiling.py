@@ -0,0 +1,296 @@
+"""
+Project Veritas - Stage Timing and Profiling
+Context-managed spans recording wall time, CPU time, review counts and peak allocations
+for each pipeline stage and red flag check, exportable as Prometheus text or a JSONL trace
+"""
+
+import sys
+import os
+import json
+import time
+import uuid
+import threading
+import tracemalloc
+from contextlib import contextmanager
+from typing import List, Dict, Any, Iterator
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+# Supported export formats, by file extension
+TIMING_EXPORT_FORMATS = {".prom": "prometheus", ".txt": "prometheus", ".jsonl": "jsonl"}
+
+# Prometheus metric per span field (name, help text)
+_PROMETHEUS_METRICS = (
+    ("wall_seconds", "veritas_stage_wall_seconds", "Wall-clock time spent in the stage"),
+    ("cpu_seconds", "veritas_stage_cpu_seconds", "CPU time of this process spent in the stage"),
+    ("reviews", "veritas_stage_reviews", "Reviews processed by the stage"),
+    ("peak_alloc_bytes", "veritas_stage_peak_alloc_bytes", "Peak Python allocations above the stage's start"),
+)
+
+
+class _Span:
+    """
+    One open span: start readings, plus the highest peak seen in its children.
+    """
+
+    __slots__ = ("name", "path", "reviews", "attributes", "started", "wall_start", "cpu_start",
+                 "memory_start", "child_peak", "traced")
+
+    def __init__(self, name: str, path: str, reviews: int, attributes: Dict[str, Any]):
+        self.name = name
+        self.path = path
+        self.reviews = reviews
+        self.attributes = attributes
+        self.child_peak = 0
+        self.traced = False
+
+
+class Profiler:
+    """
+    Collects timing spans for one run.
+
+    ``with profiler.span("analyze", reviews=n):`` records, when the block exits:
+
+        name              the span name
+        path              names of the enclosing spans joined by '/'
+                          (e.g. "run_veritas/analyze/check:review_velocity")
+        start             Unix timestamp of the start
+        wall_seconds      elapsed wall-clock time
+        cpu_seconds       CPU time of this process (all its threads; worker
+                          processes are not included)
+        reviews           reviews processed (None if not given)
+        peak_alloc_bytes  highest Python allocation above the level at the
+                          start of the span, children included (None unless
+                          trace_memory is on; tracemalloc slows allocation-heavy
+                          code down noticeably, so it is off by default)
+
+    plus any keyword attributes given to span(). Spans nest per thread; a
+    span opened in a worker thread names its parent explicitly (``parent=``).
+    Memory is only measured on the thread that created the profiler, since
+    tracemalloc peaks are process-wide.
+
+    A disabled profiler (``Profiler(enabled=False)``, or NULL_PROFILER) turns
+    every span into a no-op, so instrumented code needs no branches.
+    """
+
+    def __init__(self, enabled: bool = True, trace_memory: bool = False):
+        self.enabled = enabled
+        self.trace_memory = trace_memory and enabled
+        self.spans = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._owner = threading.get_ident()
+        self._started_tracing = False
+
+    def _stack(self) -> List[_Span]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def current_path(self) -> str:
+        """
+        Returns the path of the innermost open span of this thread ("" if none).
+        """
+        stack = self._stack()
+        return stack[-1].path if stack else ""
+
+    @contextmanager
+    def span(self, name: str, reviews: int = None, parent: str = None, **attributes) -> Iterator[None]:
+        """
+        Times the enclosed block as one span.
+
+        Args:
+            name (str): Span name (e.g. "scrape", "check:generic_praise")
+            reviews (int, optional): Reviews the stage processes
+            parent (str, optional): Path of the parent span when opening a span in another
+                thread (default: this thread's innermost open span)
+            **attributes: Extra JSON-serializable fields stored with the span
+        """
+        if not self.enabled:
+            yield
+            return
+
+        stack = self._stack()
+        if parent is None:
+            parent = stack[-1].path if stack else ""
+        span = _Span(name, f"{parent}/{name}" if parent else name, reviews, attributes)
+
+        if self.trace_memory and threading.get_ident() == self._owner:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracing = True
+            current, peak = tracemalloc.get_traced_memory()
+            if stack:
+                stack[-1].child_peak = max(stack[-1].child_peak, peak)
+            tracemalloc.reset_peak()
+            span.memory_start = current
+            span.traced = True
+
+        stack.append(span)
+        span.started = time.time()
+        span.cpu_start = time.process_time()
+        span.wall_start = time.perf_counter()
+        try:
+            yield
+        finally:
+            wall_seconds = time.perf_counter() - span.wall_start
+            cpu_seconds = time.process_time() - span.cpu_start
+            stack.pop()
+
+            peak_alloc_bytes = None
+            if span.traced:
+                peak = max(tracemalloc.get_traced_memory()[1], span.child_peak)
+                peak_alloc_bytes = max(peak - span.memory_start, 0)
+                if stack:
+                    stack[-1].child_peak = max(stack[-1].child_peak, peak)
+                elif self._started_tracing:
+                    tracemalloc.stop()
+                    self._started_tracing = False
+
+            record = {
+                "name": span.name,
+                "path": span.path,
+                "start": span.started,
+                "wall_seconds": wall_seconds,
+                "cpu_seconds": cpu_seconds,
+                "reviews": span.reviews,
+                "peak_alloc_bytes": peak_alloc_bytes
+            }
+            record.update(span.attributes)
+            with self._lock:
+                self.spans.append(record)
+
+    def timings(self) -> List[Dict]:
+        """
+        Returns the finished spans in start order (for report["timings"]).
+
+        Returns:
+            List[Dict]: One record per span (see the class docstring)
+        """
+        with self._lock:
+            return sorted(self.spans, key=lambda record: record["start"])
+
+
+# Shared disabled profiler, used when no profiler is passed in
+NULL_PROFILER = Profiler(enabled=False)
+
+
+def timing_export_format(path: str, output_format: str = None) -> str:
+    """
+    Resolves the export format from the explicit argument or the file extension.
+
+    Args:
+        path (str): Output file path
+        output_format (str, optional): "prometheus" or "jsonl"
+
+    Returns:
+        str: The format to write
+    """
+    if output_format is None:
+        output_format = TIMING_EXPORT_FORMATS.get(os.path.splitext(path)[1].lower())
+    if output_format not in TIMING_EXPORT_FORMATS.values():
+        raise ValueError(
+            f"Unknown timing export format for '{path}' (use a .prom or .jsonl file, "
+            f"or output_format='prometheus'/'jsonl')"
+        )
+    return output_format
+
+
+def _prometheus_label(value: str) -> str:
+    """
+    Escapes a Prometheus label value.
+    """
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def export_timings(timings: List[Dict], path: str, output_format: str = None,
+                   labels: Dict[str, str] = None) -> Dict:
+    """
+    Writes timing spans to a local file.
+
+    Formats:
+        "prometheus"  text exposition format for the node exporter textfile
+                      collector: one gauge sample per span and field, labelled
+                      with the span path (and ``labels``); the file is replaced
+                      atomically, so a scrape never reads half a file
+        "jsonl"       trace file: one JSON object per span, appended, tagged
+                      with a run ID shared by the spans of this call
+
+    Args:
+        timings (List[Dict]): Spans from Profiler.timings() (or report["timings"])
+        path (str): Output file path
+        output_format (str, optional): "prometheus" or "jsonl" (default: from the extension)
+        labels (Dict[str, str], optional): Extra labels / fields (e.g. {"asin": "B08N5WRWNW"})
+
+    Returns:
+        Dict: {"path", "format", "spans"}
+    """
+    output_format = timing_export_format(path, output_format)
+    labels = labels or {}
+
+    if output_format == "jsonl":
+        run_id = uuid.uuid4().hex
+        with open(path, "a") as f:
+            for record in timings:
+                f.write(json.dumps(dict(labels, run=run_id, **record)) + "\n")
+    else:
+        extra = "".join(f',{name}="{_prometheus_label(value)}"' for name, value in sorted(labels.items()))
+        lines = []
+        for field, metric, help_text in _PROMETHEUS_METRICS:
+            samples = [record for record in timings if record.get(field) is not None]
+            if not samples:
+                continue
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} gauge")
+            for record in samples:
+                lines.append(f'{metric}{{stage="{_prometheus_label(record["path"])}"{extra}}} {record[field]}')
+
+        temporary = f"{path}.tmp"
+        with open(temporary, "w") as f:
+            f.write("\n".join(lines) + "\n")
+        os.replace(temporary, path)
+
+    return {"path": path, "format": output_format, "spans": len(timings)}
+
+
+# Example usage
+if __name__ == "__main__":
+    import tempfile
+
+    profiler = Profiler(trace_memory=True)
+    with profiler.span("run", reviews=1000):
+        with profiler.span("allocate", reviews=1000):
+            data = [bytes(1000) for _ in range(1000)]
+        del data
+        with profiler.span("compute"):
+            total = sum(i * i for i in range(200000))
+
+    timings = profiler.timings()
+    by_path = {record["path"]: record for record in timings}
+    assert set(by_path) == {"run", "run/allocate", "run/compute"}
+    assert by_path["run/allocate"]["peak_alloc_bytes"] >= 1000 * 1000
+    assert by_path["run"]["peak_alloc_bytes"] >= by_path["run/allocate"]["peak_alloc_bytes"]
+    assert by_path["run"]["wall_seconds"] >= by_path["run/compute"]["wall_seconds"]
+    assert not tracemalloc.is_tracing()
+
+    with NULL_PROFILER.span("ignored"):
+        pass
+    assert NULL_PROFILER.timings() == []
+
+    with tempfile.TemporaryDirectory() as directory:
+        export_timings(timings, os.path.join(directory, "veritas.prom"), labels={"asin": "TEST"})
+        with open(os.path.join(directory, "veritas.prom")) as f:
+            exposition = f.read()
+        assert 'veritas_stage_wall_seconds{stage="run/allocate",asin="TEST"}' in exposition
+
+        export_timings(timings, os.path.join(directory, "trace.jsonl"))
+        with open(os.path.join(directory, "trace.jsonl")) as f:
+            assert len(f.readlines()) == 3
+
+    for record in timings:
+        print(f"   {record['path']:<15} wall {record['wall_seconds'] * 1000:7.2f} ms  "
+              f"cpu {record['cpu_seconds'] * 1000:7.2f} ms  peak {record['peak_alloc_bytes'] / 1024:8.1f} KiB")
+    print("✓ Spans nest, measure peaks and export to Prometheus text and JSONL")
@@ -5,10 +5,19 @@ Rotates between multiple RapidAPI keys/services when rate limited
 
 import requests
 import os
+import sys
 from typing import List, Dict, Optional
 from datetime import datetime
 import re
 
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src import events
+from src import utils
+from src.review import Review
+from src.date_parsing import parse_review_date, parse_review_dates
+
 
 class MultiAPIAmazonScraper:
     """
@@ -30,8 +39,9 @@ class MultiAPIAmazonScraper:
                 import streamlit as st
                 # Check if secrets are available
                 if hasattr(st, 'secrets'):
-                    print(f"   Debug: st.secrets is available")
-                    print(f"   Debug: Available secret keys: {list(st.secrets.keys())}")
+                    if events.enabled(events.DEBUG):
+                        events.debug("rapidapi.secrets", "   Debug: st.secrets is available")
+                        events.debug("rapidapi.secrets", f"   Debug: Available secret keys: {list(st.secrets.keys())}")
 
                     for i in range(1, 11):  # Support up to 10 API keys
                         try:
@@ -40,9 +50,9 @@ class MultiAPIAmazonScraper:
                                 key = st.secrets[key_name]
                                 if key and key != "your-key-here":
                                     self.api_keys.append(key)
-                                    print(f"   Debug: Loaded {key_name}")
+                                    events.debug("rapidapi.key_loaded", f"   Debug: Loaded {key_name}", key_name=key_name)
                         except Exception as e:
-                            print(f"   Debug: Failed to load {key_name}: {e}")
+                            events.debug("rapidapi.key_failed", f"   Debug: Failed to load {key_name}: {e}", key_name=key_name)
                             pass
 
                     # Fallback to single key if no numbered keys found
@@ -52,18 +62,19 @@ class MultiAPIAmazonScraper:
                                 single_key = st.secrets["RAPIDAPI_KEY"]
                                 if single_key and single_key != "your-key-here":
                                     self.api_keys = [single_key]
-                                    print(f"   Debug: Loaded RAPIDAPI_KEY")
+                                    events.debug("rapidapi.key_loaded", "   Debug: Loaded RAPIDAPI_KEY", key_name="RAPIDAPI_KEY")
                         except Exception as e:
-                            print(f"   Debug: Failed to load RAPIDAPI_KEY: {e}")
+                            events.debug("rapidapi.key_failed", f"   Debug: Failed to load RAPIDAPI_KEY: {e}",
+                                         key_name="RAPIDAPI_KEY")
                             pass
                 else:
-                    print(f"   Debug: st.secrets not available")
+                    events.debug("rapidapi.secrets", "   Debug: st.secrets not available")
             except ImportError:
                 # Not in Streamlit, use environment variables
-                print(f"   Debug: Streamlit not imported")
+                events.debug("rapidapi.secrets", "   Debug: Streamlit not imported")
                 pass
             except Exception as e:
-                print(f"   Debug: Error accessing Streamlit secrets: {e}")
+                events.debug("rapidapi.secrets", f"   Debug: Error accessing Streamlit secrets: {e}")
 
             # If still no keys, try environment variables
             if not self.api_keys:
@@ -78,11 +89,12 @@ class MultiAPIAmazonScraper:
                     if single_key and single_key != "your-key-here":
                         self.api_keys = [single_key]
 
-        print(f"🔑 Loaded {len(self.api_keys)} RapidAPI key(s)")
+        events.info("rapidapi.keys_loaded", f"🔑 Loaded {len(self.api_keys)} RapidAPI key(s)", keys=len(self.api_keys))
         if self.api_keys:
-            print(f"   First key preview: {self.api_keys[0][:20]}...")
+            if events.enabled(events.DEBUG):
+                events.debug("rapidapi.key_preview", f"   First key preview: {self.api_keys[0][:20]}...")
         else:
-            print("   ⚠️ WARNING: No API keys found!")
+            events.warning("rapidapi.no_keys", "   ⚠️ WARNING: No API keys found!")
 
         # Multiple API service configurations (rotate through these too)
         # Currently only using OpenWeb Ninja since all accounts are subscribed to it
@@ -113,18 +125,7 @@ class MultiAPIAmazonScraper:
 
     def _extract_asin(self, url: str) -> Optional[str]:
         """Extract ASIN from Amazon URL."""
-        patterns = [
-            r'/dp/([A-Z0-9]{10})',
-            r'/product/([A-Z0-9]{10})',
-            r'/gp/product/([A-Z0-9]{10})',
-            r'[?&]asin=([A-Z0-9]{10})'
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
-        return None
+        return utils.extract_asin(url)
 
     def scrape_reviews(self, url: str, max_reviews: int = 100) -> Dict:
         """
@@ -152,33 +153,36 @@ class MultiAPIAmazonScraper:
                 "all_apis_exhausted": False
             }
 
-        print(f"🔍 Fetching reviews for ASIN: {asin}")
+        events.info("rapidapi.started", f"🔍 Fetching reviews for ASIN: {asin}", asin=asin)
 
         # Try each API key in sequence until one works
         for i, api_key in enumerate(self.api_keys, 1):
-            print(f"🚀 Trying API key #{i}...")
+            events.info("rapidapi.key_started", f"🚀 Trying API key #{i}...", key=i)
 
             # Try each API service with this key
             for service in self.api_services:
-                print(f"   📡 Trying {service['name']}...")
+                events.info("rapidapi.service_started", f"   📡 Trying {service['name']}...", key=i, service=service['name'])
                 result = self._try_api_key(api_key, asin, max_reviews, service)
 
                 if result["success"]:
-                    print(f"✅ Success with API key #{i} using {service['name']}!")
+                    events.info("rapidapi.complete", f"✅ Success with API key #{i} using {service['name']}!",
+                                key=i, service=service['name'], reviews=len(result["reviews"]))
                     return result
                 elif result["rate_limited"]:
-                    print(f"   ⚠️ Rate limited on {service['name']}, trying next service...")
+                    events.warning("rapidapi.rate_limited", f"   ⚠️ Rate limited on {service['name']}, trying next service...",
+                                   key=i, service=service['name'])
                     continue
                 else:
                     # Other error (auth failure, network issue, etc.)
-                    print(f"   ⚠️ Error on {service['name']}: {result['error']}")
+                    events.warning("rapidapi.service_error", f"   ⚠️ Error on {service['name']}: {result['error']}",
+                                   key=i, service=service['name'], error=result['error'])
                     # Try next service with this key
                     continue
 
-            print(f"⚠️ API key #{i} exhausted all services, trying next key...")
+            events.warning("rapidapi.key_exhausted", f"⚠️ API key #{i} exhausted all services, trying next key...", key=i)
 
         # All API keys and services are exhausted
-        print("❌ All API keys and services are rate limited!")
+        events.error("rapidapi.exhausted", "❌ All API keys and services are rate limited!")
         return {
             "success": False,
             "error": "All RapidAPI keys have reached their rate limits across all services",
@@ -257,7 +261,7 @@ class MultiAPIAmazonScraper:
                     "page": str(page)
                 }
 
-                print(f"      Fetching page {page}...")
+                events.info("rapidapi.page_started", f"      Fetching page {page}...", page=page)
                 reviews_response = requests.get(
                     reviews_url,
                     headers=headers,
@@ -267,7 +271,7 @@ class MultiAPIAmazonScraper:
 
                 # Check for rate limiting
                 if reviews_response.status_code == 429:
-                    print(f"      Rate limited at page {page}")
+                    events.warning("rapidapi.page_rate_limited", f"      Rate limited at page {page}", page=page)
                     if all_reviews:
                         # Return what we have so far
                         break
@@ -279,7 +283,8 @@ class MultiAPIAmazonScraper:
                     }
 
                 if reviews_response.status_code != 200:
-                    print(f"      Page {page} returned status {reviews_response.status_code}")
+                    events.warning("rapidapi.page_status", f"      Page {page} returned status {reviews_response.status_code}",
+                                   page=page, status_code=reviews_response.status_code)
                     break
 
                 # Parse reviews from this page
@@ -287,11 +292,12 @@ class MultiAPIAmazonScraper:
                 page_reviews = self._parse_reviews_response(reviews_data)
 
                 if not page_reviews:
-                    print(f"      No more reviews found at page {page}")
+                    events.info("rapidapi.page_empty", f"      No more reviews found at page {page}", page=page)
                     break
 
                 all_reviews.extend(page_reviews)
-                print(f"      Got {len(page_reviews)} reviews (total: {len(all_reviews)})")
+                events.info("rapidapi.page_fetched", f"      Got {len(page_reviews)} reviews (total: {len(all_reviews)})",
+                            page=page, reviews=len(page_reviews), total=len(all_reviews))
                 page += 1
 
             if not all_reviews:
@@ -343,8 +349,8 @@ class MultiAPIAmazonScraper:
                 "rate_limited": False
             }
 
-    def _parse_reviews_response(self, data: Dict) -> List[Dict]:
-        """Parse RapidAPI reviews response into standard format."""
+    def _parse_reviews_response(self, data: Dict) -> List[Review]:
+        """Parse RapidAPI reviews response into standard review records."""
         reviews = []
 
         # Try different response structures
@@ -355,11 +361,21 @@ class MultiAPIAmazonScraper:
             []
         )
 
-        print(f"   Debug: Found {len(review_list)} reviews in response")
-        if review_list:
-            print(f"   Debug: First review keys: {list(review_list[0].keys())}")
+        # Debug events are checked once per response, so disabled logging costs nothing per review
+        debugging = events.enabled(events.DEBUG)
+        if debugging:
+            events.debug("rapidapi.response", f"   Debug: Found {len(review_list)} reviews in response",
+                         reviews=len(review_list))
+            if review_list:
+                events.debug("rapidapi.response", f"   Debug: First review keys: {list(review_list[0].keys())}")
+
+        # Reviews of one response share a date format: detect it once, parse through the cache
+        parsed_dates = parse_review_dates(
+            (review_data.get('date', '') or review_data.get('review_date', '')) if isinstance(review_data, dict) else ''
+            for review_data in review_list
+        )
 
-        for review_data in review_list:
+        for review_data, parsed_date in zip(review_list, parsed_dates):
             try:
                 rating = self._extract_rating(review_data)
                 review_text = review_data.get('body', '') or review_data.get('review_comment', '') or review_data.get('text', '')
@@ -369,40 +385,44 @@ class MultiAPIAmazonScraper:
                 if not author and isinstance(review_data.get('author'), dict):
                     author = review_data.get('author', {}).get('name', 'Anonymous')
                 elif not author:
-                    author = review_data.get('author', 'Anonymous')
+                    author = review_data.get('author') or 'Anonymous'
 
-                # Extract and parse date
+                # Raw date (parsed above)
                 date_raw = review_data.get('date', '') or review_data.get('review_date', '')
-                parsed_date = self._parse_date(date_raw)
-
-                review = {
-                    "rating": rating,
-                    "title": review_data.get('title', '') or review_data.get('review_title', ''),
-                    "review_text": review_text,
-                    "date": parsed_date,
-                    "date_raw": date_raw,
-                    "author": author,
-                    "verified_purchase": review_data.get('verified_purchase', False) or review_data.get('is_verified_purchase', False),
-                    "has_images": bool(review_data.get('images', []) or review_data.get('review_images', [])),
-                    "review_length": len(review_text)
-                }
 
-                # Debug: Show date parsing for first review
-                if len(all_reviews) == 0:
-                    print(f"      Debug: First review date_raw='{date_raw}', parsed={parsed_date}")
+                review = Review(
+                    rating=rating,
+                    title=review_data.get('title', '') or review_data.get('review_title', ''),
+                    review_text=review_text,
+                    date=parsed_date,
+                    date_raw=date_raw,
+                    author=author,
+                    verified_purchase=review_data.get('verified_purchase', False) or review_data.get('is_verified_purchase', False),
+                    has_images=bool(review_data.get('images', []) or review_data.get('review_images', [])),
+                    review_length=len(review_text)
+                )
 
-                # Debug why review might be rejected
-                if not review_text:
-                    print(f"   Debug: Review rejected - no text. Keys: {list(review_data.keys())}")
-                if not rating:
-                    print(f"   Debug: Review rejected - no rating. Available: {review_data.get('rating')}, {review_data.get('stars')}, {review_data.get('review_star')}")
+                if debugging:
+                    # Show date parsing for first review
+                    if not reviews:
+                        events.debug("rapidapi.review_date",
+                                     f"      Debug: First review date_raw='{date_raw}', parsed={parsed_date}")
+
+                    # Why a review might be rejected
+                    if not review_text:
+                        events.debug("rapidapi.review_rejected",
+                                     f"   Debug: Review rejected - no text. Keys: {list(review_data.keys())}")
+                    if not rating:
+                        events.debug("rapidapi.review_rejected",
+                                     f"   Debug: Review rejected - no rating. Available: {review_data.get('rating')}, "
+                                     f"{review_data.get('stars')}, {review_data.get('review_star')}")
 
                 # Only add if we have essential data
                 if review_text and rating:
                     reviews.append(review)
 
             except Exception as e:
-                print(f"Warning: Failed to parse review: {e}")
+                events.warning("rapidapi.review_parse_failed", f"Warning: Failed to parse review: {e}", error=str(e))
                 continue
 
         return reviews
@@ -415,17 +435,17 @@ class MultiAPIAmazonScraper:
 
         for review_data in top_reviews:
             try:
-                review = {
-                    "rating": self._extract_rating(review_data),
-                    "title": review_data.get('title', ''),
-                    "review_text": review_data.get('body', '') or review_data.get('text', ''),
-                    "date": self._parse_date(review_data.get('date', '')),
-                    "date_raw": review_data.get('date', ''),
-                    "author": review_data.get('author', 'Anonymous'),
-                    "verified_purchase": review_data.get('verified_purchase', False),
-                    "has_images": bool(review_data.get('images', [])),
-                    "review_length": len(review_data.get('body', '') or review_data.get('text', ''))
-                }
+                review = Review(
+                    rating=self._extract_rating(review_data),
+                    title=review_data.get('title', ''),
+                    review_text=review_data.get('body', '') or review_data.get('text', ''),
+                    date=self._parse_date(review_data.get('date', '')),
+                    date_raw=review_data.get('date', ''),
+                    author=review_data.get('author') or 'Anonymous',
+                    verified_purchase=review_data.get('verified_purchase', False),
+                    has_images=bool(review_data.get('images', [])),
+                    review_length=len(review_data.get('body', '') or review_data.get('text', ''))
+                )
 
                 if review["review_text"] and review["rating"]:
                     reviews.append(review)
@@ -456,15 +476,8 @@ class MultiAPIAmazonScraper:
         return float(rating)
 
     def _parse_date(self, date_str: str) -> Optional[datetime]:
-        """Parse date string to datetime."""
-        if not date_str:
-            return None
-
-        try:
-            from dateutil import parser
-            return parser.parse(date_str)
-        except:
-            return None
+        """Parse date string to datetime (memoized; dateutil only for unusual formats)."""
+        return parse_review_date(date_str)
 
 
 def scrape_reviews_multi_api(url: str, api_keys: Optional[List[str]] = None) -> Dict:
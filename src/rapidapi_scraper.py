@@ -5,9 +5,18 @@ Uses RapidAPI to fetch Amazon reviews (with free tier support)
 
 import requests
 import os
+import sys
 from typing import List, Dict, Optional
 from datetime import datetime
 
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src import events
+from src import utils
+from src.review import Review
+from src.date_parsing import parse_review_date
+
 
 class RapidAPIAmazonScraper:
     """
@@ -25,19 +34,7 @@ class RapidAPIAmazonScraper:
 
     def _extract_asin(self, url: str) -> Optional[str]:
         """Extract ASIN from Amazon URL."""
-        import re
-        patterns = [
-            r'/dp/([A-Z0-9]{10})',
-            r'/product/([A-Z0-9]{10})',
-            r'/gp/product/([A-Z0-9]{10})',
-            r'[?&]asin=([A-Z0-9]{10})'
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
-        return None
+        return utils.extract_asin(url)
 
     def scrape_reviews(self, url: str, max_reviews: int = 100) -> Dict:
         """
@@ -63,7 +60,7 @@ class RapidAPIAmazonScraper:
                 "rate_limited": False
             }
 
-        print(f"🔍 Fetching reviews via RapidAPI for ASIN: {asin}")
+        events.info("rapidapi.started", f"🔍 Fetching reviews via RapidAPI for ASIN: {asin}", asin=asin)
 
         try:
             # Call RapidAPI product reviews endpoint
@@ -83,7 +80,7 @@ class RapidAPIAmazonScraper:
 
             # Check for rate limiting
             if response.status_code == 429:
-                print("⚠️ RapidAPI rate limit reached (free tier exhausted)")
+                events.warning("rapidapi.rate_limited", "⚠️ RapidAPI rate limit reached (free tier exhausted)")
                 return {
                     "success": False,
                     "error": "Rate limit exceeded - free tier exhausted for this month",
@@ -93,7 +90,7 @@ class RapidAPIAmazonScraper:
 
             # Check for API key issues
             if response.status_code == 403:
-                print("⚠️ RapidAPI authentication failed")
+                events.error("rapidapi.auth_failed", "⚠️ RapidAPI authentication failed")
                 return {
                     "success": False,
                     "error": "API authentication failed - check your RapidAPI key",
@@ -103,7 +100,8 @@ class RapidAPIAmazonScraper:
 
             # Check for success
             if response.status_code != 200:
-                print(f"⚠️ RapidAPI returned status code: {response.status_code}")
+                events.warning("rapidapi.bad_status", f"⚠️ RapidAPI returned status code: {response.status_code}",
+                               status_code=response.status_code)
                 return {
                     "success": False,
                     "error": f"API returned status code {response.status_code}",
@@ -125,7 +123,8 @@ class RapidAPIAmazonScraper:
                     "rate_limited": False
                 }
 
-            print(f"✅ Successfully fetched {len(reviews)} reviews via RapidAPI")
+            events.info("rapidapi.complete", f"✅ Successfully fetched {len(reviews)} reviews via RapidAPI",
+                        reviews=len(reviews))
 
             return {
                 "success": True,
@@ -174,24 +173,24 @@ class RapidAPIAmazonScraper:
 
         for review_data in review_list:
             try:
-                review = {
-                    "rating": self._extract_rating(review_data),
-                    "title": review_data.get('title', ''),
-                    "review_text": review_data.get('body', '') or review_data.get('text', ''),
-                    "date": self._parse_date(review_data.get('date', '')),
-                    "date_raw": review_data.get('date', ''),
-                    "author": review_data.get('author', {}).get('name', 'Anonymous'),
-                    "verified_purchase": review_data.get('verified_purchase', False),
-                    "has_images": bool(review_data.get('images', [])),
-                    "review_length": len(review_data.get('body', '') or review_data.get('text', ''))
-                }
+                review = Review(
+                    rating=self._extract_rating(review_data),
+                    title=review_data.get('title', ''),
+                    review_text=review_data.get('body', '') or review_data.get('text', ''),
+                    date=self._parse_date(review_data.get('date', '')),
+                    date_raw=review_data.get('date', ''),
+                    author=review_data.get('author', {}).get('name', 'Anonymous'),
+                    verified_purchase=review_data.get('verified_purchase', False),
+                    has_images=bool(review_data.get('images', [])),
+                    review_length=len(review_data.get('body', '') or review_data.get('text', ''))
+                )
 
                 # Only add if we have essential data
                 if review["review_text"] and review["rating"]:
                     reviews.append(review)
 
             except Exception as e:
-                print(f"Warning: Failed to parse review: {e}")
+                events.warning("rapidapi.review_parse_failed", f"Warning: Failed to parse review: {e}", error=str(e))
                 continue
 
         return reviews
@@ -213,16 +212,8 @@ class RapidAPIAmazonScraper:
         return float(rating)
 
     def _parse_date(self, date_str: str) -> Optional[datetime]:
-        """Parse date string to datetime."""
-        if not date_str:
-            return None
-
-        try:
-            # Try common date formats
-            from dateutil import parser
-            return parser.parse(date_str)
-        except:
-            return None
+        """Parse date string to datetime (memoized; dateutil only for unusual formats)."""
+        return parse_review_date(date_str)
 
 
 def scrape_reviews_rapidapi(url: str, api_key: Optional[str] = None) -> Dict:
@@ -0,0 +1,360 @@
+"""
+Project Veritas - Report Cache
+Persistent SQLite cache of finished reports, keyed by ASIN, a fingerprint of the
+fetched review set and the configuration, with TTL expiry and LRU eviction by size
+"""
+
+import sys
+import os
+import json
+import time
+import zlib
+import sqlite3
+import hashlib
+import threading
+from typing import Dict, Optional
+import numpy as np
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config
+from src import events
+from src.compiled_config import CompiledConfig, compile_config
+
+
+# Bump when the report format changes, so reports cached by older code are never served
+REPORT_FORMAT_VERSION = 1
+
+# Report fields describing one run rather than the analysis; never cached
+RUN_FIELDS = ("timings", "cache", "review_flags_file", "feature_cache_file")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS reports (
+    key                 TEXT PRIMARY KEY,
+    asin                TEXT NOT NULL,
+    config_fingerprint  TEXT NOT NULL,
+    review_fingerprint  TEXT NOT NULL,
+    created             REAL NOT NULL,
+    accessed            REAL NOT NULL,
+    size                INTEGER NOT NULL,
+    report              BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS reports_by_product ON reports (asin, config_fingerprint, created);
+CREATE INDEX IF NOT EXISTS reports_by_access ON reports (accessed);
+CREATE TABLE IF NOT EXISTS counters (
+    name   TEXT PRIMARY KEY,
+    value  INTEGER NOT NULL
+);
+"""
+
+
+def review_fingerprint(review_ids: np.ndarray) -> str:
+    """
+    Digest of a fetched review set: its stable review IDs (ReviewBatch.review_ids),
+    sorted, so the order the API returned them in does not matter.
+
+    Args:
+        review_ids (np.ndarray): uint64 stable review IDs
+
+    Returns:
+        str: 32-character hex digest
+    """
+    ids = np.sort(np.asarray(review_ids, dtype=np.uint64))
+    return hashlib.blake2b(ids.tobytes(), digest_size=16).hexdigest()
+
+
+def config_fingerprint(compiled: CompiledConfig = None) -> str:
+    """
+    Digest of the settings a report depends on: CompiledConfig.fingerprint
+    without the REPORT_CACHE_* settings, so tuning the cache keeps its entries.
+
+    Args:
+        compiled (CompiledConfig, optional): Configuration snapshot (default: current config)
+
+    Returns:
+        str: 32-character hex digest
+    """
+    compiled = compiled or compile_config()
+    return compiled.fingerprint_without("REPORT_CACHE_")
+
+
+def cache_key(asin: str, reviews_fingerprint: str, settings_fingerprint: str) -> str:
+    """
+    Combines the ASIN, review set and configuration fingerprints (and the report format version) into a key.
+    """
+    key = f"{REPORT_FORMAT_VERSION}\x1f{asin}\x1f{reviews_fingerprint}\x1f{settings_fingerprint}"
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class ReportCache:
+    """
+    Finished reports stored in one SQLite file, as zlib-compressed JSON.
+
+    An entry is keyed by (ASIN, review fingerprint, config fingerprint): the
+    same reviews analyzed with the same settings give the same report, so a
+    hit skips the analysis and the scoring. ``latest()`` additionally finds an
+    ASIN's newest report regardless of its reviews, for callers that accept a
+    report up to some age instead of re-fetching the reviews.
+
+    Eviction:
+        TTL   entries older than ``ttl_seconds`` are never served, and are
+              deleted whenever a report is stored
+        LRU   when the compressed reports exceed ``max_bytes``, the least
+              recently served or stored ones are deleted first
+
+    Hits and misses are counted in the database, so the totals span every
+    process and run sharing the file. SQLite serializes writers, and one
+    cache object may be shared between threads.
+    """
+
+    def __init__(self, path: str, ttl_seconds: float = None, max_bytes: int = None):
+        """
+        Opens (or creates) the cache file.
+
+        Args:
+            path (str): SQLite file path (parent directories are created)
+            ttl_seconds (float, optional): Entry lifetime (default: config.REPORT_CACHE_TTL_SECONDS)
+            max_bytes (int, optional): Compressed size budget (default: config.REPORT_CACHE_MAX_BYTES)
+        """
+        self.path = path
+        self.ttl_seconds = config.REPORT_CACHE_TTL_SECONDS if ttl_seconds is None else ttl_seconds
+        self.max_bytes = config.REPORT_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._connection = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript(_SCHEMA)
+
+    def __enter__(self) -> "ReportCache":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Closes the database connection.
+        """
+        with self._lock:
+            self._connection.close()
+
+    def _count(self, name: str) -> None:
+        self._connection.execute(
+            "INSERT INTO counters (name, value) VALUES (?, 1) ON CONFLICT(name) DO UPDATE SET value = value + 1",
+            (name,)
+        )
+
+    def _serve(self, row, now: float, lookup: str) -> Dict:
+        """
+        Decodes a stored report, marks it as recently used and counts the hit.
+        """
+        key, created, blob = row
+        self._connection.execute("UPDATE reports SET accessed = ? WHERE key = ?", (now, key))
+        self._count("hits")
+        report = json.loads(zlib.decompress(blob))
+        report["cache"] = {"status": "hit", "lookup": lookup, "key": key, "age_seconds": round(now - created, 1)}
+        return report
+
+    def get(self, asin: str, reviews_fingerprint: str, settings_fingerprint: str) -> Optional[Dict]:
+        """
+        Returns the cached report for exactly this review set and configuration.
+
+        Args:
+            asin (str): Product ASIN
+            reviews_fingerprint (str): Fingerprint of the fetched reviews (see review_fingerprint)
+            settings_fingerprint (str): Configuration fingerprint (see config_fingerprint)
+
+        Returns:
+            Optional[Dict]: The report, with "cache" metadata ({"status": "hit",
+            "lookup": "reviews", "key", "age_seconds"}), or None on a miss
+        """
+        key = cache_key(asin, reviews_fingerprint, settings_fingerprint)
+        now = time.time()
+        try:
+            with self._lock:
+                row = self._connection.execute(
+                    "SELECT key, created, report FROM reports WHERE key = ? AND created >= ?",
+                    (key, now - self.ttl_seconds)
+                ).fetchone()
+                if row is None:
+                    self._count("misses")
+                    return None
+                return self._serve(row, now, "reviews")
+        except (sqlite3.Error, zlib.error, ValueError) as e:
+            events.warning("report_cache.error", f"   ⚠️  Report cache lookup failed: {e}", error=str(e))
+            return None
+
+    def latest(self, asin: str, settings_fingerprint: str, max_age_seconds: float) -> Optional[Dict]:
+        """
+        Returns the newest cached report of an ASIN under this configuration,
+        if it is at most ``max_age_seconds`` old, whatever its reviews.
+
+        Only hits are counted: a caller that misses here goes on to fetch the
+        reviews, and its get() decides whether that run is a hit or a miss.
+
+        Args:
+            asin (str): Product ASIN
+            settings_fingerprint (str): Configuration fingerprint (see config_fingerprint)
+            max_age_seconds (float): Oldest acceptable report (capped by the TTL)
+
+        Returns:
+            Optional[Dict]: The report, with "cache" metadata ({"status": "hit",
+            "lookup": "recent", "key", "age_seconds"}), or None
+        """
+        now = time.time()
+        try:
+            with self._lock:
+                row = self._connection.execute(
+                    "SELECT key, created, report FROM reports WHERE asin = ? AND config_fingerprint = ? "
+                    "AND created >= ? ORDER BY created DESC LIMIT 1",
+                    (asin, settings_fingerprint, now - min(max_age_seconds, self.ttl_seconds))
+                ).fetchone()
+                return self._serve(row, now, "recent") if row is not None else None
+        except (sqlite3.Error, zlib.error, ValueError) as e:
+            events.warning("report_cache.error", f"   ⚠️  Report cache lookup failed: {e}", error=str(e))
+            return None
+
+    def put(self, asin: str, reviews_fingerprint: str, settings_fingerprint: str, report: Dict) -> Optional[str]:
+        """
+        Stores a finished report (without its RUN_FIELDS), then evicts expired
+        and least recently used entries.
+
+        Args:
+            asin (str): Product ASIN
+            reviews_fingerprint (str): Fingerprint of the analyzed reviews (see review_fingerprint)
+            settings_fingerprint (str): Configuration fingerprint (see config_fingerprint)
+            report (Dict): Report from generate_full_report
+
+        Returns:
+            Optional[str]: Cache key, or None if the report could not be stored
+        """
+        key = cache_key(asin, reviews_fingerprint, settings_fingerprint)
+        blob = zlib.compress(json.dumps(
+            {name: value for name, value in report.items() if name not in RUN_FIELDS}
+        ).encode("utf-8"))
+        now = time.time()
+        try:
+            with self._lock:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO reports "
+                    "(key, asin, config_fingerprint, review_fingerprint, created, accessed, size, report) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (key, asin, settings_fingerprint, reviews_fingerprint, now, now, len(blob), blob)
+                )
+                self._evict(now)
+        except sqlite3.Error as e:
+            events.warning("report_cache.error", f"   ⚠️  Report cache write failed: {e}", error=str(e))
+            return None
+        return key
+
+    def evict(self) -> int:
+        """
+        Deletes expired entries, then least recently used ones until the size budget is met.
+
+        Returns:
+            int: Number of entries deleted
+        """
+        with self._lock:
+            return self._evict(time.time())
+
+    def _evict(self, now: float) -> int:
+        connection = self._connection
+        removed = connection.execute("DELETE FROM reports WHERE created < ?", (now - self.ttl_seconds,)).rowcount
+
+        total = connection.execute("SELECT COALESCE(SUM(size), 0) FROM reports").fetchone()[0]
+        if total > self.max_bytes:
+            # Keep the most recently used entries that fit the budget
+            stale = []
+            kept = 0
+            for key, size in connection.execute("SELECT key, size FROM reports ORDER BY accessed DESC"):
+                if kept + size <= self.max_bytes and not stale:
+                    kept += size
+                else:
+                    stale.append((key,))
+            connection.executemany("DELETE FROM reports WHERE key = ?", stale)
+            removed += len(stale)
+
+        if removed:
+            events.debug("report_cache.evicted", f"🗑️  Report cache: {removed} entries evicted", removed=removed)
+        return removed
+
+    def stats(self) -> Dict:
+        """
+        Returns the cache statistics.
+
+        Returns:
+            Dict: {"entries", "bytes", "hits", "misses"} (hits and misses over the file's lifetime)
+        """
+        with self._lock:
+            entries, size = self._connection.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM reports").fetchone()
+            counters = dict(self._connection.execute("SELECT name, value FROM counters"))
+        return {"entries": entries, "bytes": size, "hits": counters.get("hits", 0),
+                "misses": counters.get("misses", 0)}
+
+    def clear(self) -> None:
+        """
+        Deletes every entry and resets the counters.
+        """
+        with self._lock:
+            self._connection.execute("DELETE FROM reports")
+            self._connection.execute("DELETE FROM counters")
+
+
+# Example usage
+if __name__ == "__main__":
+    import tempfile
+    from src.synthetic import generate_reviews
+    from src.review_batch import ReviewBatch
+    from src.analyzer import analyze_data
+    from src.scorer import generate_full_report
+
+    reviews = generate_reviews(3000, seed=4)
+    start = time.perf_counter()
+    batch = ReviewBatch(reviews)
+    analysis = analyze_data(batch)
+    report = generate_full_report(batch, analysis, "https://amazon.com/dp/B08N5WRWNW")
+    compute_seconds = time.perf_counter() - start
+
+    settings = config_fingerprint()
+    fingerprint = review_fingerprint(batch.review_ids)
+    assert fingerprint == review_fingerprint(batch.review_ids[::-1])  # Order-independent
+    assert fingerprint != review_fingerprint(batch.review_ids[1:])
+    assert settings == config_fingerprint(compile_config({"REPORT_CACHE_TTL_SECONDS": 60}))
+    assert settings != config_fingerprint(compile_config({"VELOCITY_PENALTY": -20}))
+
+    with tempfile.TemporaryDirectory() as directory:
+        with ReportCache(os.path.join(directory, "reports.sqlite")) as cache:
+            assert cache.get("B08N5WRWNW", fingerprint, settings) is None
+            cache.put("B08N5WRWNW", fingerprint, settings, dict(report, timings=[]))
+
+            start = time.perf_counter()
+            cached = cache.get("B08N5WRWNW", fingerprint, settings)
+            lookup_seconds = time.perf_counter() - start
+            assert cached.pop("cache")["status"] == "hit" and cached == report
+            assert cache.get("B08N5WRWNW", review_fingerprint(batch.review_ids[1:]), settings) is None
+            assert cache.latest("B08N5WRWNW", settings, 3600)["cache"]["lookup"] == "recent"
+            assert cache.latest("B000000000", settings, 3600) is None
+            assert cache.stats()["hits"] == 2 and cache.stats()["misses"] == 2
+
+            # TTL: expired entries are neither served nor kept
+            cache.ttl_seconds = -1
+            assert cache.get("B08N5WRWNW", fingerprint, settings) is None and cache.evict() == 1
+            cache.ttl_seconds = 3600
+
+            # LRU: the budget keeps the most recently used reports
+            for product in range(5):
+                cache.put(f"B00000000{product}", fingerprint, settings, report)
+            cache.get("B000000000", fingerprint, settings)
+            cache.max_bytes = 2 * cache.stats()["bytes"] // 5
+            cache.evict()
+            assert cache.stats()["entries"] == 2
+            assert cache.get("B000000000", fingerprint, settings) is not None
+            assert cache.get("B000000004", fingerprint, settings) is not None
+            size = cache.stats()["bytes"] // 2
+
+    print(f"✓ Report cache keys, TTL expiry and LRU eviction behave as documented")
+    print(f"⏱️  Report for 3000 reviews: analyzed and scored in {compute_seconds * 1000:.0f} ms, "
+          f"served from cache in {lookup_seconds * 1000:.1f} ms ({size:,} bytes compressed)")
@@ -0,0 +1,418 @@
+"""
+Project Veritas - What-If Rescoring
+Caches the per-review features and per-check intermediate statistics of an analysis run,
+so every red flag, the Trust Score and the Quality Score can be recomputed for changed
+config.py thresholds and penalties without re-scraping or re-running the checks
+"""
+
+import sys
+import os
+import copy
+import gzip
+import pickle
+import contextlib
+from typing import List, Dict, Any, Tuple, Union
+import numpy as np
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src import events
+from src.review_batch import ReviewBatch
+from src.compiled_config import CompiledConfig, compile_config
+from src.text_features import get_text_features
+from src.ngram_index import NGramIndex
+from src.near_duplicates import feature_signatures, cluster_signatures
+from src.analyzer import (
+    RED_FLAG_CHECKS, _author_rating_pairs, _velocity_result, _generic_praise_mask, _generic_praise_result,
+    _suspicious_author_mask, _sorted_author_burst_mask, _suspicious_reviewers_result,
+    _linguistic_anomaly_mask, _linguistic_anomalies_result, _sentiment_imbalance_result,
+    _length_extreme_mask, _length_extremes_result, _verified_ratio_result,
+    _repetitive_phrases_from_index, _near_duplicates_result, review_flag_bits
+)
+from src.scorer import score_statistics, score_fields, _trusted_mask
+
+
+class FeatureCache:
+    """
+    Everything the checks and the scorer read from one product's reviews,
+    extracted once and kept independent of the configuration.
+
+    Per-review features (the ``FEATURE_COLUMNS`` of ``feature_matrix()``):
+        the ReviewBatch columns (rating, epoch, review_length, verified_purchase,
+        has_images, ...) and the TextFeatures arrays (word counts, lengths,
+        caps ratio, punctuation runs, keyword stuffing, phrase hits), held by a
+        dict-free batch, plus each review's title and body for phrase hits
+
+    Per-check intermediate statistics:
+        velocity      dated review positions and timestamps, in date order
+        reviewers     reviews per author, (author, rating) pair counts and the
+                      per-author timestamp index scanned by the burst rule
+        sentiment     rated, 5-star and 1-star counts, 5-star positions
+        verified      verified count, unverified positions
+        bonuses       image count and the 3/4/5-star counts
+
+    Intermediates that depend on a setting are built on first use and memoized
+    per value: phrase-hit features per phrase list, the n-gram index per
+    REPETITIVE_PHRASE_MIN_LENGTH, MinHash signatures per (num_perm, shingle
+    size) and near-duplicate clusters per clustering setting. Everything else
+    a setting changes is a vectorized comparison against the cached arrays.
+
+    Caches are built by cache_features() and scored by rescore().
+    """
+
+    FEATURE_COLUMNS = (
+        "rating", "has_rating", "epoch", "has_date", "review_length", "verified_purchase", "has_images",
+        "word_count", "text_length", "body_word_count", "body_length", "caps_ratio", "punctuation_runs",
+        "max_word_frequency", "generic_phrase_hits", "negative_keyword_hits"
+    )
+
+    def __init__(self, reviews: Union[List[Dict], ReviewBatch], url: str = "", compiled: CompiledConfig = None):
+        compiled = compiled or compile_config()
+        batch = ReviewBatch.from_reviews(reviews)
+        get_text_features(batch, compiled)
+
+        self.url = url
+
+        # Titles and bodies are all the phrase-hit features need from the dicts
+        self.texts = [{"title": review.get("title", ""), "review_text": review.get("review_text", "")}
+                      for review in batch.reviews]
+        self.batch = batch.columnar()
+
+        # Velocity: dated reviews in timestamp order (stable, like check_review_velocity)
+        dated_indices = np.flatnonzero(self.batch.has_date)
+        self.dated_indices = dated_indices[np.argsort(self.batch.epoch[dated_indices], kind="stable")]
+        self.dated_epochs = self.batch.epoch[self.dated_indices]
+
+        # Reviewers: per-author counts, rating pairs and the (author, time) sorted index
+        author_ids = self.batch.author_ids
+        has_rating = self.batch.has_rating
+        self.author_count = len(self.batch.authors)
+        self.reviews_per_author = np.bincount(author_ids, minlength=self.author_count)
+        self.pair_authors, _, self.pair_counts = _author_rating_pairs(
+            author_ids[has_rating], self.batch.rating[has_rating]
+        )
+        dated_authors = author_ids[self.batch.has_date]
+        dated_epochs = self.batch.epoch[self.batch.has_date]
+        order = np.lexsort((dated_epochs, dated_authors))
+        self.sorted_authors = dated_authors[order]
+        self.sorted_epochs = dated_epochs[order]
+
+        # Rating, verified and image counts
+        rating = self.batch.rating
+        self.rated_count = int(np.count_nonzero(has_rating))
+        self.rating_counts = {stars: int(np.count_nonzero(rating == stars)) for stars in (1.0, 3.0, 4.0, 5.0)}
+        self.five_star_indices = np.flatnonzero(rating == 5.0)
+        self.verified_count = int(np.count_nonzero(self.batch.verified_purchase))
+        self.unverified_indices = np.flatnonzero(~self.batch.verified_purchase)
+        self.image_count = int(np.count_nonzero(self.batch.has_images))
+
+        # Setting-dependent intermediates, memoized per value
+        self.views = {}
+        self.ngram_indexes = {}
+        self.signatures = {}
+        self.clusters = {}
+        self._feature_matrix = None
+
+        # Build the intermediates of the configuration the run was analyzed with
+        self.red_flags(compiled)
+
+    def __len__(self) -> int:
+        return len(self.batch)
+
+    def view(self, compiled: CompiledConfig = None) -> ReviewBatch:
+        """
+        Returns the cached batch with text features matching the config's phrase lists.
+        Other phrase lists get their own shallow copy of the features (only the
+        phrase-hit arrays are recomputed), so switching back and forth is free.
+
+        Args:
+            compiled (CompiledConfig, optional): Configuration snapshot (default: current config)
+
+        Returns:
+            ReviewBatch: Dict-free batch whose text features match ``compiled``
+        """
+        compiled = compiled or compile_config()
+        view = self.views.get(compiled.phrase_key)
+        if view is not None:
+            return view
+
+        features = self.batch.text_features
+        if features.phrase_key != compiled.phrase_key:
+            features = copy.copy(features)
+            features.refresh_phrase_hits(self.texts, compiled)
+
+        view = copy.copy(self.batch)
+        view.text_features = features
+        self.views[compiled.phrase_key] = view
+        return view
+
+    def ngram_index(self, n: int) -> NGramIndex:
+        """
+        Returns the n-gram index of the reviews (built once per n).
+        """
+        index = self.ngram_indexes.get(n)
+        if index is None:
+            index = NGramIndex.from_text_features(self.batch.text_features, n)
+            self.ngram_indexes[n] = index
+        return index
+
+    def near_duplicate_clusters(self, compiled: CompiledConfig = None) -> List[np.ndarray]:
+        """
+        Returns the near-duplicate clusters for the config's NEAR_DUPLICATE_* settings.
+        Signatures are reused across thresholds and minimum cluster sizes.
+        """
+        compiled = compiled or compile_config()
+        signature_key = (compiled.NEAR_DUPLICATE_NUM_PERM, compiled.NEAR_DUPLICATE_SHINGLE_SIZE)
+        cluster_key = signature_key + (compiled.NEAR_DUPLICATE_JACCARD_THRESHOLD,
+                                       compiled.NEAR_DUPLICATE_MIN_CLUSTER_SIZE)
+
+        clusters = self.clusters.get(cluster_key)
+        if clusters is None:
+            signed = self.signatures.get(signature_key)
+            if signed is None:
+                signed = feature_signatures(self.batch.text_features, *signature_key)
+                self.signatures[signature_key] = signed
+            clusters = cluster_signatures(*signed, *cluster_key[2:])
+            self.clusters[cluster_key] = clusters
+        return clusters
+
+    def feature_matrix(self) -> Tuple[np.ndarray, Tuple[str, ...]]:
+        """
+        Returns the per-review features as one float64 matrix (reviews x FEATURE_COLUMNS),
+        with the phrase hits of the configuration the cache was built with.
+
+        Returns:
+            Tuple[np.ndarray, Tuple[str, ...]]: (matrix, column names)
+        """
+        if self._feature_matrix is None:
+            features = self.batch.text_features
+            self._feature_matrix = np.column_stack([
+                getattr(self.batch, name) if hasattr(self.batch, name) else getattr(features, name)
+                for name in self.FEATURE_COLUMNS
+            ]).astype(np.float64)
+        return self._feature_matrix, self.FEATURE_COLUMNS
+
+    def red_flags(self, compiled: CompiledConfig = None) -> Dict[str, Dict]:
+        """
+        Recomputes every red flag result from the cached features.
+
+        Args:
+            compiled (CompiledConfig, optional): Configuration snapshot (default: current config)
+
+        Returns:
+            Dict[str, Dict]: Check results keyed by flag name, as analyze_data reports them
+        """
+        compiled = compiled or compile_config()
+        view = self.view(compiled)
+
+        return {
+            "review_velocity": _velocity_result(view, self.dated_indices, self.dated_epochs, compiled),
+            "generic_praise": _generic_praise_result(
+                view, np.flatnonzero(_generic_praise_mask(view, compiled)), compiled
+            ),
+            "suspicious_reviewers": _suspicious_reviewers_result(
+                view,
+                _suspicious_author_mask(self.reviews_per_author, self.pair_authors, self.pair_counts, compiled),
+                _sorted_author_burst_mask(self.sorted_authors, self.sorted_epochs, self.author_count, compiled),
+                compiled
+            ),
+            "linguistic_anomalies": _linguistic_anomalies_result(
+                view, np.flatnonzero(_linguistic_anomaly_mask(view, compiled)), compiled
+            ),
+            "sentiment_imbalance": _sentiment_imbalance_result(
+                view, self.rated_count, self.rating_counts[5.0], self.rating_counts[1.0],
+                self.five_star_indices, compiled
+            ),
+            "review_length_extremes": _length_extremes_result(
+                view, np.flatnonzero(_length_extreme_mask(view, compiled)), compiled
+            ),
+            "verified_ratio": _verified_ratio_result(view, self.verified_count, self.unverified_indices, compiled),
+            "repetitive_phrases": _repetitive_phrases_from_index(
+                view, view.text_features, self.ngram_index(compiled.REPETITIVE_PHRASE_MIN_LENGTH), compiled
+            ),
+            "near_duplicates": _near_duplicates_result(view, self.near_duplicate_clusters(compiled), compiled)
+        }
+
+    def save(self, path: str) -> None:
+        """
+        Writes the cache (features and memoized intermediates) to a gzip-compressed pickle.
+        Only load cache files you wrote yourself: unpickling can run arbitrary code.
+
+        Args:
+            path (str): Output file path
+        """
+        # The per-config views are rebuilt on demand and the matrix is derived
+        state = dict(self.__dict__, views={}, _feature_matrix=None)
+        with gzip.open(path, "wb") as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path: str) -> "FeatureCache":
+        """
+        Restores a cache written with save().
+
+        Args:
+            path (str): Cache file path
+
+        Returns:
+            FeatureCache: Restored cache
+        """
+        cache = cls.__new__(cls)
+        with gzip.open(path, "rb") as f:
+            cache.__dict__.update(pickle.load(f))
+        return cache
+
+
+def cache_features(reviews: Union[List[Dict], ReviewBatch], url: str = "",
+                   compiled: CompiledConfig = None) -> FeatureCache:
+    """
+    Builds the feature cache of an analyzed product.
+
+    Pass the batch the analysis ran on: its text features are reused instead
+    of re-tokenizing the reviews.
+
+    Args:
+        reviews (Union[List[Dict], ReviewBatch]): All reviews (or the batch built for analysis)
+        url (str): Product URL, copied into rescored reports
+        compiled (CompiledConfig, optional): Configuration the run was analyzed with
+
+    Returns:
+        FeatureCache: Cache for rescore()
+    """
+    return FeatureCache(reviews, url, compiled)
+
+
+def rescore(cached_features: FeatureCache, config_overrides: Dict[str, Any] = None,
+            verbose: bool = False) -> Dict:
+    """
+    Recomputes every red flag, the Trust Score and the Quality Score for a config variant,
+    from cached features only (no scraping, tokenizing or hashing).
+
+    The results are the ones analyze_data + generate_full_report give with
+    compile_config(config_overrides): the same flag results, review bitset,
+    trusted subset and report fields.
+
+    Args:
+        cached_features (FeatureCache): Cache from cache_features() or FeatureCache.load()
+        config_overrides (Dict[str, Any], optional): Setting name -> value, e.g. {"VELOCITY_PENALTY": -20}
+        verbose (bool): Whether to print the scoring progress (default: False)
+
+    Returns:
+        Dict: {
+            "analysis_report": Dict,  # analyze_data format
+            "report": Dict            # generate_full_report format
+        }
+
+    Example:
+        >>> cache = FeatureCache.load("features.pkl.gz")
+        >>> rescore(cache, {"FIVE_STAR_THRESHOLD": 0.7})["report"]["trust_score"]
+    """
+    cache = cached_features
+    compiled = compile_config(config_overrides)
+
+    with events.subscribed(events.console_printer(), local=True) if verbose else contextlib.nullcontext():
+        red_flags = cache.red_flags(compiled)
+
+        analysis_report = {
+            "total_reviews": len(cache),
+            "red_flags": red_flags,
+            "total_score_impact": 0,
+            "triggered_flags": []
+        }
+        for flag_name in RED_FLAG_CHECKS:
+            result = red_flags[flag_name]
+            if result["triggered"]:
+                analysis_report["total_score_impact"] += result["score_impact"]
+                if result["score_impact"] < 0:  # Penalty
+                    analysis_report["triggered_flags"].append(flag_name)
+        analysis_report["review_flags"] = review_flag_bits(len(cache), red_flags)
+
+        # Trust and Quality Scores from one statistics pass, the trusted subset as a mask
+        batch = cache.view(compiled)
+        trusted = _trusted_mask(batch, analysis_report)
+        statistics = score_statistics(batch, trusted, compiled)
+        trusted_count = statistics["trusted_count"]
+        scores, score_breakdown = score_fields(statistics, analysis_report, compiled)
+
+    report = {
+        "project": "Project Veritas",
+        "url": cache.url,
+        **scores,
+        "total_reviews_analyzed": len(cache),
+        "trusted_reviews_count": trusted_count,
+        "suspicious_reviews_count": len(cache) - trusted_count,
+        "red_flags_triggered": [flag_name.replace("_", " ").title()
+                                for flag_name in analysis_report["triggered_flags"]],
+        "score_breakdown": score_breakdown
+    }
+
+    return {"analysis_report": analysis_report, "report": report}
+
+
+# Example usage
+if __name__ == "__main__":
+    import time
+    import random
+    import tempfile
+    from datetime import datetime, timedelta
+    from src.analyzer import analyze_data
+    from src.scorer import generate_full_report
+
+    words = ("great product amazing love it works well battery life the and is this was very good bad broke "
+             "returned refund cheap quality excellent highly recommend would buy again size fits color").split()
+
+    # Cross-check: rescoring a cache must match a full analysis with the same overrides
+    rng = random.Random(11)
+    templates = [" ".join(rng.choice(words) for _ in range(12)) for _ in range(3)]
+    reviews = [
+        {
+            "rating": rng.choice([1.0, 3.0, 4.0, 5.0, 5.0, None]),
+            "title": rng.choice(words),
+            "review_text": rng.choice(templates) if rng.random() < 0.2 else
+                           " ".join(rng.choice(words) for _ in range(rng.randint(0, 40))),
+            "date": datetime(2024, 1, 1) + timedelta(hours=rng.randint(0, rng.choice([48, 2000]))),
+            "author": f"user{rng.randint(0, 60)}",
+            "verified_purchase": rng.random() < 0.6,
+            "has_images": rng.random() < 0.1
+        }
+        for _ in range(2000)
+    ]
+    for review in reviews:
+        review["review_length"] = len(review["review_text"])
+
+    variants = [
+        None,
+        {"VELOCITY_PENALTY": -25, "VELOCITY_THRESHOLD_PERCENTAGE": 0.1},
+        {"FIVE_STAR_THRESHOLD": 0.2, "VERIFIED_LOW_THRESHOLD": 0.7, "GENERIC_MIN_LENGTH": 30},
+        {"GENERIC_PHRASES": ["works well", "love it"], "QUALITY_NEGATIVE_KEYWORDS": ["broke", "refund"]},
+        {"REPETITIVE_PHRASE_MIN_LENGTH": 4, "NEAR_DUPLICATE_JACCARD_THRESHOLD": 0.6,
+         "REVIEWER_RED_FLAGS": {"reviews_in_short_time": 2, "days_window": 30, "same_rating_percentage": 0.8}},
+        {"GRADE_SCALE": {95: "A", 80: "B", 60: "C", 40: "D", 0: "F"}, "REVIEW_LENGTH_MIN": 5}
+    ]
+
+    cache = cache_features(reviews, "https://amazon.com/test")
+    with tempfile.NamedTemporaryFile(suffix=".pkl.gz") as cache_file:
+        cache.save(cache_file.name)
+        cache = FeatureCache.load(cache_file.name)
+
+    for overrides in variants:
+        compiled = compile_config(overrides)
+        expected_analysis = analyze_data(reviews, compiled=compiled)
+        expected = generate_full_report(reviews, expected_analysis, "https://amazon.com/test", compiled=compiled)
+
+        rescored = rescore(cache, overrides)
+        assert rescored["report"] == expected, f"scores differ for {overrides}"
+        for flag_name in RED_FLAG_CHECKS:
+            assert rescored["analysis_report"]["red_flags"][flag_name] == expected_analysis["red_flags"][flag_name], \
+                (overrides, flag_name)
+        assert np.array_equal(rescored["analysis_report"]["review_flags"], expected_analysis["review_flags"])
+
+    start = time.perf_counter()
+    rounds = 50
+    for round_number in range(rounds):
+        rescore(cache, {"VELOCITY_PENALTY": -10 - round_number % 10, "FIVE_STAR_THRESHOLD": 0.5 + round_number % 5 / 10})
+    elapsed = (time.perf_counter() - start) / rounds
+
+    print(f"✓ Rescored reports match the full pipeline for {len(variants)} config variants ({len(reviews)} reviews)")
+    print(f"⏱️  Rescore: {elapsed * 1000:.1f} ms per config variant")
@@ -0,0 +1,214 @@
+"""
+Project Veritas - Review Record
+Compact slotted record for one scraped review, readable like the dictionaries
+the scrapers used to return
+"""
+
+import sys
+import os
+from collections.abc import Mapping
+from datetime import datetime
+from typing import Dict, Any, Iterator
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src import utils
+
+
+# Keys of a review, in the scrapers' order
+REVIEW_FIELDS = ("rating", "title", "review_text", "date", "date_raw", "author",
+                 "verified_purchase", "has_images", "review_length")
+
+_FIELD_SET = frozenset(REVIEW_FIELDS)
+
+
+def _intern(value: Any) -> Any:
+    """
+    Interns strings that repeat across reviews (author names, date lines).
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
+class Review(Mapping):
+    """
+    One review, stored in slots instead of a per-review dict.
+
+    Fields are the scraper's review keys:
+
+        rating             float (None when unknown)
+        title              str
+        review_text        str
+        date               datetime (None when unparsable)
+        date_raw           str, the date line as scraped
+        author             str
+        verified_purchase  bool
+        has_images         bool
+        review_length      int
+
+    plus ``epoch``: the date as epoch seconds (None without a date), kept in
+    step with ``date`` so the columnar batch reads it without converting.
+
+    A review is also a Mapping over those keys, so code written for the
+    dictionaries keeps working unchanged: ``review["rating"]``,
+    ``review.get("date")``, ``dict(review)``, ``review == {...}``,
+    ``"author" in review``. Item assignment updates a field (parsers fill
+    records in step by step); unknown keys raise KeyError.
+
+    Memory: a 9-key dict costs 272 bytes before its values, a record 112.
+    Records also intern the author and date line (shared by every review of
+    the same author / day) and only store ``review_length`` when it differs
+    from len(title) + 1 + len(review_text), the length the HTML scraper
+    records. Measured by ``python src/review.py`` on a 100k-review synthetic
+    corpus, text included: ~825 bytes per review as dicts, ~585 as records
+    (29% less; the stored epoch costs ~40 of the bytes saved). Dates parsed
+    by src/date_parsing.py are shared between reviews of the same day,
+    which saves another 48 bytes per scraped review.
+    """
+
+    __slots__ = ("rating", "title", "review_text", "_date", "epoch", "date_raw", "author",
+                 "verified_purchase", "has_images", "_review_length")
+
+    def __init__(self, rating: float = None, title: str = "", review_text: str = "", date: datetime = None,
+                 date_raw: str = "", author: str = "Anonymous", verified_purchase: bool = False,
+                 has_images: bool = False, review_length: int = None):
+        self.rating = rating
+        self.title = title
+        self.review_text = review_text
+        self.date = date
+        self.date_raw = _intern(date_raw)
+        self.author = _intern(author)
+        self.verified_purchase = verified_purchase
+        self.has_images = has_images
+        self._review_length = None
+        if review_length is not None:
+            self.review_length = review_length
+
+    @classmethod
+    def from_dict(cls, review: Dict) -> "Review":
+        """
+        Builds a record from a review dictionary (missing keys take the defaults).
+
+        Args:
+            review (Dict): Review in the scraper's dict format
+
+        Returns:
+            Review: Equivalent record
+        """
+        return cls(**{key: review[key] for key in REVIEW_FIELDS if key in review})
+
+    @property
+    def date(self) -> datetime:
+        return self._date
+
+    @date.setter
+    def date(self, value: datetime) -> None:
+        self._date = value
+        self.epoch = utils.to_epoch_seconds(value)
+
+    @property
+    def review_length(self) -> int:
+        if self._review_length is not None:
+            return self._review_length
+        return len(self.title or "") + 1 + len(self.review_text or "")
+
+    @review_length.setter
+    def review_length(self, value: int) -> None:
+        default = len(self.title or "") + 1 + len(self.review_text or "")
+        self._review_length = None if value == default else value
+
+    # Dict-compatible access ------------------------------------------------
+
+    def __getitem__(self, key: str) -> Any:
+        if key in _FIELD_SET:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key not in _FIELD_SET:
+            raise KeyError(key)
+        if key == "review_length":
+            self.review_length = value
+        elif key in ("title", "review_text"):
+            # Like a dict, editing the text keeps the length recorded so far
+            length = self.review_length
+            setattr(self, key, value)
+            self.review_length = length
+        else:
+            setattr(self, key, _intern(value) if key in ("author", "date_raw") else value)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in _FIELD_SET:
+            return getattr(self, key)
+        return default
+
+    def __contains__(self, key: object) -> bool:
+        return key in _FIELD_SET
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(REVIEW_FIELDS)
+
+    def __len__(self) -> int:
+        return len(REVIEW_FIELDS)
+
+    def keys(self):
+        return REVIEW_FIELDS
+
+    def to_dict(self) -> Dict:
+        """
+        Returns the review as a plain dictionary.
+        """
+        return {key: getattr(self, key) for key in REVIEW_FIELDS}
+
+    def __repr__(self) -> str:
+        return f"Review({', '.join(f'{key}={getattr(self, key)!r}' for key in REVIEW_FIELDS)})"
+
+    def __reduce__(self):
+        return (Review, tuple(getattr(self, key) for key in REVIEW_FIELDS))
+
+
+# Example usage
+if __name__ == "__main__":
+    import gc
+    import copy
+    import pickle
+    import tracemalloc
+    from src.synthetic import generate_reviews
+    from src.analyzer import analyze_data
+
+    records = generate_reviews(2000, seed=2)
+    dicts = [record.to_dict() for record in records]
+    assert records == dicts and dicts == [dict(record) for record in records]
+    assert all(record.review_length == review["review_length"] for record, review in zip(records, dicts))
+    assert pickle.loads(pickle.dumps(records)) == dicts and copy.deepcopy(records[0]) == dicts[0]
+    assert analyze_data(records)["red_flags"] == analyze_data(dicts)["red_flags"]
+
+    # Missing author / text (an API sending "author": null) analyze like empty fields
+    blank = [Review(rating=5.0, title="t", review_text=None, author=None)] * 3
+    assert analyze_data(blank)["total_reviews"] == analyze_data(iter(blank))["total_reviews"] == 3
+    assert analyze_data([record.to_dict() for record in blank])["red_flags"] == analyze_data(blank)["red_flags"]
+
+    record = Review(rating=4.0, title="Nice", review_text="Works", review_length=5)
+    record["review_text"] = "Works well"
+    assert record.review_length == 5 and record.get("missing", 1) == 1 and "rating" in record
+
+    # Memory per review, text included: unpickle each review's values separately (fresh
+    # strings per review, as when parsing scraped pages) and keep them as a dict or a record
+    blobs = [pickle.dumps(tuple(review.values())) for review in generate_reviews(100000, seed=3)]
+    loaders = {
+        "dicts": lambda: [dict(zip(REVIEW_FIELDS, pickle.loads(blob))) for blob in blobs],
+        "records": lambda: [Review(*pickle.loads(blob)) for blob in blobs]
+    }
+    measured = {}
+    for name, load in loaders.items():
+        gc.collect()
+        tracemalloc.start()
+        reviews = load()
+        gc.collect()
+        measured[name] = tracemalloc.get_traced_memory()[0] / len(reviews)
+        tracemalloc.stop()
+        del reviews
+
+    print(f"✓ Review records behave like the review dicts (equality, pickling, analysis results)")
+    print(f"   Memory per review: {measured['dicts']:,.0f} bytes as dicts, {measured['records']:,.0f} bytes as records "
+          f"({1 - measured['records'] / measured['dicts']:.0%} less)")
@@ -0,0 +1,204 @@
+"""
+Project Veritas - Columnar Review Batch
+Builds NumPy columns from the scraper's review dictionaries once, so every check
+and scoring step can run vectorized instead of calling review.get(...) per review
+"""
+
+import sys
+import os
+from typing import List, Dict, Union, Iterator
+import numpy as np
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src import utils
+from src.review import Review
+from src.text_features import get_text_features
+
+
+class ReviewBatch:
+    """
+    Columnar view over a list of reviews (Review records or review dictionaries).
+
+    The original dictionaries are kept (``reviews``) so results can still hand
+    back the review objects, while numeric work reads the aligned arrays:
+
+        rating             float64  (0.0 when missing)
+        has_rating         bool     (rating present and non-zero)
+        epoch              int64    (epoch seconds, 0 when missing)
+        has_date           bool
+        review_length      int64
+        verified_purchase  bool
+        has_images         bool
+        author_ids         int32    (index into ``authors``, in first-seen order)
+        text_ids           int32    (equal for reviews with identical review_text)
+        review_ids         uint64   (stable ID from author, date, rating and text;
+                                     equal only for copies of the same review)
+
+    Text features (see src/text_features.py) are extracted on first use and
+    cached in ``text_features``.
+    """
+
+    COLUMNS = ("rating", "has_rating", "epoch", "has_date", "review_length",
+               "verified_purchase", "has_images", "author_ids", "text_ids", "review_ids")
+
+    def __init__(self, reviews: List[Dict]):
+        self.reviews = reviews
+
+        ratings = []
+        epochs = []
+        has_dates = []
+        lengths = []
+        verified = []
+        images = []
+        author_ids = []
+        text_ids = []
+        review_ids = []
+
+        # Intern author names into compact integer IDs (first-seen order)
+        author_index = {}
+        self.authors = []
+        text_index = {}
+
+        for review in reviews:
+            if type(review) is Review:
+                # Slotted records: attribute reads instead of Mapping lookups
+                rating = review.rating or 0.0
+                epoch = review.epoch
+                length = review.review_length
+                verified_purchase = review.verified_purchase
+                has_images = review.has_images
+                author = review.author
+                text = review.review_text
+            else:
+                rating = review.get("rating") or 0.0
+                epoch = utils.to_epoch_seconds(review.get("date"))
+                length = review.get("review_length", 0)
+                verified_purchase = review.get("verified_purchase", False)
+                has_images = review.get("has_images", False)
+                author = review.get("author", "Anonymous")
+                text = review.get("review_text", "")
+
+            ratings.append(rating)
+            has_dates.append(epoch is not None)
+            epochs.append(epoch or 0)
+            lengths.append(length or 0)
+            verified.append(bool(verified_purchase))
+            images.append(bool(has_images))
+
+            author_id = author_index.get(author)
+            if author_id is None:
+                author_id = len(self.authors)
+                author_index[author] = author_id
+                self.authors.append(author)
+            author_ids.append(author_id)
+            text_ids.append(text_index.setdefault(text, len(text_index)))
+            review_ids.append(utils.stable_review_id(author, epoch, rating, text))
+
+        self.rating = np.array(ratings, dtype=np.float64)
+        self.has_rating = self.rating != 0
+        self.epoch = np.array(epochs, dtype=np.int64)
+        self.has_date = np.array(has_dates, dtype=bool)
+        self.review_length = np.array(lengths, dtype=np.int64)
+        self.verified_purchase = np.array(verified, dtype=bool)
+        self.has_images = np.array(images, dtype=bool)
+        self.author_ids = np.array(author_ids, dtype=np.int32)
+        self.text_ids = np.array(text_ids, dtype=np.int32)
+        self.review_ids = np.array(review_ids, dtype=np.uint64)
+
+        self.text_features = None
+
+    @classmethod
+    def from_reviews(cls, reviews: Union[List[Dict], "ReviewBatch"]) -> "ReviewBatch":
+        """
+        Returns a batch for the given reviews, reusing it if it already is one.
+
+        Args:
+            reviews (Union[List[Dict], ReviewBatch]): Scraper output or an existing batch
+
+        Returns:
+            ReviewBatch: Columnar batch over the reviews
+        """
+        if isinstance(reviews, cls):
+            return reviews
+        return cls(reviews)
+
+    def __len__(self) -> int:
+        return len(self.reviews)
+
+    def __iter__(self) -> Iterator[Dict]:
+        return iter(self.reviews)
+
+    def __getitem__(self, index: int) -> Dict:
+        return self.reviews[index]
+
+    def take(self, indices) -> List[Dict]:
+        """
+        Returns the review dictionaries at the given positions.
+
+        Args:
+            indices: Iterable of integer positions (list or NumPy array)
+
+        Returns:
+            List[Dict]: Reviews in the order of ``indices``
+        """
+        reviews = self.reviews
+        return [reviews[i] for i in np.asarray(indices, dtype=np.int64).tolist()]
+
+    def subset(self, indices) -> "ReviewBatch":
+        """
+        Returns a batch over the reviews at the given positions.
+        Columns (and cached text features) are sliced rather than rebuilt from the dicts.
+
+        Args:
+            indices: Integer positions to keep, in order
+
+        Returns:
+            ReviewBatch: Batch over the selected reviews
+        """
+        indices = np.asarray(indices, dtype=np.int64)
+        selected = ReviewBatch.__new__(ReviewBatch)
+        selected.reviews = self.take(indices)
+
+        for name in self.COLUMNS:
+            if name != "author_ids":
+                setattr(selected, name, getattr(self, name)[indices])
+
+        # Re-intern authors so the subset only knows its own, still in first-seen order
+        author_codes, first_seen, inverse = np.unique(
+            self.author_ids[indices], return_index=True, return_inverse=True
+        )
+        order = np.argsort(first_seen, kind="stable")
+        rank = np.empty(len(order), dtype=np.int32)
+        rank[order] = np.arange(len(order), dtype=np.int32)
+        selected.author_ids = rank[inverse.ravel()]
+        selected.authors = [self.authors[code] for code in author_codes[order].tolist()]
+
+        selected.text_features = (
+            self.text_features.subset(indices) if self.text_features is not None else None
+        )
+        return selected
+
+    def columnar(self) -> "ReviewBatch":
+        """
+        Returns a copy holding only the columns and text features, without the review dicts.
+
+        This is what gets shipped to worker processes: NumPy columns pickle as flat
+        buffers (or are inherited for free under fork), instead of thousands of
+        pickled dicts. In the copy, ``reviews`` is a range, so ``take`` returns
+        review positions (check results only hold positions anyway).
+
+        Returns:
+            ReviewBatch: Dict-free batch with the same columns
+        """
+        # Make sure the text features exist before the dicts are left behind
+        get_text_features(self)
+
+        copy = ReviewBatch.__new__(ReviewBatch)
+        copy.reviews = range(len(self.reviews))
+        copy.authors = self.authors
+        copy.text_features = self.text_features
+        for name in self.COLUMNS:
+            setattr(copy, name, getattr(self, name))
+        return copy
@@ -5,31 +5,37 @@ Calculates Trust Score (review reliability) and Quality Score (product quality f
 
 import sys
 import os
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Union
 import numpy as np
 
 # Add parent directory to path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-import config
-from src import utils
+from src import events
+from src.review_batch import ReviewBatch
+from src.compiled_config import CompiledConfig, compile_config
+from src.text_features import get_text_features, negative_keyword_hits
+from src.analyzer import FLAG_BITS, review_flag_bits
+from src.flag_matrix import write_flag_matrix
 
 
-def calculate_trust_score(analysis_report: Dict) -> Tuple[float, str, str]:
+def calculate_trust_score(analysis_report: Dict, compiled: CompiledConfig = None) -> Tuple[float, str, str]:
     """
     Calculates Trust Score based on red flag analysis.
     Measures the reliability of the review dataset.
 
     Args:
         analysis_report (Dict): Analysis report from analyzer.py
+        compiled (CompiledConfig, optional): Configuration snapshot (default: current config)
 
     Returns:
         Tuple[float, str, str]: (score, grade, summary)
     """
-    print("\n🎯 Calculating Trust Score...")
+    compiled = compiled or compile_config()
+    events.info("scoring.trust_started", "\n🎯 Calculating Trust Score...")
 
     # Start with perfect score
-    score = config.STARTING_TRUST_SCORE
+    score = compiled.STARTING_TRUST_SCORE
 
     # Apply all score impacts from red flags
     score += analysis_report["total_score_impact"]
@@ -46,7 +52,7 @@ def calculate_trust_score(analysis_report: Dict) -> Tuple[float, str, str]:
     score = max(0, min(100, score))
 
     # Calculate grade
-    grade = utils.calculate_grade(score)
+    grade = compiled.grade(score)
 
     # Generate summary
     triggered_count = len(analysis_report["triggered_flags"])
@@ -69,222 +75,511 @@ def calculate_trust_score(analysis_report: Dict) -> Tuple[float, str, str]:
         if len(flag_names) > 3:
             summary += f", and {len(flag_names) - 3} more"
 
-    print(f"   Trust Score: {score:.1f} ({grade})")
-    print(f"   Summary: {summary}")
+    events.info("scoring.trust_score", f"   Trust Score: {score:.1f} ({grade})", score=score, grade=grade)
+    events.info("scoring.trust_summary", f"   Summary: {summary}", summary=summary)
 
     return score, grade, summary
 
 
-def filter_trusted_reviews(reviews: List[Dict], analysis_report: Dict) -> List[Dict]:
+def _trusted_mask(batch: ReviewBatch, analysis_report: Dict) -> np.ndarray:
     """
-    Filters out suspicious reviews to create a 'trusted subset'.
-    Used for calculating Quality Score.
+    Marks the reviews not flagged by any triggered red flag.
+
+    A review is flagged when its bitset (analysis_report["review_flags"])
+    shares a bit with the triggered checks. Copies of the same review (equal
+    stable review ID) share the verdict; different reviews with identical
+    text do not.
 
     Args:
-        reviews (List[Dict]): All reviews
+        batch (ReviewBatch): All reviews
         analysis_report (Dict): Analysis report with red flags
 
     Returns:
-        List[Dict]: List of trusted reviews only
+        np.ndarray: Boolean trusted mask per review
     """
-    print("\n🔍 Filtering trusted reviews...")
+    events.info("scoring.filter_started", "\n🔍 Filtering trusted reviews...")
 
-    # Collect all suspicious review IDs
-    suspicious_reviews_set = set()
+    review_flags = analysis_report.get("review_flags")
+    if review_flags is None:
+        review_flags = review_flag_bits(len(batch), analysis_report["red_flags"])
 
+    # One mask operation over all checks: the bits of the triggered ones
+    triggered_bits = 0
     for flag_name, flag_result in analysis_report["red_flags"].items():
-        if flag_result["triggered"] and flag_result.get("suspicious_reviews"):
-            # Use review_text as unique identifier (not perfect but works for MVP)
-            for review in flag_result["suspicious_reviews"]:
-                suspicious_reviews_set.add(review.get("review_text", ""))
+        if flag_result["triggered"] and flag_name in FLAG_BITS:
+            triggered_bits |= FLAG_BITS[flag_name]
+    flagged = (review_flags & np.uint16(triggered_bits)) != 0
 
-    # Filter out suspicious reviews
-    trusted_reviews = []
-    for review in reviews:
-        review_text = review.get("review_text", "")
-        if review_text not in suspicious_reviews_set:
-            trusted_reviews.append(review)
+    # Extend the verdict to every copy of a flagged review
+    if flagged.any():
+        flagged = np.isin(batch.review_ids, batch.review_ids[flagged])
+    trusted_count = len(batch) - int(np.count_nonzero(flagged))
 
-    print(f"   Total reviews: {len(reviews)}")
-    print(f"   Suspicious reviews: {len(suspicious_reviews_set)}")
-    print(f"   Trusted reviews: {len(trusted_reviews)}")
+    if events.enabled(events.INFO):
+        events.info("scoring.trusted", f"   Total reviews: {len(batch)}", reviews=len(batch))
+        events.info("scoring.trusted", f"   Suspicious reviews: {len(batch) - trusted_count}",
+                    suspicious=len(batch) - trusted_count)
+        events.info("scoring.trusted", f"   Trusted reviews: {trusted_count}", trusted=trusted_count)
 
-    return trusted_reviews
+    return ~flagged
+
+
+def filter_trusted_reviews(reviews: Union[List[Dict], ReviewBatch], analysis_report: Dict) -> List[Dict]:
+    """
+    Filters out suspicious reviews to create a 'trusted subset'.
+    Used for calculating Quality Score.
 
+    Args:
+        reviews (Union[List[Dict], ReviewBatch]): All reviews
+        analysis_report (Dict): Analysis report with red flags
 
-def calculate_quality_score(trusted_reviews: List[Dict]) -> Tuple[float, str, str]:
+    Returns:
+        List[Dict]: List of trusted reviews only
+    """
+    batch = ReviewBatch.from_reviews(reviews)
+    return batch.take(np.flatnonzero(_trusted_mask(batch, analysis_report)))
+
+
+def calculate_quality_score(trusted_reviews: Union[List[Dict], ReviewBatch],
+                            compiled: CompiledConfig = None) -> Tuple[float, str, str]:
     """
     Calculates Quality Score based on trusted reviews only.
     Measures actual product quality after filtering out fake reviews.
 
     Args:
-        trusted_reviews (List[Dict]): List of trusted reviews (after filtering)
+        trusted_reviews (Union[List[Dict], ReviewBatch]): Trusted reviews (after filtering)
+        compiled (CompiledConfig, optional): Configuration snapshot (default: current config)
 
     Returns:
         Tuple[float, str, str]: (score, grade, summary)
     """
-    print("\n⭐ Calculating Quality Score...")
+    events.info("scoring.quality_started", "\n⭐ Calculating Quality Score...")
 
+    compiled = compiled or compile_config()
     if not trusted_reviews:
-        print("   ⚠️  No trusted reviews available for quality analysis")
-        return 0, "F", "Insufficient trusted reviews to assess product quality"
+        return _quality_from_stats(0, 0, 0.0, 0.0, 0, 0, compiled)[:3]
 
-    # Start with average star rating converted to 0-100 scale
-    ratings = [r.get("rating", 0) for r in trusted_reviews if r.get("rating")]
+    batch = ReviewBatch.from_reviews(trusted_reviews)
+    statistics = score_statistics(batch, np.ones(len(batch), dtype=bool), compiled)
+    return _quality_from_statistics(statistics, compiled)[:3]
 
-    if not ratings:
-        return 0, "F", "No valid ratings in trusted reviews"
 
-    avg_rating = np.mean(ratings)
-    score = avg_rating * config.STAR_TO_SCORE_MULTIPLIER
+def score_statistics(batch: ReviewBatch, trusted: np.ndarray, compiled: CompiledConfig = None) -> Dict[str, float]:
+    """
+    Computes every statistic behind the Trust Score bonuses and the Quality
+    Score in one vectorized pass over the batch columns.
+
+    The trusted subset stays a boolean mask: its ratings, detailed reviews and
+    negative keyword hits are summed and counted through the mask instead of
+    being copied into a subset batch, and the rating variance is taken once,
+    from the deviations around the mean already computed. Negative keyword
+    hits come from the batch's text features; a batch without them (e.g.
+    built from review dicts for scoring alone) only has its trusted texts
+    scanned for the keywords, and only when some trusted review has a rating.
+
+    Args:
+        batch (ReviewBatch): All reviews
+        trusted (np.ndarray): Boolean trusted mask per review (see _trusted_mask)
+        compiled (CompiledConfig, optional): Configuration snapshot (default: current config)
 
-    print(f"   Average rating: {avg_rating:.2f} stars -> Base score: {score:.1f}")
+    Returns:
+        Dict[str, float]: {
+            "review_count": int,             # All reviews (Trust Score bonuses)
+            "image_count": int,
+            "detailed_count": int,
+            "rated_count": int,
+            "three_star_count": int,
+            "four_star_count": int,
+            "five_star_count": int,
+            "trusted_count": int,            # Trusted reviews (Quality Score)
+            "trusted_rated_count": int,
+            "average_rating": float,         # 0.0 without trusted ratings
+            "rating_std": float,
+            "trusted_detailed_count": int,
+            "negative_keyword_count": int
+        }
+    """
+    compiled = compiled or compile_config()
+
+    lengths = batch.review_length
+    detailed = (lengths >= compiled.DETAILED_REVIEW_MIN_LENGTH) & (lengths <= compiled.DETAILED_REVIEW_MAX_LENGTH)
+    ratings = batch.rating  # 0.0 when missing, so sums over any mask only see rated reviews
+    trusted_rated = trusted & batch.has_rating
+    trusted_rated_count = int(np.count_nonzero(trusted_rated))
+
+    average_rating = rating_std = 0.0
+    negative_keyword_count = 0
+    if trusted_rated_count:
+        average_rating = float(np.dot(ratings, trusted)) / trusted_rated_count
+        deviations = np.where(trusted_rated, ratings - average_rating, 0.0)
+        rating_std = (float(np.dot(deviations, deviations)) / trusted_rated_count) ** 0.5
+        # Each trusted review mentioning a negative keyword counts once
+        if batch.text_features is not None:
+            negative = get_text_features(batch, compiled).negative_keyword_hits != 0
+            negative_keyword_count = int(np.count_nonzero(negative & trusted))
+        else:
+            # No features extracted yet: scan just the trusted texts for the keywords
+            reviews = batch.reviews
+            hits = negative_keyword_hits((reviews[i] for i in np.flatnonzero(trusted).tolist()), compiled)
+            negative_keyword_count = int(np.count_nonzero(hits))
+
+    return {
+        "review_count": len(batch),
+        "image_count": int(np.count_nonzero(batch.has_images)),
+        "detailed_count": int(np.count_nonzero(detailed)),
+        "rated_count": int(np.count_nonzero(batch.has_rating)),
+        "three_star_count": int(np.count_nonzero(ratings == 3.0)),
+        "four_star_count": int(np.count_nonzero(ratings == 4.0)),
+        "five_star_count": int(np.count_nonzero(ratings == 5.0)),
+        "trusted_count": int(np.count_nonzero(trusted)),
+        "trusted_rated_count": trusted_rated_count,
+        "average_rating": average_rating,
+        "rating_std": rating_std,
+        "trusted_detailed_count": int(np.count_nonzero(detailed & trusted)),
+        "negative_keyword_count": negative_keyword_count
+    }
+
+
+def _breakdown_item(name: str, applied: bool, points: float, value, threshold) -> Dict:
+    """
+    One bonus or penalty of the score breakdown.
+
+    Args:
+        name (str): Bonus/penalty name (the "bonus"/"adjustment" field of its scoring event)
+        applied (bool): Whether it changed the score
+        points (float): Points it adds (negative for penalties) when applied
+        value: The statistic it is decided on (a count, share or standard deviation)
+        threshold: What the statistic is compared with
+
+    Returns:
+        Dict: {"name", "applied", "points" (0 when not applied), "value", "threshold"}
+    """
+    def rounded(number):
+        if isinstance(number, dict):
+            return {key: rounded(item) for key, item in number.items()}
+        return round(float(number), 4) if isinstance(number, (float, np.floating)) else number
+
+    return {
+        "name": name,
+        "applied": bool(applied),
+        "points": rounded(points) if applied else 0,
+        "value": rounded(value),
+        "threshold": rounded(threshold)
+    }
+
+
+def _quality_from_statistics(statistics: Dict[str, float],
+                             compiled: CompiledConfig = None) -> Tuple[float, str, str, Dict]:
+    """
+    Quality Score (with its breakdown) from the statistics of score_statistics.
+    """
+    return _quality_from_stats(
+        statistics["trusted_count"],
+        statistics["trusted_rated_count"],
+        statistics["average_rating"],
+        statistics["rating_std"],
+        statistics["trusted_detailed_count"],
+        statistics["negative_keyword_count"],
+        compiled
+    )
+
+
+def _quality_from_stats(review_count: int, rated_count: int, avg_rating: float, rating_std: float,
+                        detailed_count: int, negative_keyword_count: int,
+                        compiled: CompiledConfig = None) -> Tuple[float, str, str, Dict]:
+    """
+    Turns the trusted-review statistics into the Quality Score.
+
+    Args:
+        review_count (int): Trusted reviews
+        rated_count (int): Trusted reviews with a rating
+        avg_rating (float): Mean rating of the trusted reviews that have one
+        rating_std (float): Standard deviation of those ratings
+        detailed_count (int): Trusted reviews in the 'detailed review' length range
+        negative_keyword_count (int): Trusted reviews mentioning a negative keyword
+        compiled (CompiledConfig, optional): Configuration snapshot (default: current config)
+
+    Returns:
+        Tuple[float, str, str, Dict]: (score, grade, summary, breakdown), the breakdown being
+        {"average_rating", "base_score", "adjustments": [bonus/penalty items], "score"}
+    """
+    compiled = compiled or compile_config()
+    breakdown = {"average_rating": None, "base_score": 0, "adjustments": [], "score": 0}
+    if not review_count:
+        events.warning("scoring.no_trusted_reviews", "   ⚠️  No trusted reviews available for quality analysis")
+        return 0, "F", "Insufficient trusted reviews to assess product quality", breakdown
+
+    if not rated_count:
+        return 0, "F", "No valid ratings in trusted reviews", breakdown
+
+    # Start with average star rating converted to 0-100 scale
+    score = avg_rating * compiled.STAR_TO_SCORE_MULTIPLIER
+    breakdown["average_rating"] = round(float(avg_rating), 4)
+    breakdown["base_score"] = round(float(score), 4)
+    adjustments = breakdown["adjustments"]
 
-    # Calculate variance (consistency)
-    rating_variance = np.var(ratings)
-    rating_std = np.std(ratings)
+    events.info("scoring.quality_base", f"   Average rating: {avg_rating:.2f} stars -> Base score: {score:.1f}",
+                average_rating=avg_rating, base_score=score)
 
     # BONUS: Consistent ratings (low variance)
-    if rating_std < config.QUALITY_VARIANCE_THRESHOLD:
-        score += config.QUALITY_CONSISTENT_BONUS
-        print(f"   ✓ Consistent ratings bonus: +{config.QUALITY_CONSISTENT_BONUS}")
+    consistent = rating_std < compiled.QUALITY_VARIANCE_THRESHOLD
+    adjustments.append(_breakdown_item("consistent_ratings", consistent, compiled.QUALITY_CONSISTENT_BONUS,
+                                       rating_std, compiled.QUALITY_VARIANCE_THRESHOLD))
+    if consistent:
+        score += compiled.QUALITY_CONSISTENT_BONUS
+        events.info("scoring.quality_adjustment", f"   ✓ Consistent ratings bonus: +{compiled.QUALITY_CONSISTENT_BONUS}",
+                    adjustment="consistent_ratings", points=compiled.QUALITY_CONSISTENT_BONUS)
 
     # PENALTY: High variance (inconsistent quality)
-    elif rating_std > 1.0:
-        score += config.QUALITY_HIGH_VARIANCE_PENALTY
-        print(f"   ⚠️  High variance penalty: {config.QUALITY_HIGH_VARIANCE_PENALTY}")
+    high_variance = not consistent and rating_std > 1.0
+    adjustments.append(_breakdown_item("high_variance", high_variance, compiled.QUALITY_HIGH_VARIANCE_PENALTY,
+                                       rating_std, 1.0))
+    if high_variance:
+        score += compiled.QUALITY_HIGH_VARIANCE_PENALTY
+        events.info("scoring.quality_adjustment", f"   ⚠️  High variance penalty: {compiled.QUALITY_HIGH_VARIANCE_PENALTY}",
+                    adjustment="high_variance", points=compiled.QUALITY_HIGH_VARIANCE_PENALTY)
 
     # BONUS: Detailed reviews
-    detailed_count = sum(
-        1 for r in trusted_reviews
-        if config.DETAILED_REVIEW_MIN_LENGTH <= r.get("review_length", 0) <= config.DETAILED_REVIEW_MAX_LENGTH
-    )
-    detailed_percentage = detailed_count / len(trusted_reviews)
+    detailed_percentage = detailed_count / review_count
 
+    adjustments.append(_breakdown_item("detailed_reviews", detailed_percentage > 0.5, compiled.QUALITY_DETAILED_BONUS,
+                                       detailed_percentage, 0.5))
     if detailed_percentage > 0.5:  # More than 50% are detailed
-        score += config.QUALITY_DETAILED_BONUS
-        print(f"   ✓ Detailed reviews bonus: +{config.QUALITY_DETAILED_BONUS}")
+        score += compiled.QUALITY_DETAILED_BONUS
+        events.info("scoring.quality_adjustment", f"   ✓ Detailed reviews bonus: +{compiled.QUALITY_DETAILED_BONUS}",
+                    adjustment="detailed_reviews", points=compiled.QUALITY_DETAILED_BONUS)
 
     # PENALTY: Negative keywords in trusted reviews
-    negative_keyword_count = 0
-    for review in trusted_reviews:
-        text = (review.get("review_text", "") + " " + review.get("title", "")).lower()
-        for keyword in config.QUALITY_NEGATIVE_KEYWORDS:
-            if keyword in text:
-                negative_keyword_count += 1
-                break  # Count each review only once
-
-    negative_percentage = negative_keyword_count / len(trusted_reviews)
+    negative_percentage = negative_keyword_count / review_count
 
+    adjustments.append(_breakdown_item("negative_feedback", negative_percentage > 0.3,
+                                       compiled.QUALITY_NEGATIVE_PENALTY, negative_percentage, 0.3))
     if negative_percentage > 0.3:  # More than 30% mention negative keywords
-        score += config.QUALITY_NEGATIVE_PENALTY
-        print(f"   ⚠️  Negative feedback penalty: {config.QUALITY_NEGATIVE_PENALTY}")
+        score += compiled.QUALITY_NEGATIVE_PENALTY
+        events.info("scoring.quality_adjustment", f"   ⚠️  Negative feedback penalty: {compiled.QUALITY_NEGATIVE_PENALTY}",
+                    adjustment="negative_feedback", points=compiled.QUALITY_NEGATIVE_PENALTY)
 
     # Ensure score stays within bounds
     score = max(0, min(100, score))
+    breakdown["score"] = round(float(score), 4)
 
     # Calculate grade
-    grade = utils.calculate_grade(score)
+    grade = compiled.grade(score)
 
     # Generate summary
     if score >= 90:
         summary = f"Excellent product quality. Trusted reviews show consistent {avg_rating:.1f}-star ratings with detailed positive feedback."
     elif score >= 75:
-        summary = f"Good product quality. Based on {len(trusted_reviews)} trusted reviews, average {avg_rating:.1f}-star rating with generally positive feedback."
+        summary = f"Good product quality. Based on {review_count} trusted reviews, average {avg_rating:.1f}-star rating with generally positive feedback."
     elif score >= 60:
-        summary = f"Decent product quality with some concerns. {len(trusted_reviews)} trusted reviews average {avg_rating:.1f} stars, with mixed feedback."
+        summary = f"Decent product quality with some concerns. {review_count} trusted reviews average {avg_rating:.1f} stars, with mixed feedback."
     elif score >= 45:
         summary = f"Below average quality. Trusted reviews show {avg_rating:.1f}-star rating with notable complaints."
     else:
-        summary = f"Poor product quality. Based on {len(trusted_reviews)} trusted reviews averaging {avg_rating:.1f} stars, with significant negative feedback."
+        summary = f"Poor product quality. Based on {review_count} trusted reviews averaging {avg_rating:.1f} stars, with significant negative feedback."
 
-    print(f"   Quality Score: {score:.1f} ({grade})")
-    print(f"   Summary: {summary}")
+    events.info("scoring.quality_score", f"   Quality Score: {score:.1f} ({grade})", score=score, grade=grade)
+    events.info("scoring.quality_summary", f"   Summary: {summary}", summary=summary)
 
-    return score, grade, summary
+    return score, grade, summary, breakdown
 
 
-def calculate_additional_bonuses(reviews: List[Dict]) -> float:
+def calculate_additional_bonuses(reviews: Union[List[Dict], ReviewBatch], compiled: CompiledConfig = None) -> float:
     """
     Calculates additional bonus points for Trust Score.
     (Image uploads, detailed reviews, balanced distribution)
 
     Args:
-        reviews (List[Dict]): All reviews
+        reviews (Union[List[Dict], ReviewBatch]): All reviews
+        compiled (CompiledConfig, optional): Configuration snapshot (default: current config)
 
     Returns:
         float: Total bonus points to add to Trust Score
     """
+    batch = ReviewBatch.from_reviews(reviews)
+
+    # The bonuses only read all-review statistics: an empty trusted mask skips the text features
+    statistics = score_statistics(batch, np.zeros(len(batch), dtype=bool), compiled)
+    return _bonus_points_from_statistics(statistics, compiled)[0]
+
+
+def _bonus_points_from_statistics(statistics: Dict[str, float],
+                                  compiled: CompiledConfig = None) -> Tuple[float, List[Dict]]:
+    """
+    Trust Score bonus points (with their breakdown) from the statistics of score_statistics.
+    """
+    return _bonus_points(
+        statistics["image_count"],
+        statistics["detailed_count"],
+        statistics["rated_count"],
+        statistics["three_star_count"],
+        statistics["four_star_count"],
+        statistics["five_star_count"],
+        compiled
+    )
+
+
+def _bonus_points(image_count: int, detailed_count: int, rated_count: int,
+                  three_star_count: int, four_star_count: int, five_star_count: int,
+                  compiled: CompiledConfig = None) -> Tuple[float, List[Dict]]:
+    """
+    Turns review counts into the additional Trust Score bonus points.
+
+    Args:
+        image_count (int): Reviews with user-uploaded images
+        detailed_count (int): Reviews in the 'detailed review' length range
+        rated_count (int): Reviews with a rating
+        three_star_count (int): 3-star reviews
+        four_star_count (int): 4-star reviews
+        five_star_count (int): 5-star reviews
+        compiled (CompiledConfig, optional): Configuration snapshot (default: current config)
+
+    Returns:
+        Tuple[float, List[Dict]]: (total bonus points to add to Trust Score, one
+        breakdown item per bonus)
+    """
+    compiled = compiled or compile_config()
     bonus = 0
+    bonuses = []
 
     # Bonus for user-uploaded images
-    image_count = sum(1 for r in reviews if r.get("has_images", False))
+    image_bonus = image_count * compiled.IMAGE_BONUS_PER_REVIEW
+    bonuses.append(_breakdown_item("user_images", image_count > 0, image_bonus, image_count, 0))
     if image_count > 0:
-        image_bonus = image_count * config.IMAGE_BONUS_PER_REVIEW
         bonus += image_bonus
-        print(f"   ✓ User images bonus: +{image_bonus:.1f} ({image_count} reviews with images)")
+        events.info("scoring.trust_bonus", f"   ✓ User images bonus: +{image_bonus:.1f} ({image_count} reviews with images)",
+                    bonus="user_images", points=image_bonus)
 
     # Bonus for detailed reviews
-    detailed_count = sum(
-        1 for r in reviews
-        if config.DETAILED_REVIEW_MIN_LENGTH <= r.get("review_length", 0) <= config.DETAILED_REVIEW_MAX_LENGTH
-    )
+    detailed_bonus = detailed_count * compiled.DETAILED_REVIEW_BONUS
+    bonuses.append(_breakdown_item("detailed_reviews", detailed_count > 0, detailed_bonus, detailed_count, 0))
     if detailed_count > 0:
-        detailed_bonus = detailed_count * config.DETAILED_REVIEW_BONUS
         bonus += detailed_bonus
-        print(f"   ✓ Detailed reviews bonus: +{detailed_bonus:.1f} ({detailed_count} detailed reviews)")
+        events.info("scoring.trust_bonus", f"   ✓ Detailed reviews bonus: +{detailed_bonus:.1f} ({detailed_count} detailed reviews)",
+                    bonus="detailed_reviews", points=detailed_bonus)
 
     # Bonus for balanced distribution
-    ratings = [r.get("rating", 0) for r in reviews if r.get("rating")]
-    if ratings:
-        from collections import Counter
-        rating_counts = Counter(ratings)
-        total = len(ratings)
+    criteria = compiled.BALANCED_DISTRIBUTION_CRITERIA
+    three_star_pct = four_star_pct = five_star_pct = 0.0
+    balanced = False
+    if rated_count:
+        three_star_pct = three_star_count / rated_count
+        four_star_pct = four_star_count / rated_count
+        five_star_pct = five_star_count / rated_count
+
+        balanced = (three_star_pct >= criteria["three_star_min"] and
+                    four_star_pct >= criteria["four_star_min"] and
+                    five_star_pct <= criteria["five_star_max"])
+
+    bonuses.append(_breakdown_item(
+        "balanced_distribution", balanced, compiled.BALANCED_DISTRIBUTION_BONUS,
+        {"three_star": three_star_pct, "four_star": four_star_pct, "five_star": five_star_pct},
+        {"three_star_min": criteria["three_star_min"], "four_star_min": criteria["four_star_min"],
+         "five_star_max": criteria["five_star_max"]}
+    ))
+    if balanced:
+        bonus += compiled.BALANCED_DISTRIBUTION_BONUS
+        events.info("scoring.trust_bonus", f"   ✓ Balanced distribution bonus: +{compiled.BALANCED_DISTRIBUTION_BONUS}",
+                    bonus="balanced_distribution", points=compiled.BALANCED_DISTRIBUTION_BONUS)
+
+    return bonus, bonuses
+
+
+def score_fields(statistics: Dict[str, float], analysis_report: Dict,
+                 compiled: CompiledConfig = None) -> Tuple[Dict, Dict]:
+    """
+    Computes the Trust and Quality Scores of a report from the red flag
+    analysis and the statistics of score_statistics.
+
+    Shared by generate_full_report, rescoring and the incremental scorer, so
+    every path applies the same bonuses and penalties in the same order.
+
+    Args:
+        statistics (Dict[str, float]): Review statistics (see score_statistics)
+        analysis_report (Dict): Red flag analysis ("total_score_impact", "triggered_flags")
+        compiled (CompiledConfig, optional): Configuration snapshot (default: current config)
+
+    Returns:
+        Tuple[Dict, Dict]: (report fields trust_score, trust_grade, trust_summary,
+        quality_score, quality_grade, quality_summary; score breakdown:
+        {"trust": {"starting_score", "red_flag_impact", "red_flag_score", "bonuses", "score"},
+         "quality": {"average_rating", "base_score", "adjustments", "score"}})
+    """
+    compiled = compiled or compile_config()
 
-        three_star_pct = rating_counts.get(3.0, 0) / total
-        four_star_pct = rating_counts.get(4.0, 0) / total
-        five_star_pct = rating_counts.get(5.0, 0) / total
+    # Calculate Trust Score
+    trust_score, trust_grade, trust_summary = calculate_trust_score(analysis_report, compiled)
+    red_flag_score = trust_score
 
-        criteria = config.BALANCED_DISTRIBUTION_CRITERIA
+    # Add bonuses to trust score
+    bonus_points, bonuses = _bonus_points_from_statistics(statistics, compiled)
+    trust_score = min(100, trust_score + bonus_points)
+    trust_grade = compiled.grade(trust_score)  # Recalculate grade after bonuses
 
-        if (three_star_pct >= criteria["three_star_min"] and
-            four_star_pct >= criteria["four_star_min"] and
-            five_star_pct <= criteria["five_star_max"]):
-            bonus += config.BALANCED_DISTRIBUTION_BONUS
-            print(f"   ✓ Balanced distribution bonus: +{config.BALANCED_DISTRIBUTION_BONUS}")
+    # Calculate Quality Score
+    events.info("scoring.quality_started", "\n⭐ Calculating Quality Score...")
+    quality_score, quality_grade, quality_summary, quality = _quality_from_statistics(statistics, compiled)
 
-    return bonus
+    fields = {
+        "trust_score": round(trust_score, 1),
+        "trust_grade": trust_grade,
+        "trust_summary": trust_summary,
+        "quality_score": round(quality_score, 1),
+        "quality_grade": quality_grade,
+        "quality_summary": quality_summary
+    }
+    breakdown = {
+        "trust": {
+            "starting_score": compiled.STARTING_TRUST_SCORE,
+            "red_flag_impact": round(float(analysis_report["total_score_impact"]), 4),
+            "red_flag_score": round(float(red_flag_score), 4),
+            "bonuses": bonuses,
+            "score": round(float(trust_score), 4)
+        },
+        "quality": quality
+    }
+    return fields, breakdown
 
 
-def generate_full_report(reviews: List[Dict], analysis_report: Dict, url: str) -> Dict:
+def generate_full_report(reviews: Union[List[Dict], ReviewBatch], analysis_report: Dict, url: str,
+                         flags_output: str = None, flags_format: str = None,
+                         compiled: CompiledConfig = None) -> Dict:
     """
     Generates the complete Project Veritas report with both Trust and Quality scores.
 
+    With ``flags_output``, the per-review verdicts (stable review ID, one bit
+    per red flag, trusted or not) are also written to that file as JSON Lines
+    or compressed NumPy columns (see src/flag_matrix.py), and the report
+    points to the file under "review_flags_file" instead of embedding them.
+
+    The report ends with "score_breakdown": every Trust Score bonus and
+    Quality Score adjustment, applied or not, with the statistic it was
+    decided on and its threshold (see score_fields).
+
     Args:
-        reviews (List[Dict]): All scraped reviews
+        reviews (Union[List[Dict], ReviewBatch]): All scraped reviews (or the batch built for analysis)
         analysis_report (Dict): Red flag analysis report
         url (str): Product URL
+        flags_output (str, optional): Path of the per-review flag file (.jsonl or .npz)
+        flags_format (str, optional): "jsonl" or "npz" (default: from the file extension)
+        compiled (CompiledConfig, optional): Configuration snapshot (default: current config);
+            pass the one given to analyze_data when analyzing with a config variant
 
     Returns:
         Dict: Complete JSON report in Project Veritas format
     """
-    print("\n" + "="*60)
-    print("📊 GENERATING FINAL REPORT")
-    print("="*60)
+    events.info("report.started", "\n" + "="*60 + "\n📊 GENERATING FINAL REPORT\n" + "="*60)
 
-    # Calculate Trust Score
-    trust_score, trust_grade, trust_summary = calculate_trust_score(analysis_report)
+    batch = ReviewBatch.from_reviews(reviews)
+    compiled = compiled or compile_config()
 
-    # Add bonuses to trust score
-    bonus_points = calculate_additional_bonuses(reviews)
-    trust_score = min(100, trust_score + bonus_points)
-    trust_grade = utils.calculate_grade(trust_score)  # Recalculate grade after bonuses
+    # Trusted subset as a mask over the columns: scored through the mask, never copied out
+    trusted = _trusted_mask(batch, analysis_report)
+    statistics = score_statistics(batch, trusted, compiled)
+    trusted_count = statistics["trusted_count"]
 
-    # Filter trusted reviews
-    trusted_reviews = filter_trusted_reviews(reviews, analysis_report)
-
-    # Calculate Quality Score
-    quality_score, quality_grade, quality_summary = calculate_quality_score(trusted_reviews)
+    # Trust Score (plus bonuses) and Quality Score, with the breakdown of every bonus and penalty
+    scores, score_breakdown = score_fields(statistics, analysis_report, compiled)
 
     # Build red flags list (human-readable names)
     red_flags_triggered = []
@@ -296,32 +591,40 @@ def generate_full_report(reviews: List[Dict], analysis_report: Dict, url: str) -
     report = {
         "project": "Project Veritas",
         "url": url,
-        "trust_score": round(trust_score, 1),
-        "trust_grade": trust_grade,
-        "trust_summary": trust_summary,
-        "quality_score": round(quality_score, 1),
-        "quality_grade": quality_grade,
-        "quality_summary": quality_summary,
-        "total_reviews_analyzed": len(reviews),
-        "trusted_reviews_count": len(trusted_reviews),
-        "suspicious_reviews_count": len(reviews) - len(trusted_reviews),
-        "red_flags_triggered": red_flags_triggered
+        **scores,
+        "total_reviews_analyzed": len(batch),
+        "trusted_reviews_count": trusted_count,
+        "suspicious_reviews_count": len(batch) - trusted_count,
+        "red_flags_triggered": red_flags_triggered,
+        "score_breakdown": score_breakdown
     }
 
-    print("\n" + "="*60)
-    print("✅ REPORT COMPLETE")
-    print("="*60)
-    print(f"🔒 Trust Score: {trust_score:.1f} ({trust_grade})")
-    print(f"⭐ Quality Score: {quality_score:.1f} ({quality_grade})")
-    print(f"📊 Reviews: {len(reviews)} total, {len(trusted_reviews)} trusted")
-    print(f"🚩 Red Flags: {len(red_flags_triggered)}")
-    print("="*60 + "\n")
+    # Per-review verdicts go to a separate file; the report only points to it
+    if flags_output:
+        review_flags = analysis_report.get("review_flags")
+        if review_flags is None:
+            review_flags = review_flag_bits(len(batch), analysis_report["red_flags"])
+        report["review_flags_file"] = write_flag_matrix(batch, review_flags, trusted, flags_output, flags_format)
+        events.info("report.flags_written", f"🧾 Per-review flags written to: {flags_output}", path=flags_output)
+
+    events.info(
+        "report.complete",
+        "\n" + "="*60 + "\n✅ REPORT COMPLETE\n" + "="*60 + "\n"
+        f"🔒 Trust Score: {scores['trust_score']:.1f} ({scores['trust_grade']})\n"
+        f"⭐ Quality Score: {scores['quality_score']:.1f} ({scores['quality_grade']})\n"
+        f"📊 Reviews: {len(batch)} total, {trusted_count} trusted\n"
+        f"🚩 Red Flags: {len(red_flags_triggered)}\n" + "="*60 + "\n",
+        trust_score=scores["trust_score"], trust_grade=scores["trust_grade"], quality_score=scores["quality_score"],
+        quality_grade=scores["quality_grade"], reviews=len(batch), trusted=trusted_count, red_flags=len(red_flags_triggered)
+    )
 
     return report
 
 
 # Example usage
 if __name__ == "__main__":
+    events.subscribe(events.console_printer())
+
     # Test with dummy data
     from datetime import datetime
 
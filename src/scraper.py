@@ -7,7 +7,6 @@ import requests
 from bs4 import BeautifulSoup
 from typing import List, Dict, Optional
 from datetime import datetime
-import re
 import sys
 import os
 
@@ -16,6 +15,8 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import config
 from src import utils
+from src import events
+from src.review import Review
 
 
 class AmazonReviewScraper:
@@ -64,20 +65,7 @@ class AmazonReviewScraper:
         Returns:
             Optional[str]: ASIN product ID, or None if not found
         """
-        # Match ASIN pattern (usually 10 alphanumeric characters)
-        patterns = [
-            r'/dp/([A-Z0-9]{10})',
-            r'/product/([A-Z0-9]{10})',
-            r'/gp/product/([A-Z0-9]{10})',
-            r'[?&]asin=([A-Z0-9]{10})'
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
-
-        return None
+        return utils.extract_asin(url)
 
     def _build_review_url(self, asin: str, page: int = 1) -> str:
         """
@@ -96,18 +84,18 @@ class AmazonReviewScraper:
         else:
             return f"https://www.amazon.com/product-reviews/{asin}?pageNumber={page}"
 
-    def _parse_review_element(self, review_element) -> Optional[Dict]:
+    def _parse_review_element(self, review_element) -> Optional[Review]:
         """
-        Parses a single review HTML element into a structured dictionary.
+        Parses a single review HTML element into a structured review record.
 
         Args:
             review_element: BeautifulSoup element containing review data
 
         Returns:
-            Optional[Dict]: Parsed review data, or None if parsing fails
+            Optional[Review]: Parsed review data (read it like a dict), or None if parsing fails
         """
         try:
-            review_data = {}
+            review_data = Review()
 
             # Extract rating (e.g., "5.0 out of 5 stars")
             rating_elem = review_element.find("i", {"data-hook": "review-star-rating"})
@@ -167,7 +155,7 @@ class AmazonReviewScraper:
                 return None
 
         except Exception as e:
-            print(f"Warning: Failed to parse review element: {e}")
+            events.warning("scraper.review_parse_failed", f"Warning: Failed to parse review element: {e}", error=str(e))
             return None
 
     def scrape_reviews(self, url: str, max_pages: int = 10) -> List[Dict]:
@@ -197,14 +185,14 @@ class AmazonReviewScraper:
             ...
         ]
         """
-        print(f"🔍 Starting scrape for: {url}")
+        events.info("scraper.started", f"🔍 Starting scrape for: {url}", url=url)
 
         # Extract product ASIN
         asin = self._extract_product_id(url)
         if not asin:
             raise ValueError(f"Could not extract product ID from URL: {url}")
 
-        print(f"📦 Product ASIN: {asin}")
+        events.info("scraper.asin", f"📦 Product ASIN: {asin}", asin=asin)
 
         self.reviews = []
         reviews_scraped = 0
@@ -213,10 +201,11 @@ class AmazonReviewScraper:
         for page in range(1, max_pages + 1):
             # Check if we've hit the maximum review limit
             if reviews_scraped >= config.MAX_REVIEWS_TO_SCRAPE:
-                print(f"✅ Reached maximum review limit ({config.MAX_REVIEWS_TO_SCRAPE})")
+                events.info("scraper.limit_reached", f"✅ Reached maximum review limit ({config.MAX_REVIEWS_TO_SCRAPE})",
+                            limit=config.MAX_REVIEWS_TO_SCRAPE)
                 break
 
-            print(f"📄 Scraping page {page}...")
+            events.info("scraper.page_started", f"📄 Scraping page {page}...", page=page)
 
             # Build review page URL
             review_url = self._build_review_url(asin, page)
@@ -235,10 +224,13 @@ class AmazonReviewScraper:
 
                 # Check if request was successful
                 if response.status_code != 200:
-                    print(f"⚠️  Warning: Got status code {response.status_code} on page {page}")
+                    events.warning("scraper.bad_status", f"⚠️  Warning: Got status code {response.status_code} on page {page}",
+                                   page=page, status_code=response.status_code)
                     # If blocked, stop scraping
                     if response.status_code == 503:
-                        print("🚫 Amazon has blocked our requests. Consider using proxies or reducing request rate.")
+                        events.error("scraper.blocked",
+                                     "🚫 Amazon has blocked our requests. Consider using proxies or reducing request rate.",
+                                     page=page)
                         break
                     continue
 
@@ -247,7 +239,8 @@ class AmazonReviewScraper:
 
                 # Debug: Check if we're being blocked
                 if "To discuss automated access to Amazon data please contact" in response.text:
-                    print("🚫 Amazon bot detection triggered. Try again later or use proxies.")
+                    events.error("scraper.bot_detection", "🚫 Amazon bot detection triggered. Try again later or use proxies.",
+                                 page=page)
                     break
 
                 # Find all review elements
@@ -255,11 +248,12 @@ class AmazonReviewScraper:
 
                 # Debug: If no reviews found, check page content
                 if not review_elements:
-                    print(f"ℹ️  No reviews found on page {page}.")
+                    events.info("scraper.page_empty", f"ℹ️  No reviews found on page {page}.", page=page)
                     # Check if page has any review-related content
-                    if page == 1:
-                        print(f"   Debug: Page title: {soup.title.string if soup.title else 'No title'}")
-                        print(f"   Debug: Response length: {len(response.text)} characters")
+                    if page == 1 and events.enabled(events.DEBUG):
+                        events.debug("scraper.page_debug",
+                                     f"   Debug: Page title: {soup.title.string if soup.title else 'No title'}")
+                        events.debug("scraper.page_debug", f"   Debug: Response length: {len(response.text)} characters")
                     break
 
                 # Parse each review
@@ -275,19 +269,22 @@ class AmazonReviewScraper:
                         if reviews_scraped >= config.MAX_REVIEWS_TO_SCRAPE:
                             break
 
-                print(f"   ✓ Scraped {page_reviews} reviews from page {page}")
+                events.info("scraper.page_scraped", f"   ✓ Scraped {page_reviews} reviews from page {page}",
+                            page=page, reviews=page_reviews)
 
             except requests.exceptions.Timeout:
-                print(f"⚠️  Timeout on page {page}. Skipping.")
+                events.warning("scraper.timeout", f"⚠️  Timeout on page {page}. Skipping.", page=page)
                 continue
             except requests.exceptions.RequestException as e:
-                print(f"⚠️  Request error on page {page}: {e}")
+                events.warning("scraper.request_error", f"⚠️  Request error on page {page}: {e}", page=page, error=str(e))
                 continue
             except Exception as e:
-                print(f"⚠️  Unexpected error on page {page}: {e}")
+                events.warning("scraper.unexpected_error", f"⚠️  Unexpected error on page {page}: {e}",
+                               page=page, error=str(e))
                 continue
 
-        print(f"\n✅ Scraping complete! Total reviews: {len(self.reviews)}")
+        events.info("scraper.complete", f"\n✅ Scraping complete! Total reviews: {len(self.reviews)}",
+                    reviews=len(self.reviews))
         return self.reviews
 
 
@@ -309,32 +306,39 @@ def scrape_reviews(url: str, use_rapidapi: bool = True) -> List[Dict]:
         try:
             from src.rapidapi_multi_scraper import scrape_reviews_multi_api
 
-            print("🚀 Attempting to fetch reviews via RapidAPI (multi-key rotation)...")
+            events.info("scraper.rapidapi_started", "🚀 Attempting to fetch reviews via RapidAPI (multi-key rotation)...")
             result = scrape_reviews_multi_api(url)
 
             if result["success"]:
-                print(f"✅ Successfully fetched {len(result['reviews'])} reviews via RapidAPI")
+                events.info("scraper.rapidapi_complete",
+                            f"✅ Successfully fetched {len(result['reviews'])} reviews via RapidAPI",
+                            reviews=len(result['reviews']))
                 return result["reviews"]
             elif result.get("all_apis_exhausted"):
-                print("⚠️ All RapidAPI keys exhausted across all services")
+                events.warning("scraper.rapidapi_exhausted", "⚠️ All RapidAPI keys exhausted across all services")
                 # Return empty list when all APIs exhausted
                 return []
             else:
-                print(f"⚠️ RapidAPI failed: {result.get('error', 'Unknown error')}")
-                print("📝 Falling back to direct scraping...")
+                events.warning("scraper.rapidapi_failed", f"⚠️ RapidAPI failed: {result.get('error', 'Unknown error')}",
+                               error=result.get('error', 'Unknown error'))
+                events.info("scraper.fallback", "📝 Falling back to direct scraping...")
         except ImportError as e:
-            print(f"⚠️ RapidAPI module not available: {e}, using direct scraping")
+            events.warning("scraper.rapidapi_unavailable", f"⚠️ RapidAPI module not available: {e}, using direct scraping",
+                           error=str(e))
         except Exception as e:
-            print(f"⚠️ RapidAPI error: {e}, falling back to direct scraping")
+            events.warning("scraper.rapidapi_error", f"⚠️ RapidAPI error: {e}, falling back to direct scraping",
+                           error=str(e))
 
     # Fallback to direct scraping (will likely fail due to Amazon blocks)
-    print("🔍 Attempting direct Amazon scraping...")
+    events.info("scraper.direct_started", "🔍 Attempting direct Amazon scraping...")
     scraper = AmazonReviewScraper()
     return scraper.scrape_reviews(url)
 
 
 # Example usage (for testing)
 if __name__ == "__main__":
+    events.subscribe(events.console_printer())
+
     # Test with a sample Amazon URL
     test_url = "https://www.amazon.com/dp/B08N5WRWNW"  # Example ASIN
     reviews = scrape_reviews(test_url)
@@ -0,0 +1,295 @@
+"""
+Project Veritas - Sharded Analysis (Map/Reduce)
+Splits very large review sets into shards, computes partial check results per shard in
+worker processes and merges them into exactly the report a single process would produce
+"""
+
+import sys
+import os
+from typing import List, Dict
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.review_batch import ReviewBatch
+from src.compiled_config import CompiledConfig, compile_config
+from src.text_features import get_text_features, tokenize, token_hashes
+from src.ngram_index import NGramIndex, review_ngram_hashes
+from src.near_duplicates import feature_signatures, cluster_signatures
+from src.analyzer import (
+    _velocity_result, _generic_praise_mask, _generic_praise_result,
+    _author_rating_pairs, _suspicious_author_mask, _author_burst_mask, _suspicious_reviewers_result,
+    _linguistic_anomaly_mask, _linguistic_anomalies_result, _sentiment_imbalance_result,
+    _length_extreme_mask, _length_extremes_result, _verified_ratio_result,
+    _repetitive_phrases_result, _near_duplicates_result
+)
+
+
+def map_shard(shard_start: int, reviews: List[Dict], compiled: CompiledConfig) -> Dict:
+    """
+    Map step: computes the mergeable partial results of every check for one shard.
+
+    Review positions are returned shard-global (offset by shard_start). Anything
+    that depends on reviews outside the shard is returned as raw counts or
+    sorted arrays instead of a verdict:
+
+        velocity      dated review positions and timestamps, sorted by date
+        reviewers     author names with per-(author, rating) counts
+        ngrams        distinct n-gram hashes with counts and first occurrence
+        signatures    MinHash signatures (per review, so shard-independent)
+
+    Args:
+        shard_start (int): Position of the shard's first review in the full review list
+        reviews (List[Dict]): The shard's review dictionaries
+        compiled (CompiledConfig): Configuration snapshot
+
+    Returns:
+        Dict: Partial results of the shard
+    """
+    batch = ReviewBatch(reviews)
+    features = get_text_features(batch, compiled)
+
+    # Velocity: the shard's timestamps, already in date order (stable)
+    dated_indices = np.flatnonzero(batch.has_date)
+    dated_indices = dated_indices[np.argsort(batch.epoch[dated_indices], kind="stable")]
+
+    # Reviewers: counts keyed by author name, since author IDs are shard-local
+    pair_authors, pair_ratings, pair_counts = _author_rating_pairs(
+        batch.author_ids[batch.has_rating], batch.rating[batch.has_rating]
+    )
+
+    # N-grams: distinct hashes with counts and where each first occurs
+    index = NGramIndex.from_text_features(features, compiled.REPETITIVE_PHRASE_MIN_LENGTH)
+    first_review = np.searchsorted(features.token_offsets, index.first_position, side="right") - 1
+
+    signed_reviews, signatures = feature_signatures(
+        features, compiled.NEAR_DUPLICATE_NUM_PERM, compiled.NEAR_DUPLICATE_SHINGLE_SIZE
+    )
+
+    return {
+        "size": len(batch),
+        "velocity": (dated_indices + shard_start, batch.epoch[dated_indices]),
+        "generic_praise": np.flatnonzero(_generic_praise_mask(batch, compiled)) + shard_start,
+        "reviewers": {
+            "authors": batch.authors,
+            "reviews_per_author": np.bincount(batch.author_ids, minlength=len(batch.authors)),
+            "pair_authors": pair_authors,
+            "pair_ratings": pair_ratings,
+            "pair_counts": pair_counts
+        },
+        "linguistic_anomalies": np.flatnonzero(_linguistic_anomaly_mask(batch, compiled)) + shard_start,
+        "ratings": (
+            int(np.count_nonzero(batch.has_rating)),
+            int(np.count_nonzero(batch.rating == 5.0)),
+            int(np.count_nonzero(batch.rating == 1.0)),
+            np.flatnonzero(batch.rating == 5.0) + shard_start
+        ),
+        "length_extremes": np.flatnonzero(_length_extreme_mask(batch, compiled)) + shard_start,
+        "verified": (int(np.count_nonzero(batch.verified_purchase)),
+                     np.flatnonzero(~batch.verified_purchase) + shard_start),
+        "ngrams": {
+            "hashes": index.hashes,
+            "counts": index.counts,
+            "first_review": first_review + shard_start,
+            "first_offset": index.first_position - features.token_offsets[first_review]
+        },
+        "signatures": (signed_reviews + shard_start, signatures)
+    }
+
+
+def map_repeated_reviews(shard_start: int, reviews: List[Dict], repeated_hashes: np.ndarray,
+                         phrase_length: int) -> np.ndarray:
+    """
+    Second map step for repetitive phrasing: which reviews of the shard contain a
+    phrase that is repeated across the whole review set.
+
+    Args:
+        shard_start (int): Position of the shard's first review
+        reviews (List[Dict]): The shard's review dictionaries
+        repeated_hashes (np.ndarray): Sorted hashes of the globally repeated n-grams
+        phrase_length (int): Words per n-gram (REPETITIVE_PHRASE_MIN_LENGTH)
+
+    Returns:
+        np.ndarray: Sorted shard-global positions of the matching reviews
+    """
+    vocabulary, token_ids, token_offsets = tokenize(reviews)
+    hashes, review_indices, _ = review_ngram_hashes(
+        token_hashes(vocabulary)[token_ids], token_offsets, phrase_length
+    )
+    return np.unique(review_indices[np.isin(hashes, repeated_hashes)]).astype(np.int64) + shard_start
+
+
+def _merge_ngrams(partials: List[Dict]) -> Dict[str, np.ndarray]:
+    """
+    Sums n-gram counts across shards and keeps each n-gram's earliest occurrence.
+
+    Returns:
+        Dict[str, np.ndarray]: hashes (sorted, distinct), counts, first_review, first_offset
+    """
+    parts = [partial["ngrams"] for partial in partials]
+    hashes = np.concatenate([part["hashes"] for part in parts])
+
+    # Stable sort keeps shards in order, so each hash's first entry is its earliest occurrence
+    order = np.argsort(hashes, kind="stable")
+    merged_hashes, group_starts = np.unique(hashes[order], return_index=True)
+    if not len(merged_hashes):
+        empty = np.zeros(0, dtype=np.int64)
+        return {"hashes": merged_hashes, "counts": empty, "first_review": empty, "first_offset": empty}
+
+    counts = np.concatenate([part["counts"] for part in parts])[order]
+    return {
+        "hashes": merged_hashes,
+        "counts": np.add.reduceat(counts, group_starts),
+        "first_review": np.concatenate([part["first_review"] for part in parts])[order][group_starts],
+        "first_offset": np.concatenate([part["first_offset"] for part in parts])[order][group_starts]
+    }
+
+
+def _merge_reviewer_counts(partials: List[Dict], compiled: CompiledConfig) -> np.ndarray:
+    """
+    Merges per-shard author statistics by author name and applies the reviewer rule.
+
+    Authors are re-interned in shard order, which reproduces the first-seen
+    author IDs of a batch over all reviews.
+
+    Returns:
+        np.ndarray: Boolean mask over global author IDs
+    """
+    author_index = {}
+    reviews_per_author = []
+    pair_authors, pair_ratings, pair_counts = [], [], []
+
+    for partial in partials:
+        reviewers = partial["reviewers"]
+        global_ids = np.array(
+            [author_index.setdefault(author, len(author_index)) for author in reviewers["authors"]],
+            dtype=np.int64
+        )
+        reviews_per_author.append((global_ids, reviewers["reviews_per_author"]))
+        pair_authors.append(global_ids[reviewers["pair_authors"]])
+        pair_ratings.append(reviewers["pair_ratings"])
+        pair_counts.append(reviewers["pair_counts"])
+
+    author_totals = np.zeros(len(author_index), dtype=np.int64)
+    for global_ids, counts in reviews_per_author:
+        np.add.at(author_totals, global_ids, counts)
+
+    merged_authors, _, merged_counts = _author_rating_pairs(
+        np.concatenate(pair_authors), np.concatenate(pair_ratings), np.concatenate(pair_counts)
+    )
+    return _suspicious_author_mask(author_totals, merged_authors, merged_counts, compiled)
+
+
+def run_sharded_checks(batch: ReviewBatch, shard_size: int = None, max_workers: int = None,
+                       compiled: CompiledConfig = None) -> Dict[str, Dict]:
+    """
+    Runs every red flag check as map/reduce over shards of the review list.
+
+    Map (worker processes): each shard is tokenized and analyzed on its own and
+    returns mergeable partials (see map_shard). Reduce (this process):
+        - per-review verdicts are concatenated (shards are contiguous, so the
+          positions stay sorted)
+        - rating and verified counts are summed
+        - timestamps are merged into one sorted array before the window scan,
+          so a burst spanning a shard boundary is counted in full
+        - author rating statistics are merged by author name; the per-author
+          burst rule runs once on the full author and date columns (cheap,
+          and it needs each author's timestamps from every shard)
+        - n-gram counts are summed across shards; reviews containing a
+          globally repeated n-gram are found in a second, light map step
+        - MinHash signatures are stacked and clustered once
+    The result is identical to running the checks on the whole batch.
+
+    Args:
+        batch (ReviewBatch): All reviews (the review dicts are sent to the workers shard by shard)
+        shard_size (int, optional): Reviews per shard. Defaults to ANALYSIS_SHARD_SIZE.
+        max_workers (int, optional): Worker process count
+        compiled (CompiledConfig, optional): Configuration snapshot (default: current config),
+            shipped to every worker
+
+    Returns:
+        Dict[str, Dict]: Check results keyed by flag name
+    """
+    compiled = compiled or compile_config()
+    shard_size = shard_size or compiled.ANALYSIS_SHARD_SIZE
+    reviews = batch.reviews
+    starts = list(range(0, len(reviews), shard_size)) or [0]
+    shards = [reviews[start:start + shard_size] for start in starts]
+
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        partials = list(pool.map(map_shard, starts, shards, [compiled] * len(shards)))
+
+        ngrams = _merge_ngrams(partials)
+        repeated = np.flatnonzero(ngrams["counts"] >= compiled.REPETITIVE_PHRASE_COUNT)
+        if len(repeated):
+            repeated_hashes = ngrams["hashes"][repeated]
+            repeated_reviews = np.concatenate(list(pool.map(
+                map_repeated_reviews, starts, shards, [repeated_hashes] * len(shards),
+                [compiled.REPETITIVE_PHRASE_MIN_LENGTH] * len(shards)
+            )))
+
+    results = {}
+
+    dated_indices = np.concatenate([partial["velocity"][0] for partial in partials])
+    epochs = np.concatenate([partial["velocity"][1] for partial in partials])
+    order = np.argsort(epochs, kind="stable")
+    results["review_velocity"] = _velocity_result(batch, dated_indices[order], epochs[order], compiled)
+
+    results["generic_praise"] = _generic_praise_result(
+        batch, np.concatenate([partial["generic_praise"] for partial in partials]), compiled
+    )
+    results["suspicious_reviewers"] = _suspicious_reviewers_result(
+        batch, _merge_reviewer_counts(partials, compiled),
+        _author_burst_mask(batch.author_ids[batch.has_date], batch.epoch[batch.has_date], len(batch.authors),
+                           compiled),
+        compiled
+    )
+    results["linguistic_anomalies"] = _linguistic_anomalies_result(
+        batch, np.concatenate([partial["linguistic_anomalies"] for partial in partials]), compiled
+    )
+
+    results["sentiment_imbalance"] = _sentiment_imbalance_result(
+        batch,
+        sum(partial["ratings"][0] for partial in partials),
+        sum(partial["ratings"][1] for partial in partials),
+        sum(partial["ratings"][2] for partial in partials),
+        np.concatenate([partial["ratings"][3] for partial in partials]),
+        compiled
+    )
+    results["review_length_extremes"] = _length_extremes_result(
+        batch, np.concatenate([partial["length_extremes"] for partial in partials]), compiled
+    )
+    results["verified_ratio"] = _verified_ratio_result(
+        batch,
+        sum(partial["verified"][0] for partial in partials),
+        np.concatenate([partial["verified"][1] for partial in partials]),
+        compiled
+    )
+
+    if len(repeated):
+        # Most frequent phrase, ties to the earliest occurrence; rebuilt from that one review
+        top = repeated[np.lexsort((
+            ngrams["first_offset"][repeated], ngrams["first_review"][repeated], -ngrams["counts"][repeated]
+        ))[0]]
+        vocabulary, token_ids, _ = tokenize([reviews[int(ngrams["first_review"][top])]])
+        offset = int(ngrams["first_offset"][top])
+        top_phrase = " ".join(
+            vocabulary[token_id]
+            for token_id in token_ids[offset:offset + compiled.REPETITIVE_PHRASE_MIN_LENGTH].tolist()
+        )
+        results["repetitive_phrases"] = _repetitive_phrases_result(
+            batch, repeated_reviews, top_phrase, int(ngrams["counts"][top]), compiled
+        )
+    else:
+        results["repetitive_phrases"] = _repetitive_phrases_result(batch, np.zeros(0, dtype=np.int64), "", 0, compiled)
+
+    signed_reviews = np.concatenate([partial["signatures"][0] for partial in partials])
+    signatures = np.concatenate([partial["signatures"][1] for partial in partials])
+    clusters = cluster_signatures(
+        signed_reviews, signatures, compiled.NEAR_DUPLICATE_JACCARD_THRESHOLD, compiled.NEAR_DUPLICATE_MIN_CLUSTER_SIZE
+    )
+    results["near_duplicates"] = _near_duplicates_result(batch, clusters, compiled)
+
+    return results
@@ -0,0 +1,288 @@
+"""
+Project Veritas - Bounded-Memory Summaries
+Fixed-size data structures for analyzing review streams that do not fit in memory:
+reservoir samples, HyperLogLog distinct counters, count-min sketches and
+Space-Saving heavy-hitter lists
+"""
+
+import sys
+import os
+import random
+import hashlib
+from typing import List, Any, Iterable
+import numpy as np
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.ngram_index import mix64
+
+
+def hash_strings(values: Iterable[str]) -> np.ndarray:
+    """
+    Hashes strings to stable 64-bit keys (identical across processes and runs).
+
+    Args:
+        values (Iterable[str]): Strings to hash (None hashes like "")
+
+    Returns:
+        np.ndarray: uint64 key per string
+    """
+    return np.array(
+        [int.from_bytes(hashlib.blake2b((value or "").encode("utf-8"), digest_size=8).digest(), "little")
+         for value in values],
+        dtype=np.uint64
+    )
+
+
+class ReservoirSample:
+    """
+    Uniform random sample of at most ``size`` items from a stream of unknown length
+    (Algorithm R). Every item seen so far is in the sample with equal probability.
+    Seeded, so the same stream always yields the same sample.
+    """
+
+    def __init__(self, size: int, seed: int = 0):
+        self.size = size
+        self.seen = 0
+        self.items = []
+        self._rng = random.Random(seed)
+
+    def add(self, item: Any) -> None:
+        """
+        Offers one item to the sample.
+        """
+        self.seen += 1
+        if len(self.items) < self.size:
+            self.items.append(item)
+        else:
+            slot = self._rng.randrange(self.seen)
+            if slot < self.size:
+                self.items[slot] = item
+
+    def extend(self, items: Iterable[Any]) -> None:
+        """
+        Offers several items, in order.
+        """
+        for item in items:
+            self.add(item)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def sample(self) -> List[Any]:
+        """
+        Returns the current sample (a copy).
+        """
+        return list(self.items)
+
+
+class HyperLogLog:
+    """
+    Distinct-count estimator in 2^precision one-byte registers.
+
+    Relative standard error is about 1.04 / sqrt(2^precision) (1.6% at the
+    default precision 12, which uses 4 KB). Small counts use linear counting,
+    which is nearly exact while most registers are still empty.
+    """
+
+    def __init__(self, precision: int = 12):
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    def add_hashes(self, hashes: np.ndarray) -> None:
+        """
+        Adds items given as uniformly distributed uint64 hashes (see hash_strings).
+
+        Args:
+            hashes (np.ndarray): uint64 hash per item
+        """
+        if not len(hashes):
+            return
+        hashes = hashes.astype(np.uint64)
+        register = (hashes >> np.uint64(64 - self.precision)).astype(np.int64)
+
+        # Rank = position of the first set bit in the remaining 64 - precision bits
+        remaining = hashes << np.uint64(self.precision)
+        width = 64 - self.precision
+        bit_length = np.zeros(len(hashes), dtype=np.int64)
+        for shift in (32, 16, 8, 4, 2, 1):
+            shifted = remaining >> np.uint64(shift)
+            has_high = shifted != 0
+            bit_length[has_high] += shift
+            remaining = np.where(has_high, shifted, remaining)
+        bit_length += (remaining != 0)
+        rank = np.where(bit_length > 64 - width, 64 - bit_length + 1, width + 1).astype(np.uint8)
+
+        np.maximum.at(self.registers, register, rank)
+
+    def estimate(self) -> float:
+        """
+        Returns the estimated number of distinct items added.
+        """
+        register_count = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / register_count)
+        raw = alpha * register_count ** 2 / np.sum(np.exp2(-self.registers.astype(np.float64)))
+
+        empty = int(np.count_nonzero(self.registers == 0))
+        if raw <= 2.5 * register_count and empty:
+            return register_count * np.log(register_count / empty)
+        return float(raw)
+
+
+class CountMinSketch:
+    """
+    Approximate frequency table in ``depth`` rows of ``width`` uint32 counters.
+
+    Keys are uint64 hashes (n-gram hashes, hash_strings output). Estimates
+    never undercount, and with N total occurrences added,
+
+        estimate <= true count + (e / width) * N   with probability >= 1 - e^(-depth)
+
+    Updates are conservative (a counter only grows as far as the key's new
+    estimate requires), which keeps estimates well below that bound in
+    practice. Memory is 4 * width * depth bytes.
+    """
+
+    def __init__(self, width: int, depth: int, seed: int = 0):
+        self.width = width
+        self.depth = depth
+        self.total = 0
+        self.table = np.zeros((depth, width), dtype=np.uint32)
+        self._salts = np.random.default_rng(seed).integers(
+            0, np.iinfo(np.int64).max, size=depth, dtype=np.int64
+        ).astype(np.uint64)
+
+    def _columns(self, keys: np.ndarray) -> np.ndarray:
+        """
+        Counter column of every key in every row, shape (depth, len(keys)).
+        """
+        keys = keys.astype(np.uint64)
+        return np.stack([
+            (mix64(keys ^ salt) % np.uint64(self.width)).astype(np.int64) for salt in self._salts
+        ])
+
+    def add(self, keys: np.ndarray, counts: np.ndarray = None) -> np.ndarray:
+        """
+        Adds occurrences of the given keys.
+
+        Args:
+            keys (np.ndarray): uint64 keys (repeats allowed)
+            counts (np.ndarray, optional): Occurrences per entry (1 each by default)
+
+        Returns:
+            np.ndarray: Updated estimate for each entry of ``keys``
+        """
+        if not len(keys):
+            return np.zeros(0, dtype=np.int64)
+        counts = np.ones(len(keys), dtype=np.int64) if counts is None else np.asarray(counts, dtype=np.int64)
+        distinct_keys, inverse = np.unique(keys, return_inverse=True)
+        inverse = inverse.ravel()
+        distinct_counts = np.bincount(inverse, weights=counts, minlength=len(distinct_keys)).astype(np.int64)
+        self.total += int(distinct_counts.sum())
+
+        columns = self._columns(distinct_keys)
+        rows = np.arange(self.depth)[:, None]
+        estimates = self.table[rows, columns].min(axis=0).astype(np.int64) + distinct_counts
+        capped = np.minimum(estimates, np.iinfo(np.uint32).max).astype(np.uint32)
+        for row in range(self.depth):
+            np.maximum.at(self.table[row], columns[row], capped)
+        return estimates[inverse]
+
+    def query(self, keys: np.ndarray) -> np.ndarray:
+        """
+        Returns the estimated count of each key (never below its true count).
+        """
+        if not len(keys):
+            return np.zeros(0, dtype=np.int64)
+        columns = self._columns(np.asarray(keys))
+        return self.table[np.arange(self.depth)[:, None], columns].min(axis=0).astype(np.int64)
+
+    def error_bound(self) -> float:
+        """
+        Additive overestimate that holds with probability 1 - e^(-depth) for the occurrences added so far.
+        """
+        return np.e / self.width * self.total
+
+
+class SpaceSaving:
+    """
+    Space-Saving heavy-hitter list: the ``capacity`` most frequent keys seen,
+    with counts that bracket the true count (count - error <= true <= count).
+
+    Updates are batched: after a batch, the list is cut back to ``capacity``
+    entries by count, and ``floor`` records the largest count dropped. When
+    every occurrence is offered, a key that is not in the list has a true
+    count of at most ``floor``, so a key entering the list starts from
+    ``floor``; a caller that only offers some keys passes its own upper bound
+    instead (e.g. a count-min estimate). Any key occurring more than
+    N / capacity times out of N is guaranteed to be kept.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.floor = 0
+        self.keys = np.zeros(0, dtype=np.uint64)
+        self.counts = np.zeros(0, dtype=np.int64)
+        self.errors = np.zeros(0, dtype=np.int64)
+
+    def update(self, keys: np.ndarray, counts: np.ndarray, initial: np.ndarray = None) -> np.ndarray:
+        """
+        Adds a batch of distinct keys with their occurrence counts.
+
+        Args:
+            keys (np.ndarray): Distinct uint64 keys
+            counts (np.ndarray): Occurrences of each key in this batch
+            initial (np.ndarray, optional): Upper bound on each key's total count
+                including this batch, used for keys not yet in the list. Required
+                when earlier occurrences were not all offered to the list; the
+                default, floor + count, is plain Space-Saving
+
+        Returns:
+            np.ndarray: Keys dropped from the list by this update
+        """
+        keys = np.asarray(keys, dtype=np.uint64)
+        counts = np.asarray(counts, dtype=np.int64)
+        if not len(keys):
+            return np.zeros(0, dtype=np.uint64)
+
+        slots = np.searchsorted(self.keys, keys)
+        slots_in_range = np.minimum(slots, max(len(self.keys) - 1, 0))
+        tracked = (slots < len(self.keys)) & (self.keys[slots_in_range] == keys) if len(self.keys) else \
+            np.zeros(len(keys), dtype=bool)
+        self.counts[slots[tracked]] += counts[tracked]
+
+        new = ~tracked
+        if initial is None:
+            new_counts = self.floor + counts[new]
+        else:
+            new_counts = np.asarray(initial, dtype=np.int64)[new]
+        all_keys = np.concatenate((self.keys, keys[new]))
+        all_counts = np.concatenate((self.counts, new_counts))
+        all_errors = np.concatenate((self.errors, new_counts - counts[new]))
+
+        dropped = np.zeros(0, dtype=np.uint64)
+        if len(all_keys) > self.capacity:
+            # Keep the largest counts (ties to the smaller key, so the cut is deterministic)
+            order = np.lexsort((all_keys, -all_counts))
+            self.floor = max(self.floor, int(all_counts[order[self.capacity]]))
+            dropped = all_keys[order[self.capacity:]]
+            order = order[:self.capacity]
+            all_keys, all_counts, all_errors = all_keys[order], all_counts[order], all_errors[order]
+
+        order = np.argsort(all_keys)
+        self.keys, self.counts, self.errors = all_keys[order], all_counts[order], all_errors[order]
+        return dropped
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def get(self, keys: np.ndarray) -> np.ndarray:
+        """
+        Returns the count of each key (0 for keys not in the list).
+        """
+        keys = np.asarray(keys, dtype=np.uint64)
+        if not len(self.keys):
+            return np.zeros(len(keys), dtype=np.int64)
+        slots = np.minimum(np.searchsorted(self.keys, keys), len(self.keys) - 1)
+        return np.where(self.keys[slots] == keys, self.counts[slots], 0)
@@ -0,0 +1,805 @@
+"""
+Project Veritas - Streaming Analysis
+Runs the red flag checks over an iterator of reviews (API pages as they arrive, rows
+of a large file) in chunks, keeping only bounded state instead of the full review list
+"""
+
+import sys
+import os
+from itertools import islice
+from datetime import timedelta
+from typing import List, Dict, Tuple, Iterable
+import numpy as np
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config
+from src import utils
+from src import events
+from src.review_batch import ReviewBatch
+from src.compiled_config import CompiledConfig, compile_config
+from src.text_features import get_text_features
+from src.ngram_index import review_ngram_hashes
+from src.near_duplicates import feature_signatures, lsh_band_keys
+from src.sketches import ReservoirSample, HyperLogLog, CountMinSketch, SpaceSaving, hash_strings
+from src.analyzer import (
+    _generic_praise_mask, _linguistic_anomaly_mask, _length_extreme_mask,
+    _suspicious_author_mask, _suspicious_reviewers_details, _window_label
+)
+
+
+class StreamingAnalyzer:
+    """
+    Bounded-memory version of the red flag checks.
+
+    Reviews are consumed in chunks of STREAMING_CHUNK_SIZE; each chunk is
+    vectorized like a normal batch and then dropped. What is kept:
+
+        exact counters    ratings, verified, per-review flag counts (generic,
+                          linguistic, length), image and detailed counts
+        velocity          review counts per time bucket (STREAMING_TIME_BUCKET_SECONDS),
+                          at most STREAMING_MAX_TIME_BUCKETS buckets: past that,
+                          adjacent buckets are merged and the bucket width doubles;
+                          window counts are exact up to one bucket at the window edge
+        reviewers         per-author rating histograms, burst verdicts and per-day
+                          review counts of the latest STREAMING_MAX_AUTHOR_DAYS days
+                          with reviews (dropped once the author has a burst, which
+                          never goes away), for up to STREAMING_MAX_AUTHORS authors
+                          (review bursts are measured in whole calendar days); the
+                          distinct author count comes from a HyperLogLog once that
+                          cap is reached
+        repetitive        "approximate" (default): a count-min sketch of all n-grams
+                          plus a Space-Saving list of the phrases whose estimate
+                          reaches REPETITIVE_PHRASE_COUNT; fixed memory, counts
+                          may be overestimated (see src/sketches.py for bounds).
+                          "exact": a count per distinct n-gram (unbounded)
+        near duplicates   LSH buckets with the signatures of at most
+                          STREAMING_MAX_LSH_LEADERS bucket leaders; cluster sizes
+                          are exact until the cap is reached
+        samples           a seeded reservoir of STREAMING_SAMPLE_SIZE suspicious
+                          review positions (in stream order) per red flag
+
+    Result dictionaries have the analyze_data shape, with "suspicious_indices"
+    holding the sampled positions and "suspicious_count" the number of reviews flagged.
+    Flags that depend on the whole stream (velocity window, suspicious authors,
+    repeated phrases) can only sample reviews flagged at the time they arrived,
+    so their counts are lower bounds; the velocity result keeps no reviews.
+    """
+
+    def __init__(self, chunk_size: int = None, sample_size: int = None, seed: int = 0,
+                 repetitive_mode: str = None, compiled: CompiledConfig = None):
+        self.compiled = compiled or compile_config()
+        self.chunk_size = chunk_size or self.compiled.STREAMING_CHUNK_SIZE
+        self.repetitive_mode = repetitive_mode or self.compiled.STREAMING_REPETITIVE_MODE
+        if self.repetitive_mode not in ("exact", "approximate"):
+            raise ValueError(f"Unknown repetitive mode '{self.repetitive_mode}' (expected 'exact' or 'approximate')")
+        sample_size = sample_size or self.compiled.STREAMING_SAMPLE_SIZE
+
+        self.total = 0
+        self.samples = {
+            flag_name: ReservoirSample(sample_size, seed + position)
+            for position, flag_name in enumerate((
+                "generic_praise", "suspicious_reviewers", "linguistic_anomalies", "sentiment_imbalance",
+                "review_length_extremes", "verified_ratio", "repetitive_phrases", "near_duplicates"
+            ))
+        }
+        self.counts = {"generic_praise": 0, "linguistic_anomalies": 0, "review_length_extremes": 0}
+
+        # Ratings and badges
+        self.rated_count = 0
+        self.five_star_count = 0
+        self.one_star_count = 0
+        self.verified_count = 0
+
+        # Velocity: time bucket -> reviews, buckets of bucket_seconds
+        self.dated_count = 0
+        self.bucket_seconds = self.compiled.STREAMING_TIME_BUCKET_SECONDS
+        self.time_buckets = {}
+
+        # Reviewers: author -> [reviews, {rating: count}, {day: count}, bursty]
+        self.author_stats = {}
+        self.author_counter = HyperLogLog(self.compiled.STREAMING_HLL_PRECISION)
+        self.untracked_authors = False
+
+        # Repetitive phrasing: exact n-gram hash -> occurrences, or sketch + heavy hitters;
+        # text and first occurrence are kept for repeated (candidate) phrases only
+        self.ngram_counts = {}
+        self.ngram_first_seen = {}
+        self.repeated_phrases = {}
+        if self.repetitive_mode == "approximate":
+            self.phrase_sketch = CountMinSketch(self.compiled.REPETITIVE_SKETCH_WIDTH, self.compiled.REPETITIVE_SKETCH_DEPTH, seed)
+            self.heavy_hitters = SpaceSaving(self.compiled.REPETITIVE_HEAVY_HITTERS)
+
+        # Near duplicates: band key -> leader, leader -> signature, union-find over leaders
+        self.band_buckets = []
+        self.leader_signatures = {}
+        self.cluster_parent = {}
+        self.cluster_sizes = {}
+
+    def consume(self, reviews: Iterable[Dict]) -> "StreamingAnalyzer":
+        """
+        Reads the whole iterator, chunk by chunk.
+
+        Args:
+            reviews (Iterable[Dict]): Review dictionaries (scraper schema)
+
+        Returns:
+            StreamingAnalyzer: self, for chaining
+        """
+        iterator = iter(reviews)
+        while True:
+            chunk = list(islice(iterator, self.chunk_size))
+            if not chunk:
+                return self
+            self.add_chunk(chunk)
+
+    def add_chunk(self, reviews: List[Dict]) -> None:
+        """
+        Folds one chunk of reviews into the running state.
+
+        Args:
+            reviews (List[Dict]): Review dictionaries
+        """
+        batch = ReviewBatch(reviews)
+        features = get_text_features(batch, self.compiled)
+        first_id = self.total
+        self.total += len(batch)
+
+        # Per-review rules: exact counts plus a sample
+        for flag_name, mask in (("generic_praise", _generic_praise_mask(batch, self.compiled)),
+                                ("linguistic_anomalies", _linguistic_anomaly_mask(batch, self.compiled)),
+                                ("review_length_extremes", _length_extreme_mask(batch, self.compiled))):
+            self.counts[flag_name] += int(np.count_nonzero(mask))
+            self.samples[flag_name].extend((np.flatnonzero(mask) + first_id).tolist())
+
+        self.rated_count += int(np.count_nonzero(batch.has_rating))
+        self.five_star_count += int(np.count_nonzero(batch.rating == 5.0))
+        self.one_star_count += int(np.count_nonzero(batch.rating == 1.0))
+        self.samples["sentiment_imbalance"].extend((np.flatnonzero(batch.rating == 5.0) + first_id).tolist())
+        self.verified_count += int(np.count_nonzero(batch.verified_purchase))
+        self.samples["verified_ratio"].extend((np.flatnonzero(~batch.verified_purchase) + first_id).tolist())
+
+        self._add_timestamps(batch)
+        self._add_authors(batch, first_id)
+        self._add_ngrams(batch, features)
+        self._add_signatures(batch, features, first_id)
+
+    def _add_timestamps(self, batch: ReviewBatch) -> None:
+        """
+        Counts the chunk's dated reviews per time bucket, widening the buckets
+        while there are more than STREAMING_MAX_TIME_BUCKETS of them.
+        """
+        epochs = batch.epoch[batch.has_date]
+        self.dated_count += len(epochs)
+        buckets, counts = np.unique(epochs // self.bucket_seconds, return_counts=True)
+        time_buckets = self.time_buckets
+        for bucket, count in zip(buckets.tolist(), counts.tolist()):
+            time_buckets[bucket] = time_buckets.get(bucket, 0) + count
+
+        while len(time_buckets) > self.compiled.STREAMING_MAX_TIME_BUCKETS:
+            merged = {}
+            for bucket, count in time_buckets.items():
+                merged[bucket // 2] = merged.get(bucket // 2, 0) + count
+            time_buckets = self.time_buckets = merged
+            self.bucket_seconds *= 2
+
+    def _add_authors(self, batch: ReviewBatch, first_id: int) -> None:
+        """
+        Updates per-author rating histograms and samples reviews by authors who look suspicious.
+        """
+        self.author_counter.add_hashes(hash_strings(batch.authors))
+
+        author_stats = self.author_stats
+        touched = {}
+        ratings = batch.rating.tolist()
+        has_rating = batch.has_rating.tolist()
+        days = (batch.epoch // 86400).tolist()
+        has_date = batch.has_date.tolist()
+        for i, author_id in enumerate(batch.author_ids.tolist()):
+            author = batch.authors[author_id]
+            stats = author_stats.get(author)
+            if stats is None:
+                if len(author_stats) >= self.compiled.STREAMING_MAX_AUTHORS:
+                    self.untracked_authors = True
+                    continue
+                stats = author_stats[author] = [0, {}, {}, False]
+            stats[0] += 1
+            if has_rating[i]:
+                stats[1][ratings[i]] = stats[1].get(ratings[i], 0) + 1
+            if has_date[i] and not stats[3]:
+                stats[2][days[i]] = stats[2].get(days[i], 0) + 1
+            touched.setdefault(author, []).append(i)
+
+        if not touched:
+            return
+        same_rating, bursty = self._author_rules(list(touched))
+        max_days = self.compiled.STREAMING_MAX_AUTHOR_DAYS
+        for author, is_suspicious in zip(touched, (same_rating | bursty).tolist()):
+            if is_suspicious:
+                self.samples["suspicious_reviewers"].extend(first_id + i for i in touched[author])
+            days = author_stats[author][2]
+            if len(days) > max_days:
+                # Keep the latest days; a burst among the dropped ones goes unnoticed
+                for day in sorted(days)[:len(days) - max_days]:
+                    del days[day]
+
+    def _author_rules(self, authors: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Applies both reviewer rules to the given tracked authors. An author
+        found bursty keeps that verdict and drops the per-day counts.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (same-rating mask, burst mask) over ``authors``
+        """
+        stats = [self.author_stats[author] for author in authors]
+        pair_authors = np.repeat(np.arange(len(stats)), [len(histogram) for _, histogram, _, _ in stats])
+        pair_counts = np.array([count for _, histogram, _, _ in stats for count in histogram.values()], dtype=np.int64)
+        review_counts = np.array([reviews for reviews, _, _, _ in stats], dtype=np.int64)
+        same_rating = _suspicious_author_mask(review_counts, pair_authors, pair_counts, self.compiled)
+
+        # Bursts: reviews in any run of days_window consecutive days, from the per-day counts
+        day_counts = [sorted(days.items()) for _, _, days, _ in stats]
+        day_authors = np.repeat(np.arange(len(stats), dtype=np.int64), [len(days) for days in day_counts])
+        entries = np.array([entry for days in day_counts for entry in days], dtype=np.int64).reshape(-1, 2)
+        keys = (day_authors << 32) + entries[:, 0]
+        cumulative = np.concatenate(([0], np.cumsum(entries[:, 1])))
+        ends = np.searchsorted(keys, keys + (self.compiled.REVIEWER_RED_FLAGS["days_window"] - 1), side="right")
+        in_burst = cumulative[ends] - cumulative[:-1] > self.compiled.reviewer_burst_limit
+        bursty = np.array([is_bursty for _, _, _, is_bursty in stats], dtype=bool)
+        newly_bursty = np.unique(day_authors[in_burst]).tolist()
+        bursty[newly_bursty] = True
+        for position in newly_bursty:
+            stats[position][2] = {}
+            stats[position][3] = True
+
+        return same_rating, bursty
+
+    def _add_ngrams(self, batch: ReviewBatch, features) -> None:
+        """
+        Counts the chunk's n-gram occurrences and samples reviews containing a
+        phrase that is already repeated.
+        """
+        n = self.compiled.REPETITIVE_PHRASE_MIN_LENGTH
+        hashes, review_indices, positions = review_ngram_hashes(features.token_keys(), features.token_offsets, n)
+        if not len(hashes):
+            return
+
+        chunk_hashes, first_index, inverse, chunk_counts = np.unique(
+            hashes, return_index=True, return_inverse=True, return_counts=True
+        )
+        # (review, token offset) of each n-gram's first occurrence in the chunk, for tie-breaking
+        first_reviews = review_indices[first_index]
+        first_seen = np.stack((
+            first_reviews + (self.total - len(batch)),
+            positions[first_index] - features.token_offsets[first_reviews]
+        ), axis=1).tolist()
+
+        if self.repetitive_mode == "exact":
+            repeated = self._count_ngrams_exact(chunk_hashes, chunk_counts, first_seen)
+        else:
+            repeated = self._count_ngrams_approximate(chunk_hashes, chunk_counts)
+
+        # Remember text (and, in approximate mode, first occurrence) of newly repeated phrases
+        for k in np.flatnonzero(repeated).tolist():
+            ngram_hash = int(chunk_hashes[k])
+            if ngram_hash in self.repeated_phrases:
+                continue
+            start = int(positions[first_index[k]])
+            self.repeated_phrases[ngram_hash] = " ".join(
+                features.vocabulary[token_id] for token_id in features.token_ids[start:start + n].tolist()
+            )
+            self.ngram_first_seen.setdefault(ngram_hash, tuple(first_seen[k]))
+
+        flagged_reviews = np.unique(review_indices[repeated[inverse.ravel()]])
+        self.samples["repetitive_phrases"].extend((flagged_reviews + (self.total - len(batch))).tolist())
+
+    def _count_ngrams_exact(self, chunk_hashes: np.ndarray, chunk_counts: np.ndarray,
+                            first_seen: List[List[int]]) -> np.ndarray:
+        """
+        Adds the chunk's distinct n-grams to the exact count table, recording
+        where each new n-gram first occurs.
+
+        Returns:
+            np.ndarray: Boolean mask of the n-grams now at or above REPETITIVE_PHRASE_COUNT
+        """
+        threshold = self.compiled.REPETITIVE_PHRASE_COUNT
+        ngram_counts = self.ngram_counts
+        ngram_first_seen = self.ngram_first_seen
+        repeated = np.zeros(len(chunk_hashes), dtype=bool)
+
+        for k, (ngram_hash, count) in enumerate(zip(chunk_hashes.tolist(), chunk_counts.tolist())):
+            previous = ngram_counts.get(ngram_hash, 0)
+            ngram_counts[ngram_hash] = previous + count
+            if not previous:
+                ngram_first_seen[ngram_hash] = tuple(first_seen[k])
+            if previous + count >= threshold:
+                repeated[k] = True
+        return repeated
+
+    def _count_ngrams_approximate(self, chunk_hashes: np.ndarray, chunk_counts: np.ndarray) -> np.ndarray:
+        """
+        Adds the chunk's distinct n-grams to the count-min sketch; n-grams whose
+        estimate reaches REPETITIVE_PHRASE_COUNT enter the heavy-hitter list.
+        Estimates never undercount, so no phrase that truly repeats is missed
+        unless the heavy-hitter list overflows with more frequent ones.
+
+        Returns:
+            np.ndarray: Boolean mask of the candidate (possibly repeated) n-grams
+        """
+        estimates = self.phrase_sketch.add(chunk_hashes, chunk_counts)
+        candidates = estimates >= self.compiled.REPETITIVE_PHRASE_COUNT
+
+        dropped = self.heavy_hitters.update(chunk_hashes[candidates], chunk_counts[candidates],
+                                            initial=estimates[candidates])
+        for ngram_hash in dropped.tolist():
+            self.repeated_phrases.pop(ngram_hash, None)
+            self.ngram_first_seen.pop(ngram_hash, None)
+        return candidates
+
+    def _phrase_counts(self) -> Dict[int, int]:
+        """
+        Occurrence count of every repeated phrase (upper bounds in approximate mode).
+        """
+        if self.repetitive_mode == "exact":
+            return {ngram_hash: self.ngram_counts[ngram_hash] for ngram_hash in self.repeated_phrases}
+
+        keys = np.array(list(self.repeated_phrases), dtype=np.uint64)
+        counts = np.minimum(self.heavy_hitters.get(keys), self.phrase_sketch.query(keys))
+        return {
+            ngram_hash: count for ngram_hash, count in zip(keys.tolist(), counts.tolist())
+            if count >= self.compiled.REPETITIVE_PHRASE_COUNT
+        }
+
+    def _cluster_root(self, leader: int) -> int:
+        """
+        Union-find root of a leader (with path halving).
+        """
+        parent = self.cluster_parent
+        while parent[leader] != leader:
+            parent[leader] = parent[parent[leader]]
+            leader = parent[leader]
+        return leader
+
+    def _add_signatures(self, batch: ReviewBatch, features, first_id: int) -> None:
+        """
+        Buckets the chunk's MinHash signatures and grows near-duplicate clusters.
+
+        Only bucket leaders keep their signature. A review matching leaders
+        merges their clusters and counts once towards the merged size, which
+        gives the batch check's cluster sizes without storing its signature.
+        """
+        signed_reviews, signatures = feature_signatures(
+            features, self.compiled.NEAR_DUPLICATE_NUM_PERM, self.compiled.NEAR_DUPLICATE_SHINGLE_SIZE
+        )
+        if not len(signed_reviews):
+            return
+
+        threshold = self.compiled.NEAR_DUPLICATE_JACCARD_THRESHOLD
+        min_cluster_size = self.compiled.NEAR_DUPLICATE_MIN_CLUSTER_SIZE
+        band_keys = lsh_band_keys(signatures, threshold)
+        if not self.band_buckets:
+            self.band_buckets = [{} for _ in range(band_keys.shape[1])]
+
+        clustered = []
+        for row, review_index in enumerate(signed_reviews.tolist()):
+            review_id = first_id + review_index
+            signature = signatures[row]
+            roots = set()
+            is_leader = False
+
+            for band, key in enumerate(band_keys[row].tolist()):
+                buckets = self.band_buckets[band]
+                leader = buckets.get(key)
+                if leader is None:
+                    if len(self.leader_signatures) < self.compiled.STREAMING_MAX_LSH_LEADERS or is_leader:
+                        buckets[key] = review_id
+                        if not is_leader:
+                            is_leader = True
+                            self.leader_signatures[review_id] = signature
+                            self.cluster_parent[review_id] = review_id
+                            self.cluster_sizes[review_id] = 1
+                    continue
+                if (self.leader_signatures[leader] == signature).mean() >= threshold:
+                    roots.add(self._cluster_root(leader))
+
+            if not roots:
+                continue
+
+            # Merge every matched cluster (and this review's own, if it leads a bucket)
+            if is_leader:
+                roots.add(review_id)
+            roots = sorted(roots, key=lambda root: -self.cluster_sizes[root])
+            root = roots[0]
+            for other in roots[1:]:
+                self.cluster_parent[other] = root
+                self.cluster_sizes[root] += self.cluster_sizes.pop(other)
+            if not is_leader:
+                self.cluster_sizes[root] += 1
+
+            if self.cluster_sizes[root] >= min_cluster_size:
+                clustered.append(review_index)
+
+        self.samples["near_duplicates"].extend(first_id + review_index for review_index in clustered)
+
+    def _result(self, flag_name: str, triggered: bool, score_impact: float, details: str,
+                suspicious_count: int = 0) -> Dict:
+        """
+        Builds a red flag result in the analyze_data shape, with the sample as suspicious_indices.
+        """
+        sample = self.samples.get(flag_name)
+        return {
+            "triggered": triggered,
+            "score_impact": score_impact if triggered else 0,
+            "details": details,
+            "suspicious_indices": sorted(sample.sample()) if (triggered and sample is not None) else [],
+            "suspicious_count": suspicious_count if triggered else 0
+        }
+
+    def red_flags(self) -> Dict[str, Dict]:
+        """
+        Evaluates every red flag on the state accumulated so far.
+
+        Returns:
+            Dict[str, Dict]: Red flag results keyed by flag name, in report order
+        """
+        total = self.total
+        results = {}
+
+        # 1. Velocity, from the bucketed timestamp histogram
+        velocity = self._result("review_velocity", False, 0, "")
+        velocity["windows"] = {}
+        if self.dated_count < 10:
+            velocity["details"] = "Insufficient data for velocity analysis"
+        else:
+            bucket_size = self.bucket_seconds
+            buckets = np.array(sorted(self.time_buckets), dtype=np.int64)
+            cumulative = np.concatenate(([0], np.cumsum([self.time_buckets[b] for b in buckets.tolist()])))
+            window_hours = self.compiled.VELOCITY_THRESHOLD_HOURS
+            densest = {}
+            for hours in self.compiled.velocity_window_hours:
+                ends = np.searchsorted(buckets, buckets + (hours * 3600) // bucket_size, side="right")
+                counts = cumulative[ends] - cumulative[:-1]
+                best = int(np.argmax(counts))
+                densest[hours] = (int(counts[best]), int(buckets[best]) * bucket_size)
+
+            for hours in self.compiled.VELOCITY_BURST_WINDOWS_HOURS:
+                count, start = densest[hours]
+                peak_start = utils.from_epoch_seconds(start)
+                velocity["windows"][_window_label(hours)] = {
+                    "window_hours": hours,
+                    "peak_start": peak_start,
+                    "peak_end": peak_start + timedelta(hours=hours),
+                    "count": count,
+                    "percentage": count / self.dated_count,
+                    "exceeds_threshold": count / self.dated_count >= self.compiled.VELOCITY_THRESHOLD_PERCENTAGE,
+                    "indices": []
+                }
+
+            count = densest[window_hours][0]
+            percentage = count / self.dated_count
+            if percentage >= self.compiled.VELOCITY_THRESHOLD_PERCENTAGE:
+                windows = velocity["windows"]
+                velocity = self._result(
+                    "review_velocity", True, self.compiled.VELOCITY_PENALTY,
+                    f"{count} reviews ({utils.format_percentage(percentage)}) posted within {window_hours} hours",
+                    count
+                )
+                velocity["windows"] = windows
+        results["review_velocity"] = velocity
+
+        # 2. Generic praise (exact count)
+        count = self.counts["generic_praise"]
+        results["generic_praise"] = self._result(
+            "generic_praise", count > 0, self.compiled.GENERIC_PENALTY_PER_REVIEW * count,
+            f"{count} reviews ({utils.format_percentage(utils.safe_divide(count, total))}) are generic or too short"
+            if count else "", count
+        )
+
+        # 3. Suspicious reviewers (tracked authors; HyperLogLog denominator past the cap)
+        authors = list(self.author_stats)
+        same_rating, bursty = self._author_rules(authors)
+        is_suspicious = same_rating | bursty
+        suspicious_authors = int(np.count_nonzero(is_suspicious))
+        author_reviews = np.array([self.author_stats[author][0] for author in authors], dtype=np.int64)
+        author_count = (max(self.author_counter.estimate(), len(authors))
+                        if self.untracked_authors else len(authors))
+        suspicious_percentage = utils.safe_divide(suspicious_authors, author_count)
+        triggered = suspicious_authors > 0 and suspicious_percentage >= self.compiled.SUSPICIOUS_REVIEWER_THRESHOLD
+        rules = {
+            rule_name: {"authors": int(np.count_nonzero(rule_authors)),
+                        "review_count": int(author_reviews[rule_authors].sum())}
+            for rule_name, rule_authors in (("same_rating", same_rating), ("reviews_in_short_time", bursty))
+        }
+        results["suspicious_reviewers"] = self._result(
+            "suspicious_reviewers", triggered, self.compiled.SUSPICIOUS_REVIEWER_PENALTY,
+            _suspicious_reviewers_details(suspicious_authors, suspicious_percentage, rules, self.compiled)
+            if triggered else "",
+            int(author_reviews[is_suspicious].sum())
+        )
+        results["suspicious_reviewers"]["rules"] = rules
+
+        # 4. Linguistic anomalies (exact count)
+        count = self.counts["linguistic_anomalies"]
+        results["linguistic_anomalies"] = self._result(
+            "linguistic_anomalies", count > 0, self.compiled.LINGUISTIC_PENALTY_PER_REVIEW * count,
+            f"{count} reviews ({utils.format_percentage(utils.safe_divide(count, total))}) show linguistic anomalies"
+            if count else "", count
+        )
+
+        # 5. Sentiment imbalance (exact counters)
+        sentiment = self._result("sentiment_imbalance", False, 0, "")
+        if self.rated_count:
+            five_star_pct = self.five_star_count / self.rated_count
+            one_star_pct = self.one_star_count / self.rated_count
+            if five_star_pct >= self.compiled.FIVE_STAR_THRESHOLD:
+                sentiment = self._result(
+                    "sentiment_imbalance", True, self.compiled.SENTIMENT_IMBALANCE_PENALTY,
+                    f"Extreme 5-star dominance: {utils.format_percentage(five_star_pct)} of reviews are 5-star",
+                    self.five_star_count
+                )
+            elif (five_star_pct >= self.compiled.BIMODAL_THRESHOLD and
+                  one_star_pct >= self.compiled.BIMODAL_THRESHOLD and
+                  (five_star_pct + one_star_pct) > 0.80):
+                sentiment = self._result(
+                    "sentiment_imbalance", True, self.compiled.SENTIMENT_IMBALANCE_PENALTY,
+                    f"Bimodal distribution detected: {utils.format_percentage(five_star_pct)} 5-star, "
+                    f"{utils.format_percentage(one_star_pct)} 1-star",
+                    self.five_star_count
+                )
+        results["sentiment_imbalance"] = sentiment
+
+        # 6. Length extremes (exact count)
+        count = self.counts["review_length_extremes"]
+        results["review_length_extremes"] = self._result(
+            "review_length_extremes", count > 0, self.compiled.LENGTH_EXTREME_PENALTY_PER_REVIEW * count,
+            f"{count} reviews ({utils.format_percentage(utils.safe_divide(count, total))}) are extremely short or long"
+            if count else "", count
+        )
+
+        # 7. Verified ratio (exact counter)
+        verified_ratio = utils.safe_divide(self.verified_count, total)
+        if verified_ratio < self.compiled.VERIFIED_LOW_THRESHOLD:
+            results["verified_ratio"] = self._result(
+                "verified_ratio", True, self.compiled.VERIFIED_LOW_PENALTY,
+                f"Low verified purchase rate: only {utils.format_percentage(verified_ratio)} are verified",
+                total - self.verified_count
+            )
+        elif verified_ratio >= self.compiled.VERIFIED_HIGH_THRESHOLD:
+            results["verified_ratio"] = self._result(
+                "verified_ratio", True, self.compiled.VERIFIED_HIGH_BONUS,
+                f"High verified purchase rate: {utils.format_percentage(verified_ratio)} are verified (BONUS)"
+            )
+            results["verified_ratio"]["suspicious_indices"] = []
+        else:
+            results["verified_ratio"] = self._result("verified_ratio", False, 0, "")
+
+        # 8. Repetitive phrasing (exact counts, or upper bounds from the sketch)
+        repetitive = self._result("repetitive_phrases", False, 0, "")
+        phrase_counts = self._phrase_counts()
+        if phrase_counts:
+            # Most frequent repeated phrase; ties go to the one seen first
+            top = min(phrase_counts,
+                      key=lambda ngram_hash: (-phrase_counts[ngram_hash], self.ngram_first_seen[ngram_hash]))
+            approximately = "~" if self.repetitive_mode == "approximate" else ""
+            repetitive = self._result(
+                "repetitive_phrases", True, self.compiled.REPETITIVE_PHRASE_PENALTY,
+                f"Repetitive phrases detected: '{self.repeated_phrases[top]}' appears in "
+                f"{approximately}{phrase_counts[top]} reviews",
+                self.samples["repetitive_phrases"].seen
+            )
+        results["repetitive_phrases"] = repetitive
+
+        # 9. Near duplicates (cluster sizes from the leader union-find)
+        cluster_sizes = sorted(
+            (size for size in self.cluster_sizes.values() if size >= self.compiled.NEAR_DUPLICATE_MIN_CLUSTER_SIZE),
+            reverse=True
+        )
+        near_duplicates = self._result("near_duplicates", False, 0, "")
+        near_duplicates["clusters"] = []
+        if cluster_sizes:
+            count = sum(cluster_sizes)
+            near_duplicates = self._result(
+                "near_duplicates", True, self.compiled.NEAR_DUPLICATE_PENALTY,
+                f"{len(cluster_sizes)} near-duplicate cluster(s) covering {count} reviews "
+                f"({utils.format_percentage(count / total)}), largest has {cluster_sizes[0]}",
+                count
+            )
+            near_duplicates["clusters"] = [{"size": size, "indices": []} for size in cluster_sizes]
+        results["near_duplicates"] = near_duplicates
+
+        return results
+
+    def memory_state(self) -> Dict[str, int]:
+        """
+        Sizes of the retained structures (entries, not bytes, except the sketch), for monitoring the budget.
+        """
+        state = {
+            "time_buckets": len(self.time_buckets),
+            "time_bucket_seconds": self.bucket_seconds,
+            "tracked_authors": len(self.author_stats),
+            "author_days": sum(len(stats[2]) for stats in self.author_stats.values()),
+            "lsh_leaders": len(self.leader_signatures),
+            "sampled_reviews": sum(len(sample) for sample in self.samples.values())
+        }
+        if self.repetitive_mode == "exact":
+            state["ngram_table"] = len(self.ngram_counts)
+        else:
+            state["phrase_sketch_bytes"] = self.phrase_sketch.table.nbytes
+            state["heavy_hitters"] = len(self.heavy_hitters)
+        return state
+
+
+def analyze_stream(reviews: Iterable[Dict], chunk_size: int = None, compiled: CompiledConfig = None) -> Dict:
+    """
+    Streaming counterpart of analyze_data: consumes an iterator of reviews with
+    bounded memory and returns a report in the analyze_data format (see
+    StreamingAnalyzer for what is exact and what is sampled or estimated).
+
+    Args:
+        reviews (Iterable[Dict]): Review iterator (generator, API pages, file rows)
+        chunk_size (int, optional): Reviews processed per chunk. Defaults to config value.
+        compiled (CompiledConfig, optional): Configuration snapshot (default: current config)
+
+    Returns:
+        Dict: Analysis report, plus "streaming": retained state sizes
+    """
+    events.info("analysis.started", "\n🔍 Running streaming analysis...", mode="streaming")
+
+    analyzer = StreamingAnalyzer(chunk_size, compiled=compiled).consume(reviews)
+
+    analysis_report = {
+        "total_reviews": analyzer.total,
+        "red_flags": {},
+        "total_score_impact": 0,
+        "triggered_flags": [],
+        "streaming": analyzer.memory_state()
+    }
+
+    for flag_name, result in analyzer.red_flags().items():
+        events.info("analysis.check", f"  ⚡ Checking: {flag_name.replace('_', ' ').title()}", flag=flag_name)
+        analysis_report["red_flags"][flag_name] = result
+
+        # Track impact and triggered flags
+        if result["triggered"]:
+            analysis_report["total_score_impact"] += result["score_impact"]
+            if result["score_impact"] < 0:  # Penalty
+                analysis_report["triggered_flags"].append(flag_name)
+            events.info("analysis.check_triggered",
+                        f"     ⚠️  {result['details']} (Impact: {result['score_impact']:+.1f})",
+                        flag=flag_name, score_impact=result["score_impact"], details=result["details"])
+        else:
+            events.info("analysis.check_passed", "     ✓ No issues detected", flag=flag_name)
+
+    events.info("analysis.complete",
+                f"\n📊 Analysis of {analyzer.total} streamed reviews complete. "
+                f"Total score impact: {analysis_report['total_score_impact']:+.1f}",
+                reviews=analyzer.total, total_score_impact=analysis_report["total_score_impact"])
+    events.info("analysis.complete", f"🚩 Flags triggered: {len(analysis_report['triggered_flags'])}",
+                triggered_flags=analysis_report["triggered_flags"])
+
+    return analysis_report
+
+
+def compare_repetitive_modes(reviews: List[Dict], width: int, depth: int, capacity: int) -> Dict:
+    """
+    Benchmarks approximate repeated-phrase detection against exact counting on the same reviews.
+
+    Args:
+        reviews (List[Dict]): Reviews to stream through both modes
+        width (int): Count-min sketch counters per row
+        depth (int): Count-min sketch rows
+        capacity (int): Heavy-hitter list size
+
+    Returns:
+        Dict: recall and precision of the repeated-phrase set, the largest count
+        overestimate, memory of both modes (bytes, approximate for the exact table)
+        and whether the reported top phrase agrees
+    """
+    exact = StreamingAnalyzer(repetitive_mode="exact")
+    for start in range(0, len(reviews), exact.chunk_size):
+        chunk = ReviewBatch(reviews[start:start + exact.chunk_size])
+        exact.total += len(chunk)
+        exact._add_ngrams(chunk, get_text_features(chunk))
+
+    approximate = StreamingAnalyzer(repetitive_mode="approximate")
+    approximate.phrase_sketch = CountMinSketch(width, depth)
+    approximate.heavy_hitters = SpaceSaving(capacity)
+    for start in range(0, len(reviews), approximate.chunk_size):
+        chunk = ReviewBatch(reviews[start:start + approximate.chunk_size])
+        approximate.total += len(chunk)
+        approximate._add_ngrams(chunk, get_text_features(chunk))
+
+    exact_counts = exact._phrase_counts()
+    approximate_counts = approximate._phrase_counts()
+    found = set(exact_counts) & set(approximate_counts)
+
+    def top_phrase(analyzer, counts):
+        if not counts:
+            return None
+        top = min(counts, key=lambda ngram_hash: (-counts[ngram_hash], analyzer.ngram_first_seen[ngram_hash]))
+        return analyzer.repeated_phrases[top]
+
+    return {
+        "repeated_phrases": len(exact_counts),
+        "recall": utils.safe_divide(len(found), len(exact_counts)) if exact_counts else 1.0,
+        "precision": utils.safe_divide(len(found), len(approximate_counts)) if approximate_counts else 1.0,
+        "max_overcount": max((approximate_counts[h] - exact_counts[h] for h in found), default=0),
+        "same_top_phrase": top_phrase(exact, exact_counts) == top_phrase(approximate, approximate_counts),
+        # A Python dict entry (int key, int value) costs roughly 100 bytes
+        "exact_bytes": len(exact.ngram_counts) * 100,
+        "approximate_bytes": approximate.phrase_sketch.table.nbytes + len(approximate.heavy_hitters) * 24
+    }
+
+
+# Example usage
+if __name__ == "__main__":
+    import io
+    import random
+    import contextlib
+    from datetime import datetime
+    from src.analyzer import analyze_data
+
+    words = ("great product amazing love it works well battery life the and is this was very good bad broke "
+             "returned refund cheap quality excellent highly recommend would buy again size fits color").split()
+
+    def generate_reviews(count: int, seed: int):
+        """Yields synthetic reviews one at a time, like a paginated source."""
+        rng = random.Random(seed)
+        templates = [" ".join(rng.choice(words) for _ in range(12)) for _ in range(3)]
+        for _ in range(count):
+            text = (rng.choice(templates) if rng.random() < 0.2 else
+                    " ".join(rng.choice(words) for _ in range(rng.randint(0, 40))))
+            yield {
+                "rating": rng.choice([1.0, 3.0, 4.0, 5.0, 5.0, None]),
+                "title": rng.choice(words),
+                "review_text": text,
+                "review_length": len(text),
+                "date": datetime(2024, 1, 1) + timedelta(hours=rng.randint(0, rng.choice([48, 2000]))),
+                "author": f"user{rng.randint(0, 300)}",
+                "verified_purchase": rng.random() < 0.6,
+                "has_images": rng.random() < 0.1
+            }
+
+    # Cross-check: verdicts and exact counts must match the batch pipeline
+    with contextlib.redirect_stdout(io.StringIO()):
+        expected = analyze_data(list(generate_reviews(3000, seed=11)))
+        streamed = analyze_data(generate_reviews(3000, seed=11))
+
+    for flag_name, result in expected["red_flags"].items():
+        streamed_result = streamed["red_flags"][flag_name]
+        assert streamed_result["triggered"] == result["triggered"], flag_name
+        assert streamed_result["score_impact"] == result["score_impact"], flag_name
+        if flag_name in ("generic_praise", "linguistic_anomalies", "review_length_extremes") and result["triggered"]:
+            assert streamed_result["suspicious_count"] == len(result["suspicious_indices"]), flag_name
+            assert len(streamed_result["suspicious_indices"]) <= config.STREAMING_SAMPLE_SIZE, flag_name
+            assert set(streamed_result["suspicious_indices"]) <= set(result["suspicious_indices"]), flag_name
+
+    print(f"✓ Streaming verdicts match the batch pipeline ({streamed['total_reviews']} reviews)")
+    print(f"  Retained state: {streamed['streaming']}")
+
+    # Bounded state: small caps hold whatever the stream length
+    capped = compile_config({"STREAMING_MAX_TIME_BUCKETS": 256, "STREAMING_MAX_AUTHOR_DAYS": 8})
+    bounded = StreamingAnalyzer(chunk_size=500, compiled=capped).consume(generate_reviews(20000, seed=5))
+    state = bounded.memory_state()
+    assert state["time_buckets"] <= 256, state
+    assert state["author_days"] <= 8 * state["tracked_authors"], state
+    print(f"✓ Streaming state stays within its caps ({bounded.total} reviews: {state['time_buckets']} buckets "
+          f"of {state['time_bucket_seconds']}s, {state['author_days']} author days)")
+
+    # Benchmark: approximate repeated-phrase detection vs exact counting
+    if "--benchmark" in sys.argv:
+        import time
+
+        words += [f"word{i}" for i in range(2000)]
+        reviews = list(generate_reviews(50000, seed=3))
+        print(f"\nRepeated-phrase detection on {len(reviews)} reviews (exact vs sketch):")
+        for width, depth, capacity in ((1 << 12, 4, 2000), (1 << 16, 4, 5000),
+                                       (1 << 19, 4, 20000), (1 << 19, 4, 500)):
+            started = time.perf_counter()
+            comparison = compare_repetitive_modes(reviews, width, depth, capacity)
+            print(f"  width=2^{width.bit_length() - 1} depth={depth} heavy hitters={capacity}: "
+                  f"{comparison['repeated_phrases']} repeated phrases, recall {comparison['recall']:.3f}, precision {comparison['precision']:.3f}, "
+                  f"max overcount {comparison['max_overcount']}, same top phrase {comparison['same_top_phrase']}, "
+                  f"{comparison['approximate_bytes'] / 1e6:.1f} MB vs {comparison['exact_bytes'] / 1e6:.1f} MB exact "
+                  f"({time.perf_counter() - started:.1f}s)")
@@ -0,0 +1,315 @@
+"""
+Project Veritas - Synthetic Review Corpus
+Seeded generator of realistic review lists in the scraper's schema, with
+injected fraud campaigns, for benchmarks and calibration experiments
+"""
+
+import sys
+import os
+from datetime import datetime, timedelta
+from typing import List, Dict
+import numpy as np
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config
+from src.review import Review
+
+
+# Star rating distribution of genuine reviews (J-shaped, as on most product pages)
+GENUINE_RATING_WEIGHTS = {1.0: 0.11, 2.0: 0.06, 3.0: 0.09, 4.0: 0.19, 5.0: 0.55}
+
+# Everyday review vocabulary; the rest of the vocabulary is synthetic filler words
+REVIEW_WORDS = (
+    "the a and i it is this to was for of my with but on in not very so that have had just one "
+    "use used using works worked working product item quality price size fit color battery charge "
+    "sound screen case cable box package shipping arrived delivery day days week weeks month months "
+    "time times after before still again would could should really pretty quite good great nice fine "
+    "ok okay bad better best easy hard small large light heavy soft strong cheap expensive value "
+    "recommend buy bought return returned order ordered seller amazon description picture expected "
+    "expect happy satisfied disappointed problem issue issues first second last long short little "
+    "much more less than too also well feel feels looks look made design material plastic metal "
+    "set setup instructions install installed app phone kids wife husband home work car travel"
+).split()
+
+# Words sprinkled into low-rated genuine reviews (besides the configured negative keywords)
+NEGATIVE_WORDS = ("stopped", "failed", "flimsy", "leaks", "useless", "worse", "annoying", "unreliable")
+
+FIRST_NAMES = (
+    "James", "Mary", "John", "Patricia", "Robert", "Jennifer", "Michael", "Linda", "David", "Elizabeth",
+    "William", "Barbara", "Richard", "Susan", "Joseph", "Jessica", "Thomas", "Sarah", "Chris", "Karen",
+    "Daniel", "Lisa", "Matthew", "Nancy", "Anthony", "Betty", "Mark", "Sandra", "Steven", "Ashley",
+    "Paul", "Emily", "Andrew", "Donna", "Joshua", "Michelle", "Kevin", "Carol", "Brian", "Amanda"
+)
+LAST_INITIALS = tuple("ABCDEFGHIJKLMNOPRSTVWY")
+
+# Share of genuine reviews with a missing date / an "Anonymous" author
+MISSING_DATE_RATE = 0.02
+ANONYMOUS_RATE = 0.02
+
+
+def _vocabulary(rng: np.random.Generator, size: int) -> np.ndarray:
+    """
+    Review words followed by pronounceable filler words, in Zipf rank order.
+    """
+    consonants = list("bcdfghklmnprstvz")
+    vowels = list("aeiou")
+    words = list(dict.fromkeys(REVIEW_WORDS))
+    seen = set(words)
+    while len(words) < size:
+        syllables = rng.integers(2, 4)
+        word = "".join(rng.choice(consonants) + rng.choice(vowels) for _ in range(syllables))
+        if word not in seen:
+            seen.add(word)
+            words.append(word)
+    return np.array(words, dtype=object)
+
+
+def _author_name(index: int) -> str:
+    """
+    Deterministic display name for author number ``index`` ("Mary K.", "Mary K. 2", ...).
+    """
+    first = FIRST_NAMES[index % len(FIRST_NAMES)]
+    initial = LAST_INITIALS[(index // len(FIRST_NAMES)) % len(LAST_INITIALS)]
+    suffix = index // (len(FIRST_NAMES) * len(LAST_INITIALS))
+    return f"{first} {initial}." if suffix == 0 else f"{first} {initial}. {suffix + 1}"
+
+
+def _date_raw(date: datetime) -> str:
+    """
+    Amazon's date line for a review date.
+    """
+    return f"Reviewed in the United States on {date.strftime('%B')} {date.day}, {date.year}"
+
+
+def _review(rating: float, title: str, text: str, date: datetime, author: str,
+            verified_purchase: bool, has_images: bool) -> Review:
+    """
+    Builds one review exactly as AmazonReviewScraper._parse_review_element does.
+    """
+    return Review(
+        rating=rating,
+        title=title,
+        review_text=text,
+        date=date,
+        date_raw=_date_raw(date) if date is not None else "",
+        author=author,
+        verified_purchase=verified_purchase,
+        has_images=has_images,
+        review_length=len(title + " " + text)
+    )
+
+
+def _campaign_sizes(rng: np.random.Generator, fraud_reviews: int, campaigns: int) -> np.ndarray:
+    """
+    Splits the fraudulent reviews into campaigns of uneven size.
+    """
+    if fraud_reviews == 0 or campaigns == 0:
+        return np.zeros(0, dtype=np.int64)
+    campaigns = min(campaigns, fraud_reviews)
+    shares = rng.dirichlet(np.full(campaigns, 2.0))
+    sizes = np.floor(shares * fraud_reviews).astype(np.int64)
+    sizes[:fraud_reviews - int(sizes.sum())] += 1
+    return sizes[sizes > 0]
+
+
+def generate_corpus(n: int, seed: int = 0, fraud_share: float = 0.08, campaigns: int = None,
+                    start: datetime = datetime(2023, 1, 1), days: int = 730,
+                    vocabulary_size: int = 5000) -> Dict:
+    """
+    Generates a reproducible review corpus with labeled fraud campaigns.
+
+    Genuine reviews follow GENUINE_RATING_WEIGHTS, are spread over ``days``
+    (denser towards the end, as sales pick up), come from a large author pool
+    where a few regulars review repeatedly, and have log-normal lengths with
+    wording that matches the rating (praise, or configured negative keywords).
+    A few are missing dates or are "Anonymous", like scraped pages.
+
+    Each fraud campaign posts its reviews within a burst of 6-72 hours, from
+    a small ring of accounts that always give the same rating (mostly 5
+    stars, sometimes a 1-star attack), mostly unverified and without images,
+    using a handful of generic-praise templates with small edits. This is
+    what the velocity, generic praise, suspicious reviewer, verified ratio,
+    repetitive phrase and near-duplicate checks look for.
+
+    The same arguments always give the same corpus.
+
+    Args:
+        n (int): Number of reviews
+        seed (int): Random seed (default: 0)
+        fraud_share (float): Share of reviews belonging to fraud campaigns (default: 0.08)
+        campaigns (int, optional): Number of campaigns (default: grows with the square root
+            of the fraudulent review count)
+        start (datetime): First possible review date (default: 2023-01-01)
+        days (int): Length of the review period in days (default: 730)
+        vocabulary_size (int): Distinct words used by genuine reviews (default: 5000)
+
+    Returns:
+        Dict: {
+            "reviews": List[Review],     # scraper schema, in random order
+            "fraudulent": np.ndarray,    # bool per review
+            "campaign": np.ndarray,      # campaign number per review (-1 for genuine)
+            "campaigns": List[Dict]      # {"size", "start", "hours", "rating", "authors"} per campaign
+        }
+    """
+    rng = np.random.default_rng(seed)
+    vocabulary = _vocabulary(rng, vocabulary_size)
+    # Zipf-Mandelbrot word frequencies: a long tail, without one word dominating the text
+    word_weights = 1.0 / (np.arange(len(vocabulary)) + 20.0) ** 1.1
+    word_weights /= word_weights.sum()
+    generic_phrases = list(config.GENERIC_PHRASES)
+    negative_words = list(config.QUALITY_NEGATIVE_KEYWORDS) + list(NEGATIVE_WORDS)
+    span_seconds = days * 86400
+
+    fraud_reviews = int(round(n * fraud_share))
+    if campaigns is None:
+        campaigns = max(1, int(round(np.sqrt(fraud_reviews) / 4))) if fraud_reviews else 0
+    sizes = _campaign_sizes(rng, fraud_reviews, campaigns)
+    genuine_count = n - int(sizes.sum())
+
+    reviews = []
+    campaign_of = []
+
+    # ------------------------------------------------------------------
+    # Genuine reviews (all random draws vectorized up front)
+    # ------------------------------------------------------------------
+    ratings = rng.choice(list(GENUINE_RATING_WEIGHTS), size=genuine_count,
+                         p=list(GENUINE_RATING_WEIGHTS.values()))
+    offsets = (rng.beta(2.0, 1.3, size=genuine_count) * span_seconds).astype(np.int64)
+    missing_dates = rng.random(genuine_count) < MISSING_DATE_RATE
+    word_counts = np.clip(rng.lognormal(3.2, 0.9, size=genuine_count), 2, 600).astype(np.int64)
+    title_counts = rng.integers(1, 7, size=genuine_count)
+    verified = rng.random(genuine_count) < 0.88
+    images = rng.random(genuine_count) < 0.12
+    anonymous = rng.random(genuine_count) < ANONYMOUS_RATE
+    sentiment_draws = rng.random(genuine_count)
+    shouting = rng.random(genuine_count) < 0.01
+
+    # Most reviewers post once; a small pool of regulars posts again and again
+    regulars = max(1, genuine_count // 50)
+    is_regular = rng.random(genuine_count) < 0.15
+    author_numbers = np.where(
+        is_regular,
+        np.minimum(rng.zipf(1.6, size=genuine_count), regulars) - 1,
+        regulars + rng.integers(0, max(1, genuine_count), size=genuine_count)
+    )
+
+    body_words = vocabulary[rng.choice(len(vocabulary), size=int(word_counts.sum()), p=word_weights)]
+    title_words = vocabulary[rng.choice(len(vocabulary), size=int(title_counts.sum()), p=word_weights)]
+    body_ends = np.cumsum(word_counts)
+    title_ends = np.cumsum(title_counts)
+
+    sentiment_picks = rng.integers(0, 1 << 30, size=genuine_count)
+    for i in range(genuine_count):
+        rating = float(ratings[i])
+        text = " ".join(body_words[body_ends[i] - word_counts[i]:body_ends[i]])
+        title = " ".join(title_words[title_ends[i] - title_counts[i]:title_ends[i]]).capitalize()
+
+        # Wording follows the rating
+        if rating >= 4 and sentiment_draws[i] < 0.35:
+            text = f"{text} {generic_phrases[sentiment_picks[i] % len(generic_phrases)]}"
+        elif rating <= 2 and sentiment_draws[i] < 0.7:
+            text = f"{negative_words[sentiment_picks[i] % len(negative_words)]} {text}"
+        text = text[0].upper() + text[1:] + "."
+        if shouting[i]:
+            text = text.upper() + "!!!!"
+
+        date = None if missing_dates[i] else start + timedelta(seconds=int(offsets[i]))
+        author = "Anonymous" if anonymous[i] else _author_name(int(author_numbers[i]))
+        reviews.append(_review(rating, title, text, date, author, bool(verified[i]), bool(images[i])))
+        campaign_of.append(-1)
+
+    # ------------------------------------------------------------------
+    # Fraud campaigns
+    # ------------------------------------------------------------------
+    campaign_details = []
+    ring_base = regulars + genuine_count + 1
+    for number, size in enumerate(sizes.tolist()):
+        hours = float(rng.uniform(6, 72))
+        burst_start = start + timedelta(seconds=int(rng.integers(0, max(1, span_seconds - int(hours * 3600)))))
+        rating = 1.0 if rng.random() < 0.15 else 5.0
+        ring_size = max(3, size // int(rng.integers(3, 8)))
+        ring = [_author_name(ring_base + k) for k in range(ring_size)]
+        ring_base += ring_size
+
+        phrases = (negative_words if rating == 1.0 else generic_phrases)
+        templates = []
+        for _ in range(int(rng.integers(2, 5))):
+            filler = vocabulary[rng.choice(len(vocabulary), size=int(rng.integers(8, 25)), p=word_weights)]
+            words = list(filler) + [phrases[k] for k in rng.choice(len(phrases), size=3, replace=False)]
+            rng.shuffle(words)
+            templates.append(words)
+
+        titles = [phrase.capitalize() + "!" for phrase in phrases[:6]]
+        seconds = rng.integers(0, int(hours * 3600), size=size)
+        for k in range(size):
+            words = list(templates[int(rng.integers(0, len(templates)))])
+            if rng.random() < 0.5:  # Small edit so the copies are near, not exact, duplicates
+                words[int(rng.integers(0, len(words)))] = vocabulary[int(rng.integers(0, 200))]
+            text = " ".join(words).capitalize() + ("!" if rng.random() < 0.5 else ".")
+            reviews.append(_review(
+                rating,
+                titles[int(rng.integers(0, len(titles)))],
+                text,
+                burst_start + timedelta(seconds=int(seconds[k])),
+                ring[int(rng.integers(0, ring_size))],
+                bool(rng.random() < 0.25),
+                bool(rng.random() < 0.01)
+            ))
+            campaign_of.append(number)
+
+        campaign_details.append({"size": size, "start": burst_start, "hours": hours, "rating": rating,
+                                 "authors": ring_size})
+
+    order = rng.permutation(len(reviews))
+    campaign = np.asarray(campaign_of, dtype=np.int64)[order]
+    return {
+        "reviews": [reviews[i] for i in order.tolist()],
+        "fraudulent": campaign >= 0,
+        "campaign": campaign,
+        "campaigns": campaign_details
+    }
+
+
+def generate_reviews(n: int, seed: int = 0, fraud_share: float = 0.08, **kwargs) -> List[Review]:
+    """
+    Generates a reproducible list of review dicts (see generate_corpus for the options).
+
+    Args:
+        n (int): Number of reviews
+        seed (int): Random seed (default: 0)
+        fraud_share (float): Share of reviews belonging to fraud campaigns (default: 0.08)
+
+    Returns:
+        List[Review]: Reviews in the scraper's schema
+    """
+    return generate_corpus(n, seed=seed, fraud_share=fraud_share, **kwargs)["reviews"]
+
+
+# Example usage
+if __name__ == "__main__":
+    import time
+    from src.analyzer import analyze_data
+
+    start_time = time.perf_counter()
+    corpus = generate_corpus(20000, seed=7)
+    elapsed = time.perf_counter() - start_time
+    reviews = corpus["reviews"]
+
+    assert len(reviews) == 20000
+    assert generate_reviews(500, seed=3) == generate_reviews(500, seed=3)
+    assert generate_reviews(500, seed=3) != generate_reviews(500, seed=4)
+    assert set(reviews[0]) == {"rating", "title", "review_text", "date", "date_raw", "author",
+                               "verified_purchase", "has_images", "review_length"}
+    assert int(corpus["fraudulent"].sum()) == sum(campaign["size"] for campaign in corpus["campaigns"])
+
+    genuine = analyze_data(generate_reviews(5000, seed=1, fraud_share=0.0))["triggered_flags"]
+    attacked = analyze_data(generate_reviews(5000, seed=1, fraud_share=0.3, campaigns=1))["triggered_flags"]
+    for flag_name in ("review_velocity", "suspicious_reviewers", "repetitive_phrases", "near_duplicates"):
+        assert flag_name in attacked and flag_name not in genuine, flag_name
+
+    print(f"✓ Generated {len(reviews)} reviews ({len(corpus['campaigns'])} fraud campaigns, "
+          f"{int(corpus['fraudulent'].sum())} fraudulent) in {elapsed:.2f}s")
+    print(f"   Genuine corpus triggers:  {genuine}")
+    print(f"   One 30% campaign adds:    {[flag for flag in attacked if flag not in genuine]}")
@@ -0,0 +1,281 @@
+"""
+Project Veritas - Text Feature Extraction
+Tokenizes every review once and derives all per-review text features used by the
+generic praise, linguistic anomaly, repetitive phrasing and quality keyword checks
+"""
+
+import sys
+import os
+import hashlib
+from array import array
+from collections import Counter
+from typing import List, Dict, Tuple, Iterable
+import numpy as np
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.compiled_config import CompiledConfig, compile_config
+
+
+def token_hashes(vocabulary: List[str]) -> np.ndarray:
+    """
+    Hashes tokens to 64-bit keys that depend only on the token text.
+
+    Token IDs are assigned per batch, so two shards of the same review set give
+    the same word different IDs; these keys are identical everywhere, which is
+    what lets n-gram counts and MinHash signatures be merged across shards.
+
+    Args:
+        vocabulary (List[str]): Tokens to hash
+
+    Returns:
+        np.ndarray: uint64 key per token
+    """
+    return np.array(
+        [int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest(), "little")
+         for token in vocabulary],
+        dtype=np.uint64
+    )
+
+
+def tokenize(reviews: List[Dict]) -> Tuple[List[str], np.ndarray, np.ndarray]:
+    """
+    Tokenizes reviews exactly like TextFeatures, without computing any features.
+
+    Args:
+        reviews (List[Dict]): Review dictionaries
+
+    Returns:
+        Tuple[List[str], np.ndarray, np.ndarray]: (vocabulary, token_ids, token_offsets)
+    """
+    vocabulary_index = {}
+    token_ids = array("i")
+    token_offsets = [0]
+
+    for review in reviews:
+        tokens = (review.get("review_text", "") or "").lower().split() + (review.get("title", "") or "").lower().split()
+        token_ids.extend([vocabulary_index.setdefault(token, len(vocabulary_index)) for token in tokens])
+        token_offsets.append(len(token_ids))
+
+    return (
+        list(vocabulary_index),
+        np.frombuffer(token_ids, dtype=np.int32) if len(token_ids) else np.zeros(0, dtype=np.int32),
+        np.array(token_offsets, dtype=np.int64)
+    )
+
+
+class TextFeatures:
+    """
+    Per-review text features, aligned with the reviews of a ReviewBatch.
+
+    Tokens are the lowercase whitespace-split words of the review body followed
+    by the title (the order the repetitive phrasing check reads them in). They
+    are stored as integer IDs into ``vocabulary``, flattened into ``token_ids``
+    with review i owning ``token_ids[token_offsets[i]:token_offsets[i + 1]]``.
+
+    Numeric features (NumPy arrays, one entry per review):
+        word_count              words in title + body
+        text_length             characters in title + body (stripped)
+        body_word_count         words in the review body
+        body_length             characters in the review body
+        caps_ratio              share of uppercase characters in the body
+        punctuation_runs        runs of 4+ '!'/'?' in the body
+        max_word_frequency      highest count of any non-common word (>3 letters) in the body
+        generic_phrase_hits     distinct GENERIC_PHRASES found in title + body
+        negative_keyword_hits   distinct QUALITY_NEGATIVE_KEYWORDS found in body + title
+
+    Phrase hits come from the Aho-Corasick matchers of the compiled config
+    (src/compiled_config.py), so each text is scanned once for the whole phrase list.
+
+    ``token_keys()`` gives the tokens as batch-independent 64-bit hashes, which
+    the n-gram and MinHash code hashes instead of the batch-local IDs.
+    """
+
+    def __init__(self, reviews: List[Dict], compiled: CompiledConfig = None):
+        compiled = compiled or compile_config()
+        self.phrase_key = compiled.phrase_key
+        generic_matcher = compiled.generic_matcher
+        negative_matcher = compiled.negative_matcher
+        common_words = compiled.common_words
+        punctuation_run_pattern = compiled.punctuation_run_pattern
+
+        vocabulary_index = {}
+        token_ids = array("i")
+        token_offsets = [0]
+
+        word_count = []
+        text_length = []
+        body_word_count = []
+        body_length = []
+        caps_ratio = []
+        punctuation_runs = []
+        max_word_frequency = []
+        generic_phrase_hits = []
+        negative_keyword_hits = []
+
+        for review in reviews:
+            body = review.get("review_text", "") or ""
+            title = review.get("title", "") or ""
+            body_lower = body.lower()
+            title_lower = title.lower()
+
+            body_tokens = body_lower.split()
+            title_tokens = title_lower.split()
+
+            token_ids.extend([vocabulary_index.setdefault(token, len(vocabulary_index)) for token in body_tokens])
+            token_ids.extend([vocabulary_index.setdefault(token, len(vocabulary_index)) for token in title_tokens])
+            token_offsets.append(len(token_ids))
+
+            generic_text = title_lower + " " + body_lower
+            word_count.append(len(body_tokens) + len(title_tokens))
+            text_length.append(len(generic_text.strip()))
+
+            body_word_count.append(len(body_tokens))
+            body_length.append(len(body))
+            caps_ratio.append(sum(map(str.isupper, body)) / max(len(body), 1))
+            punctuation_runs.append(len(punctuation_run_pattern.findall(body)))
+
+            word_counts = Counter(body_tokens)
+            max_word_frequency.append(max(
+                (count for word, count in word_counts.items() if word not in common_words and len(word) > 3),
+                default=0
+            ))
+
+            generic_phrase_hits.append(generic_matcher.count_matches(generic_text))
+            negative_keyword_hits.append(negative_matcher.count_matches(body_lower + " " + title_lower))
+
+        self.vocabulary = list(vocabulary_index)
+        self._vocabulary_keys = None
+        self.token_ids = np.frombuffer(token_ids, dtype=np.int32) if len(token_ids) else np.zeros(0, dtype=np.int32)
+        self.token_offsets = np.array(token_offsets, dtype=np.int64)
+
+        self.word_count = np.array(word_count, dtype=np.int32)
+        self.text_length = np.array(text_length, dtype=np.int32)
+        self.body_word_count = np.array(body_word_count, dtype=np.int32)
+        self.body_length = np.array(body_length, dtype=np.int32)
+        self.caps_ratio = np.array(caps_ratio, dtype=np.float64)
+        self.punctuation_runs = np.array(punctuation_runs, dtype=np.int32)
+        self.max_word_frequency = np.array(max_word_frequency, dtype=np.int32)
+        self.generic_phrase_hits = np.array(generic_phrase_hits, dtype=np.int32)
+        self.negative_keyword_hits = np.array(negative_keyword_hits, dtype=np.int32)
+
+    def refresh_phrase_hits(self, reviews: List[Dict], compiled: CompiledConfig = None) -> None:
+        """
+        Recomputes only the phrase-hit features after the configured phrase lists changed.
+
+        Args:
+            reviews (List[Dict]): The reviews these features were built from
+            compiled (CompiledConfig, optional): Configuration snapshot (default: current config)
+        """
+        compiled = compiled or compile_config()
+        self.phrase_key = compiled.phrase_key
+        generic_matcher = compiled.generic_matcher
+        negative_matcher = compiled.negative_matcher
+
+        generic_phrase_hits = []
+        negative_keyword_hits = []
+        for review in reviews:
+            body_lower = (review.get("review_text", "") or "").lower()
+            title_lower = (review.get("title", "") or "").lower()
+            generic_phrase_hits.append(generic_matcher.count_matches(title_lower + " " + body_lower))
+            negative_keyword_hits.append(negative_matcher.count_matches(body_lower + " " + title_lower))
+
+        self.generic_phrase_hits = np.array(generic_phrase_hits, dtype=np.int32)
+        self.negative_keyword_hits = np.array(negative_keyword_hits, dtype=np.int32)
+
+    def token_keys(self) -> np.ndarray:
+        """
+        Returns the flat token array as batch-independent uint64 keys (see token_hashes).
+        """
+        if self._vocabulary_keys is None:
+            self._vocabulary_keys = token_hashes(self.vocabulary)
+        return self._vocabulary_keys[self.token_ids]
+
+    def review_token_ids(self, index: int) -> np.ndarray:
+        """
+        Returns the token IDs of one review (body tokens, then title tokens).
+        """
+        return self.token_ids[self.token_offsets[index]:self.token_offsets[index + 1]]
+
+    def tokens(self, index: int) -> List[str]:
+        """
+        Returns the lowercase tokens of one review (body tokens, then title tokens).
+        """
+        vocabulary = self.vocabulary
+        return [vocabulary[token_id] for token_id in self.review_token_ids(index).tolist()]
+
+    def subset(self, indices: np.ndarray) -> "TextFeatures":
+        """
+        Returns the features of the reviews at the given positions, without re-tokenizing.
+
+        Args:
+            indices (np.ndarray): Integer positions to keep
+
+        Returns:
+            TextFeatures: Features aligned with the selected reviews
+        """
+        indices = np.asarray(indices, dtype=np.int64)
+        selected = TextFeatures.__new__(TextFeatures)
+        selected.phrase_key = self.phrase_key
+        selected.vocabulary = self.vocabulary
+        selected._vocabulary_keys = self._vocabulary_keys
+
+        # Gather each selected review's token slice in one vectorized step
+        starts = self.token_offsets[indices]
+        lengths = self.token_offsets[indices + 1] - starts
+        selected.token_offsets = np.concatenate(([0], np.cumsum(lengths))).astype(np.int64)
+        positions = np.repeat(starts - selected.token_offsets[:-1], lengths) + np.arange(selected.token_offsets[-1])
+        selected.token_ids = self.token_ids[positions]
+
+        for name in ("word_count", "text_length", "body_word_count", "body_length", "caps_ratio",
+                     "punctuation_runs", "max_word_frequency", "generic_phrase_hits", "negative_keyword_hits"):
+            setattr(selected, name, getattr(self, name)[indices])
+
+        return selected
+
+
+def negative_keyword_hits(reviews: Iterable[Dict], compiled: CompiledConfig = None) -> np.ndarray:
+    """
+    Counts the distinct negative keywords of each review, like
+    TextFeatures.negative_keyword_hits, without tokenizing or extracting the
+    other features (for scoring a batch whose features were never needed).
+
+    Args:
+        reviews (Iterable[Dict]): Reviews to scan
+        compiled (CompiledConfig, optional): Configuration snapshot (default: current config)
+
+    Returns:
+        np.ndarray: int32 hit counts, one per review
+    """
+    compiled = compiled or compile_config()
+    negative_matcher = compiled.negative_matcher
+    return np.array([
+        negative_matcher.count_matches(
+            (review.get("review_text", "") or "").lower() + " " + (review.get("title", "") or "").lower()
+        )
+        for review in reviews
+    ], dtype=np.int32)
+
+
+def get_text_features(batch, compiled: CompiledConfig = None) -> TextFeatures:
+    """
+    Returns the text features for a ReviewBatch, extracting them on first use.
+    The features are cached on the batch so every check reads the same pass;
+    phrase hits are recomputed if the configured phrase lists have changed.
+
+    Args:
+        batch (ReviewBatch): Reviews to extract features from
+        compiled (CompiledConfig, optional): Configuration snapshot (default: current config)
+
+    Returns:
+        TextFeatures: Features aligned with batch.reviews
+    """
+    compiled = compiled or compile_config()
+    features = batch.text_features
+    if features is None:
+        features = TextFeatures(batch.reviews, compiled)
+        batch.text_features = features
+    elif features.phrase_key != compiled.phrase_key:
+        features.refresh_phrase_hits(batch.reviews, compiled)
+    return features
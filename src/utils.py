@@ -6,11 +6,17 @@ Helper functions for scraping, text processing, and general utilities
 import random
 import time
 import re
-from datetime import datetime
-from typing import List, Dict
+import hashlib
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Optional
 import config
 
 
+# Reference points for converting datetimes to epoch seconds
+_EPOCH_NAIVE = datetime(1970, 1, 1)
+_EPOCH_AWARE = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
 def get_random_user_agent() -> str:
     """
     Returns a random user agent string from the config to simulate different browsers.
@@ -41,6 +47,8 @@ def parse_amazon_date(date_string: str) -> datetime:
     """
     Parses various Amazon date formats into a datetime object.
     Amazon uses formats like "Reviewed in the United States on January 15, 2024"
+    (January 15, 2024 / Jan 15, 2024 / 2024-01-15 / 01/15/2024 only).
+    Results are memoized, see src/date_parsing.py.
 
     Args:
         date_string (str): The date string from Amazon review
@@ -48,28 +56,87 @@ def parse_amazon_date(date_string: str) -> datetime:
     Returns:
         datetime: Parsed datetime object, or None if parsing fails
     """
-    try:
-        # Extract the actual date part (after "on")
-        if " on " in date_string:
-            date_string = date_string.split(" on ")[-1]
-
-        # Try different date formats
-        date_formats = [
-            "%B %d, %Y",      # January 15, 2024
-            "%b %d, %Y",       # Jan 15, 2024
-            "%Y-%m-%d",        # 2024-01-15
-            "%m/%d/%Y",        # 01/15/2024
-        ]
-
-        for fmt in date_formats:
-            try:
-                return datetime.strptime(date_string.strip(), fmt)
-            except ValueError:
-                continue
+    from src.date_parsing import parse_review_date, AMAZON_DATE_FORMATS
+    return parse_review_date(date_string, fallback=False, formats=AMAZON_DATE_FORMATS)
 
+
+def to_epoch_seconds(date: datetime) -> Optional[int]:
+    """
+    Converts a datetime into integer seconds since the Unix epoch.
+    Naive datetimes (what the scrapers produce) are treated as UTC so the
+    result never depends on the local timezone or DST rules.
+
+    Args:
+        date (datetime): Datetime to convert
+
+    Returns:
+        Optional[int]: Whole seconds since 1970-01-01, or None if date is missing
+    """
+    if not date:
         return None
-    except Exception:
-        return None
+
+    epoch = _EPOCH_NAIVE if date.tzinfo is None else _EPOCH_AWARE
+    return (date - epoch) // timedelta(seconds=1)
+
+
+def from_epoch_seconds(seconds: int) -> datetime:
+    """
+    Converts epoch seconds back into a (naive, UTC) datetime.
+    Inverse of to_epoch_seconds for naive datetimes.
+
+    Args:
+        seconds (int): Whole seconds since 1970-01-01
+
+    Returns:
+        datetime: Naive datetime in UTC
+    """
+    return _EPOCH_NAIVE + timedelta(seconds=int(seconds))
+
+
+def stable_review_id(author: str, epoch_seconds: Optional[int], rating: float, text: str) -> int:
+    """
+    Computes a compact review ID from the fields that identify a review.
+    The same review scraped twice gets the same ID in every run and process;
+    identical texts by different authors (or on different dates) do not.
+
+    Args:
+        author (str): Reviewer name (None counts as empty)
+        epoch_seconds (Optional[int]): Review date as epoch seconds (None if missing)
+        rating (float): Star rating (0.0 if missing)
+        text (str): Review text (None counts as empty)
+
+    Returns:
+        int: Unsigned 64-bit ID
+    """
+    key = "\x1f".join((author or "", "" if epoch_seconds is None else str(epoch_seconds),
+                        repr(float(rating)), text or ""))
+    return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+# ASIN patterns in Amazon product URLs (used by the scrapers and the report cache key)
+ASIN_PATTERNS = [re.compile(pattern) for pattern in (
+    r'/dp/([A-Z0-9]{10})',
+    r'/product/([A-Z0-9]{10})',
+    r'/gp/product/([A-Z0-9]{10})',
+    r'[?&]asin=([A-Z0-9]{10})'
+)]
+
+
+def extract_asin(url: str) -> Optional[str]:
+    """
+    Extracts the product ASIN from an Amazon URL.
+
+    Args:
+        url (str): Amazon product URL, e.g. https://amazon.com/dp/B08N5WRWNW
+
+    Returns:
+        Optional[str]: ASIN, or None if the URL contains none
+    """
+    for pattern in ASIN_PATTERNS:
+        match = pattern.search(url)
+        if match:
+            return match.group(1)
+    return None
 
 
 def clean_text(text: str) -> str:
@@ -140,26 +207,31 @@ def is_verified_purchase(text: str) -> bool:
     return "verified purchase" in text.lower()
 
 
-def calculate_grade(score: float) -> str:
+# compile_config, imported by calculate_grade on first use (the scrapers import utils
+# without the analysis modules)
+_compile_config = None
+
+
+def calculate_grade(score: float, compiled=None) -> str:
     """
     Converts a numeric score (0-100) to a letter grade (A-F).
-    Uses the grading scale from config.py
+    Uses the grading scale from config.py, sorted once per compiled config
+    snapshot (see src/compiled_config.py) instead of on every call.
 
     Args:
         score (float): Numeric score (0-100)
+        compiled (CompiledConfig, optional): Configuration snapshot (default: current config)
 
     Returns:
         str: Letter grade (A, B, C, D, or F)
     """
-    # Ensure score is within bounds
-    score = max(0, min(100, score))
-
-    # Iterate through grade scale (sorted in descending order)
-    for threshold in sorted(config.GRADE_SCALE.keys(), reverse=True):
-        if score >= threshold:
-            return config.GRADE_SCALE[threshold]
-
-    return "F"  # Fallback
+    global _compile_config
+    if compiled is None:
+        if _compile_config is None:
+            from src.compiled_config import compile_config
+            _compile_config = compile_config
+        compiled = _compile_config()
+    return compiled.grade(score)
 
 
 def get_ngrams(text: str, n: int = 4) -> List[str]: